@@ -0,0 +1,163 @@
+import os
+import json
+import random
+import zipfile
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+
+from src.constant_vars import OptionKeys, ModKeys, ModType, LIGHT
+
+MAIN_XML = '''<mod name="{name}">
+    <AssetUpdates id="{assetID}" version="{version}" provider="modworkshop"/>
+</mod>
+'''
+
+MOD_TXT = '''{{
+    "name" : "{name}",
+    "author" : "benchmark",
+    "version" : "{version}",
+    "hooks" : []
+}}
+'''
+
+@dataclass
+class TreeSpec():
+    '''What a generated game folder looks like'''
+
+    mods: int = 100
+    xmlRatio: float = 0.5 # Mods with a main.xml
+    txtRatio: float = 0.3 # Mods with a mod.txt, the rest have neither
+    disabledRatio: float = 0.1 # Mods in the disabled mods folder
+    files: int = 3 # Extra files in each mod
+    fileSize: int = 1024 # Bytes
+    archives: int = 10 # Zipped mods made for installing
+    seed: int = 0
+
+@dataclass
+class GameTree():
+    '''Paths of a generated game folder and the files that point to it'''
+
+    root: str
+    gamePath: str
+    disabledPath: str
+    optionsPath: str
+    savePath: str
+    profilesPath: str
+    cachePath: str
+    mods: dict[str, ModType] = field(default_factory=dict)
+    disabled: set[str] = field(default_factory=set)
+    archives: list[str] = field(default_factory=list)
+
+def writeMod(path: str, name: str, spec: TreeSpec, rng: random.Random) -> None:
+    os.makedirs(path)
+
+    version: str = f'{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}'
+    roll: float = rng.random()
+
+    if roll < spec.xmlRatio:
+        with open(os.path.join(path, 'main.xml'), 'w') as f:
+            f.write(MAIN_XML.format(name=name, assetID=rng.randint(1000, 99999), version=version))
+
+    elif roll < spec.xmlRatio + spec.txtRatio:
+        with open(os.path.join(path, 'mod.txt'), 'w') as f:
+            f.write(MOD_TXT.format(name=name, version=version))
+
+    # Half of the files go in a subfolder so size scans and copies walk more than one level
+    for i in range(spec.files):
+        folder: str = path if i % 2 == 0 else os.path.join(path, 'assets')
+        os.makedirs(folder, exist_ok=True)
+
+        with open(os.path.join(folder, f'file{i}.bin'), 'wb') as f:
+            f.write(rng.randbytes(spec.fileSize))
+
+def generateGameTree(root: str, spec: TreeSpec) -> GameTree:
+    '''
+    Fills `root` with a fake PAYDAY 2 install that has `spec.mods` mods
+    and writes the options, mods and profiles files that point to it
+    '''
+
+    rng = random.Random(spec.seed)
+
+    gamePath: str = os.path.join(root, 'PAYDAY 2')
+    disabledPath: str = os.path.join(root, 'disabledMods')
+
+    tree = GameTree(
+        root=root,
+        gamePath=gamePath,
+        disabledPath=disabledPath,
+        optionsPath=os.path.join(root, 'config.ini'),
+        savePath=os.path.join(root, 'mods.json'),
+        profilesPath=os.path.join(root, 'profiles.json'),
+        cachePath=os.path.join(root, 'metadatacache.json')
+    )
+
+    typePaths: dict[ModType, str] = {
+        ModType.mods : os.path.join(gamePath, 'mods'),
+        ModType.mods_override : os.path.join(gamePath, 'assets', 'mod_overrides'),
+        ModType.maps : os.path.join(gamePath, 'Maps')
+    }
+
+    for path in (*typePaths.values(), disabledPath):
+        os.makedirs(path, exist_ok=True)
+
+    # Roughly the mix of a real install, mostly BLT mods
+    types: tuple[ModType, ...] = (ModType.mods,) * 6 + (ModType.mods_override,) * 3 + (ModType.maps,)
+
+    saveData: dict[str, dict] = {}
+
+    for i in range(spec.mods):
+        name: str = f'mod {i:05} {rng.choice(("weapon", "skin", "hud", "map", "fix", "menu"))}'
+        modType: ModType = types[i % len(types)]
+        enabled: bool = rng.random() >= spec.disabledRatio
+
+        writeMod(os.path.join(typePaths[modType] if enabled else disabledPath, name), name, spec, rng)
+
+        tree.mods[name] = modType
+        if not enabled:
+            tree.disabled.add(name)
+
+        saveData[name] = {
+            ModKeys.type.value : modType.value,
+            ModKeys.enabled.value : enabled,
+            ModKeys.ignored.value : False,
+            ModKeys.tags.value : rng.sample(('weapons', 'ui', 'qol', 'maps', 'cosmetic'), k=rng.randint(0, 2))
+        }
+
+    # Archives are installed as new mods, they aren't in the game folder yet
+    archivePath: str = os.path.join(root, 'archives')
+    os.makedirs(archivePath)
+
+    for i in range(spec.archives):
+        name: str = f'archived mod {i:05}'
+        source: str = os.path.join(archivePath, name)
+
+        writeMod(source, name, spec, rng)
+
+        archive: str = f'{source}.zip'
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for folder, _, files in os.walk(source):
+                for file in files:
+                    path: str = os.path.join(folder, file)
+                    zf.write(path, os.path.relpath(path, archivePath))
+
+        tree.archives.append(archive)
+
+    config = ConfigParser()
+    config.add_section(OptionKeys.section.value)
+    config.set(OptionKeys.section.value, OptionKeys.game_path.value, gamePath)
+    config.set(OptionKeys.section.value, OptionKeys.dispath.value, disabledPath)
+    config.set(OptionKeys.section.value, OptionKeys.color_theme.value, LIGHT)
+    config.set(OptionKeys.section.value, OptionKeys.mmm_update_alert.value, str(False))
+
+    with open(tree.optionsPath, 'w') as f:
+        config.write(f)
+
+    with open(tree.savePath, 'w') as f:
+        json.dump(saveData, f)
+
+    # A profile with about half of the mods, applying it moves roughly half of the install
+    names: list[str] = sorted(tree.mods)
+    with open(tree.profilesPath, 'w') as f:
+        json.dump({'benchmark' : rng.sample(names, k=len(names) // 2)}, f)
+
+    return tree
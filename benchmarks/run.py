@@ -0,0 +1,267 @@
+'''
+Times the hot paths of the manager on generated game folders
+
+Usage: `python -m benchmarks.run [--sizes 100 1000 10000] [--only refreshMods search] [--compare old.json]`
+
+Runs headless with the offscreen Qt platform, the results are written
+as JSON to `benchmarks/results/` so runs on different commits can be compared
+'''
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Any, Callable
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Logging from each mod would be timed too, missing cache files are expected on a new folder
+logging.disable(logging.ERROR)
+
+import PySide6
+import PySide6.QtWidgets as qtw
+
+from src.cli import CLI
+from src.widgets.managerQTableWidget import ModListWidget
+from src.threaded.backupMods import BackupMods
+from src.threaded.incrementalBackup import IncrementalBackup
+from src.threaded.unZipMod import UnZipMod
+from src.constant_vars import ModType, BACKUP_MODS, BACKUP_STORE
+
+from benchmarks.gameTree import TreeSpec, GameTree, generateGameTree
+
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+SEARCHES: tuple[str, ...] = ('mod 01', 'weapon', 'tag:ui hud', 'mod 0*skin', 'zzz not found')
+
+def measure(function: Callable[[], Any], repeat: int, setup: Callable[[], Any] | None = None) -> dict[str, float | int]:
+    '''Runs `function` `repeat` times, `setup` runs before each run and isn't timed'''
+
+    times: list[float] = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start: int = time.perf_counter_ns()
+        function()
+        times.append((time.perf_counter_ns() - start) / 1e6)
+
+    return {
+        'runs'   : len(times),
+        'min'    : round(min(times), 3),
+        'median' : round(statistics.median(times), 3),
+        'mean'   : round(statistics.fmean(times), 3),
+        'max'    : round(max(times), 3)
+    }
+
+class Benchmarks():
+    '''The benchmarks of one generated game folder, each is timed in milliseconds'''
+
+    def __init__(self, tree: GameTree, repeat: int) -> None:
+        self.tree = tree
+        self.repeat = repeat
+
+        self.table = ModListWidget(tree.savePath, tree.optionsPath, tree.cachePath)
+        self.cli = CLI(tree.optionsPath, tree.savePath, tree.profilesPath)
+
+    def close(self) -> None:
+        self.table.sizeScanner.wait()
+        self.table.watcher.watch({})
+        self.table.deleteLater()
+
+    def removeCache(self) -> None:
+        if os.path.exists(self.tree.cachePath):
+            os.remove(self.tree.cachePath)
+
+        self.table.metadataCache.file.clear()
+
+    def refreshMods(self) -> dict:
+        # Every main.xml and mod.txt is parsed
+        return measure(self.table.refreshMods, self.repeat, self.removeCache)
+
+    def refreshModsCached(self) -> dict:
+        self.table.refreshMods()
+        return measure(self.table.refreshMods, self.repeat)
+
+    def fillTable(self) -> None:
+        if self.table.rowCount() == 0:
+            self.table.refreshMods()
+
+    def search(self) -> dict:
+        self.fillTable()
+
+        def searchAll() -> None:
+            for query in SEARCHES:
+                self.table.search(query)
+            self.table.search('')
+
+        return measure(searchAll, self.repeat)
+
+    def sort(self) -> dict:
+        self.fillTable()
+
+        def sortAll() -> None:
+            for column in range(self.table.columnCount()):
+                self.table.sort(column)
+
+        return measure(sortAll, self.repeat)
+
+    # These change the game folder so they only run once
+
+    def applyMods(self) -> dict:
+        args = argparse.Namespace(profile='benchmark')
+        return measure(lambda: self.cli.applyProfile(args), 1)
+
+    def backupMods(self) -> dict:
+        worker = BackupMods(optionsPath=self.tree.optionsPath, savePath=self.tree.savePath)
+        worker.bundledFilePath = os.path.join(self.tree.root, BACKUP_MODS)
+
+        return measure(lambda: self.cli.runWorker(worker), 1)
+
+    def incrementalBackup(self) -> dict:
+        '''A backup when nothing changed since the first one, which isn't timed'''
+
+        def backup() -> None:
+            worker = IncrementalBackup(optionsPath=self.tree.optionsPath, savePath=self.tree.savePath)
+            worker.storePath = os.path.join(self.tree.root, BACKUP_STORE)
+            self.cli.runWorker(worker)
+
+        backup()
+
+        return measure(backup, self.repeat)
+
+    def unZipMod(self) -> dict:
+        worker = UnZipMod(*((x, ModType.mods) for x in self.tree.archives), optionsPath=self.tree.optionsPath, savePath=self.tree.savePath)
+        return measure(lambda: self.cli.runWorker(worker), 1)
+
+BENCHMARKS: tuple[str, ...] = ('refreshMods', 'refreshModsCached', 'search', 'sort', 'applyMods', 'backupMods', 'incrementalBackup', 'unZipMod')
+
+def gitCommit() -> str | None:
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(RESULTS_PATH)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def runSize(spec: TreeSpec, only: tuple[str, ...], repeat: int) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix='mmm-bench-') as root:
+        start: float = time.perf_counter()
+        tree: GameTree = generateGameTree(root, spec)
+        print(f'Generated {spec.mods} mods in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+        benchmarks = Benchmarks(tree, repeat)
+
+        try:
+            for name in BENCHMARKS:
+                if name not in only:
+                    continue
+
+                results[name] = getattr(benchmarks, name)()
+                print(f'  {name:<18} {results[name]["median"]:>10.2f} ms', file=sys.stderr)
+        finally:
+            benchmarks.close()
+
+            # Deleted widgets and watchers let go of the folder before it's removed
+            qtw.QApplication.processEvents()
+            shutil.rmtree(root, ignore_errors=True)
+
+    return results
+
+def compare(results: dict, baselinePath: str) -> None:
+    '''Prints how the medians changed since a previous run'''
+
+    with open(baselinePath) as f:
+        baseline: dict = json.load(f)['results']
+
+    print(f'{"mods":>6} {"benchmark":<18} {"before":>10} {"after":>10} {"change":>8}')
+
+    for size, benchmarks in results.items():
+        for name, stats in benchmarks.items():
+            old: dict | None = baseline.get(size, {}).get(name)
+
+            if old is None:
+                continue
+
+            change: float = (stats['median'] - old['median']) / old['median'] * 100 if old['median'] else 0.0
+            print(f'{size:>6} {name:<18} {old["median"]:>10.2f} {stats["median"]:>10.2f} {change:>+7.1f}%')
+
+def createParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Time the manager on generated game folders')
+
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='mod counts to test (default: %(default)s)')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=BENCHMARKS, help='benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each repeatable benchmark (default: %(default)s)')
+    parser.add_argument('--files', type=int, default=TreeSpec.files, help='files in each mod (default: %(default)s)')
+    parser.add_argument('--file-size', type=int, default=TreeSpec.fileSize, help='bytes in each file (default: %(default)s)')
+    parser.add_argument('--xml-ratio', type=float, default=TreeSpec.xmlRatio, help='mods with a main.xml (default: %(default)s)')
+    parser.add_argument('--txt-ratio', type=float, default=TreeSpec.txtRatio, help='mods with a mod.txt (default: %(default)s)')
+    parser.add_argument('--archives', type=int, default=TreeSpec.archives, help='zipped mods to install (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=TreeSpec.seed)
+    parser.add_argument('--output', help='results file (default: benchmarks/results/bench-<time>.json)')
+    parser.add_argument('--compare', metavar='RESULTS', help='print the change from a previous results file')
+
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = createParser().parse_args(argv)
+
+    app = qtw.QApplication.instance() or qtw.QApplication([sys.argv[0]])
+
+    results: dict[str, dict] = {}
+
+    for size in args.sizes:
+        spec = TreeSpec(
+            mods=size,
+            xmlRatio=args.xml_ratio,
+            txtRatio=args.txt_ratio,
+            files=args.files,
+            fileSize=args.file_size,
+            archives=args.archives,
+            seed=args.seed
+        )
+
+        results[str(size)] = runSize(spec, tuple(args.only), args.repeat)
+
+    output: dict = {
+        'meta' : {
+            'date'     : datetime.now().isoformat(timespec='seconds'),
+            'commit'   : gitCommit(),
+            'python'   : platform.python_version(),
+            'pyside'   : PySide6.__version__,
+            'platform' : platform.platform(),
+            'cpus'     : os.cpu_count(),
+            'repeat'   : args.repeat,
+            'spec'     : {k : v for k, v in vars(args).items() if k not in ('sizes', 'only', 'output', 'compare')}
+        },
+        'results' : results
+    }
+
+    path: str = args.output or os.path.join(RESULTS_PATH, f'bench-{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with open(path, 'w') as f:
+        json.dump(output, f, indent=4)
+
+    print(f'Results written to {path}', file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,184 @@
 import json
 import logging
 import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.sqliteStore import SQLiteStore
 
 class JSONParser():
     file: dict = None
-    def __init__(self, path: str = '', default: dict = {}) -> None:
+    stamp: tuple[int, int, int] | None = None # The file's (mtime, size, inode) when it was last loaded or saved
+
+    # When set, parsers with a table are kept in this database instead of their JSON file
+    store: SQLiteStore | None = None
+
+    def __init__(self, path: str = '', default: dict = {}, table: str | None = None) -> None:
         self.path: str = path
         self.default = default
+        self.table: str | None = table
+
+        self.savedData: str | None = None # The text last loaded or saved, used to skip writes that change nothing
+        self.savedRows: dict[str, str] | None = None # The rows last loaded from or saved to the store
+        self.batchDepth: int = 0
+        self.pendingSave: bool = False
+
         try:
             self.loadJSON()
         except (json.decoder.JSONDecodeError, FileNotFoundError) as e:
             logging.error(f'{e}')
-            with open(self.path, 'w') as f:
-                f.write(json.dumps(default))
-            
+            self.writeFile(json.dumps(default))
+
             self.loadJSON()
 
     def loadJSON(self) -> None:
+        if self.usesStore():
+            try:
+                self.savedRows = JSONParser.store.load(self.table, self.path, self.default)
+                self.file = {k : json.loads(v) for k, v in self.savedRows.items()}
+                return
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        self.savedRows = None
+
+        stamp = self.fileStamp()
+
         with open(self.path, 'r') as f:
-            self.file = json.loads(f.read())
+            data: str = f.read()
+
+        self.file = json.loads(data)
+
+        self.stamp = stamp
+        self.savedData = data
+
+    def fileStamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def isStale(self) -> bool:
+        '''Returns True if the file changed on disk since it was last loaded or saved'''
+
+        # Only this program writes to the store
+        if self.savedRows is not None:
+            return False
+
+        # Switched to the store since the JSON file was loaded
+        if self.usesStore():
+            return True
+
+        return self.fileStamp() != self.stamp
+
+    def exists(self) -> bool:
+        return self.usesStore() or os.path.isfile(self.path)
+
+    def usesStore(self) -> bool:
+        return self.table is not None and JSONParser.store is not None
+
+    @staticmethod
+    def storeFailed(error: sqlite3.Error) -> None:
+        '''Stops using the store, every parser saves to its JSON file from now on'''
+
+        logging.error('The database failed, falling back to JSON files:\n%s', error)
+        JSONParser.store = None
 
     def saveJSON(self) -> None:
-        with open(self.path, 'w') as f:
-            f.seek(0)
-            f.write(json.dumps(self.file, indent=2))
-            f.truncate()
-        
-        logging.info('%s has been saved.', os.path.basename(self.path))
\ No newline at end of file
+        '''
+        Writes the file to disk, nothing is written if the data didn't change
+
+        Inside of `batch()` the write is delayed until the batch ends
+        '''
+
+        if self.batchDepth > 0:
+            self.pendingSave = True
+            return
+
+        self.pendingSave = False
+
+        if self.usesStore() and self.savedRows is not None:
+            rows: dict[str, str] = {k : json.dumps(v) for k, v in self.file.items()}
+
+            try:
+                changed: int = JSONParser.store.save(self.table, rows, self.savedRows)
+                self.savedRows = rows
+
+                if changed:
+                    logging.info('%s row(s) of %s have been saved.', changed, self.table)
+                return
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        # The JSON file is out of date if the data came from the store
+        if self.savedRows is not None:
+            self.savedRows = None
+            self.savedData = None
+
+        data: str = json.dumps(self.file, indent=2)
+
+        if data == self.savedData and not self.isStale():
+            logging.debug('%s is unchanged, not saving', os.path.basename(self.path))
+            return
+
+        self.writeFile(data)
+
+        self.savedData = data
+        self.stamp = self.fileStamp()
+
+        logging.info('%s has been saved.', os.path.basename(self.path))
+
+    def writeFile(self, data: str) -> None:
+        '''
+        Writes to a temporary file and then replaces the file with it,
+        a crash mid-write leaves the old file intact
+        '''
+
+        directory: str = os.path.dirname(os.path.abspath(self.path))
+
+        fd, tmpPath = tempfile.mkstemp(prefix=f'.{os.path.basename(self.path)}.', suffix='.tmp', dir=directory)
+
+        # mkstemp only gives the owner access, keep the permissions of the file being replaced
+        try:
+            mode: int = os.stat(self.path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.chmod(tmpPath, mode)
+
+            os.replace(tmpPath, self.path)
+        except BaseException:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            raise
+
+    def beginBatch(self) -> None:
+        self.batchDepth += 1
+
+    def endBatch(self) -> None:
+        '''Ends a batch, saving once if `saveJSON()` was called during it'''
+
+        self.batchDepth = max(0, self.batchDepth - 1)
+
+        if self.batchDepth == 0 and self.pendingSave:
+            self.saveJSON()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        '''Combines every `saveJSON()` call made inside of the block into a single write'''
+
+        self.beginBatch()
+        try:
+            yield
+        finally:
+            self.endBatch()
@@ -2,15 +2,9 @@ import logging
 import os
 from datetime import datetime
 
-import PySide6.QtWidgets as qtw
-from PySide6.QtCore import QTranslator, QLocale
-
-from src.main_window import MainWindow
-from src.save import Save, OptionsManager
-from src.widgets.QDialog.gamepathQDialog import GamePathNotFound
-from src.constant_vars import VERSION, PROGRAM_NAME, LOGS_PATH, IS_SCRIPT, OLD_EXE, ROOT_PATH, MAX_LOGS, OptionKeys, LANG_FOLDER_PATH
-import src.errorChecking as errorChecking
-from src.style import StyleManager
+from src.constant_vars import VERSION, PROGRAM_NAME, LOGS_PATH, IS_SCRIPT, OLD_EXE, ROOT_PATH, MAX_LOGS, OptionKeys, LANG_FOLDER_PATH, STORAGE_SQLITE
+import src.importTimer as importTimer
+from src.tracer import Tracer, span
 
 def setup_logging() -> None:
     time: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -36,6 +30,10 @@ def setup_logging() -> None:
 if __name__ == '__main__':
 
     import sys
+    import multiprocessing
+
+    # The backup's compression processes start the exe again when it's frozen
+    multiprocessing.freeze_support()
 
     # Old exe appears after updating
     if os.path.exists(OLD_EXE):
@@ -48,12 +46,44 @@ if __name__ == '__main__':
 
     logging.info('\nSTARTING: %s\nVERSION: %s\nEXE PATH: %s', PROGRAM_NAME, VERSION, ROOT_PATH)
 
+    # The GUI is imported after logging is set up so its import time can be logged
+    timer: importTimer.ImportTimer | None = importTimer.install()
+
+    Tracer.startFromEnvironment()
+
+    # python -m src cli ..., runs without any widgets
+    if sys.argv[1:2] == ['cli']:
+        from src.cli import main
+        sys.exit(main(sys.argv[2:]))
+
+    importSpan: span = span('imports', 'startup').begin()
+
+    import PySide6.QtWidgets as qtw
+    from PySide6.QtCore import QTranslator, QLocale, QTimer, QCoreApplication as qapp
+
+    from src.main_window import MainWindow
+    from src.save import Save, OptionsManager
+    from src.JSONParser import JSONParser
+    from src.sqliteStore import SQLiteStore
+    from src.journal import Journal, JournalReport, JournalLocked
+    import src.errorChecking as errorChecking
+    from src.style import StyleManager
+
+    importSpan.end()
+
     app = qtw.QApplication(sys.argv)
     QLocale.setDefault(QLocale.Language.English)
 
-    save = Save()
     optionsManager = OptionsManager()
 
+    Tracer.startFromEnvironment(optionsManager.getTrace())
+
+    # The JSON files are migrated into the database the first time it's used
+    if optionsManager.getStorage() == STORAGE_SQLITE:
+        JSONParser.store = SQLiteStore.open()
+
+    save = Save()
+
     translator = QTranslator(app)
     path: str = os.path.join(LANG_FOLDER_PATH, optionsManager.getLang() + '.qm')
     if not translator.load(path):
@@ -66,13 +96,48 @@ if __name__ == '__main__':
 
     # Checking game path
     if not optionsManager.hasOption(OptionKeys.game_path):
+        from src.widgets.QDialog.gamepathQDialog import GamePathNotFound
+
         warning = GamePathNotFound(app)
         warning.exec()
 
     # Checking neccessary directories
     errorChecking.createModDirs()
 
-    window = MainWindow(app)
-    window.show()
+    # Undoing an operation that was interrupted the last time the program closed
+    journal = Journal()
+    report: JournalReport | None = None
+
+    try:
+        with journal.locked():
+            if journal.pending():
+                report = journal.recover()
+
+    # The cli is running an operation, it isn't interrupted
+    except JournalLocked as e:
+        logging.warning('Not recovering %s: %s', journal.path, e)
+
+    if report is not None:
+        from src.widgets.QDialog.announcementQDialog import Notice
+
+        notice = Notice(
+            qapp.translate('Journal', 'Myth Mod Manager closed before it finished moving or deleting mods.') +
+            '\n' + qapp.translate('Journal', 'Changes rolled back:') + f' {report.rolledBack}' +
+            '\n' + qapp.translate('Journal', 'Deletions finished:') + f' {report.finished}',
+            qapp.translate('Journal', 'Recovered an interrupted operation')
+        )
+        notice.exec()
+
+    with span('MainWindow', 'startup'):
+        window = MainWindow(app)
+        window.show()
+
+    # Reported once the window is shown and the first scan has run
+    if timer is not None:
+        QTimer.singleShot(0, timer.report)
+        QTimer.singleShot(0, timer.uninstall)
 
     app.exec()
+
+    if JSONParser.store is not None:
+        JSONParser.store.close()
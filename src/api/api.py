@@ -6,6 +6,8 @@ from typing import Any
 
 from semantic_version import Version
 
+from src.tracer import span
+
 logging.getLogger(__file__)
 
 def __loadXML(modPath: str) -> et.ElementTree | None:
@@ -72,6 +74,7 @@ def findModworkshopAssetID(modPath: str) -> str:
     
     return assetID
 
+@span('findModVersion', 'io')
 def findModVersion(modPath: str) -> Version | None:
     '''Finds the mod version if it can by parsing `main.xml` and `mod.txt`'''
     try:
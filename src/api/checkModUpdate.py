@@ -7,6 +7,8 @@ from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkRe
 
 from semantic_version import Version
 
+from src.tracer import span
+
 
 class checkModUpdate(QObject):
     '''
@@ -37,6 +39,8 @@ class checkModUpdate(QObject):
         request = QNetworkRequest(QUrl(link))
         logging.debug('Request for %s from checkModUpdate() started', link)
 
+        self.span = span('checkModUpdate', 'network', url=link).begin()
+
         self.reply: QNetworkReply = network.get(request)
         self.reply.finished.connect(self.__reply_handler)
     
@@ -44,6 +48,8 @@ class checkModUpdate(QObject):
     def __reply_handler(self) -> None:
         reply: QNetworkReply = self.sender()
 
+        self.span.end(error=str(reply.error()))
+
         if reply.error() == QNetworkReply.NetworkError.NoError:
             self.__checkVersion()
         else:
@@ -7,6 +7,7 @@ from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkRe
 from semantic_version import Version
 
 from src.errorChecking import isPrerelease
+from src.tracer import span
 from src.constant_vars import VERSION
 
 class checkUpdate(QObject):
@@ -33,6 +34,8 @@ class checkUpdate(QObject):
         network = QNetworkAccessManager(self)
         request = QNetworkRequest(QUrl(link))
         logging.debug('Request for %s from checkUpdate() started', link)
+
+        self.span = span('checkUpdate', 'network', url=link).begin()
         
         self.reply: QNetworkReply = network.get(request)
         self.reply.finished.connect(self.__reply_handler)
@@ -41,6 +44,8 @@ class checkUpdate(QObject):
     def __reply_handler(self) -> None:
         reply: QNetworkReply = self.sender()
 
+        self.span.end(error=str(reply.error()))
+
         if reply.error() == QNetworkReply.NetworkError.NoError:
             self.__checkVersion()
         else:
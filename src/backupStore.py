@@ -0,0 +1,159 @@
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Callable, Iterator, NamedTuple
+
+from src.constant_vars import ModType, BACKUP_STORE, BACKUP_CHUNK_SIZE, MOVE_PARTIAL_SUFFIX
+
+class ManifestEntry(NamedTuple):
+    type: ModType
+    folders: list[str]
+    files: dict[str, list] # Path in the mod -> [size, mtime_ns, [chunk, ...]]
+
+    @property
+    def size(self) -> int:
+        return sum(x[0] for x in self.files.values())
+
+class BackupStore():
+    '''
+    Content addressed storage for incremental backups
+
+    Files are split into chunks that are saved under their hash, so a chunk
+    that is in more than one file or backup is only stored once.
+    Each backup is a manifest that lists the chunks of every file:
+
+    ```
+    {
+        "created" : "2024-01-01T12:00:00",
+        "mods" : {
+            "mod" : {
+                "type" : "mods",
+                "enabled" : true,
+                "folders" : ["", "lua"],
+                "files" : {"lua/main.lua" : [size, mtime_ns, [chunk, ...]]}
+            }
+        }
+    }
+    ```
+    '''
+
+    def __init__(self, path: str = BACKUP_STORE) -> None:
+        logging.getLogger(__name__)
+
+        self.path = path
+        self.chunksPath: str = os.path.join(path, 'chunks')
+        self.manifestsPath: str = os.path.join(path, 'manifests')
+
+    @staticmethod
+    def fromManifest(path: str) -> 'BackupStore':
+        '''Returns the store a manifest file is in'''
+
+        return BackupStore(os.path.dirname(os.path.dirname(os.path.abspath(path))))
+
+    def manifests(self) -> list[str]:
+        '''Returns the names of the backups from oldest to newest'''
+
+        try:
+            return sorted(x for x in os.listdir(self.manifestsPath) if x.endswith('.json'))
+        except FileNotFoundError:
+            return []
+
+    def loadManifest(self, name: str) -> dict[str, Any]:
+        with open(os.path.join(self.manifestsPath, name), encoding='utf-8') as f:
+            return json.load(f)
+
+    def latestManifest(self) -> dict[str, Any] | None:
+        manifests: list[str] = self.manifests()
+
+        return self.loadManifest(manifests[-1]) if manifests else None
+
+    def readMods(self, name: str) -> dict[str, ManifestEntry]:
+        '''Returns the mods in a backup with their type, folders and files'''
+
+        return {
+            mod : ManifestEntry(ModType(x['type']), x['folders'], x['files'])
+            for mod, x in self.loadManifest(name)['mods'].items()
+        }
+
+    def saveManifest(self, mods: dict[str, dict[str, Any]]) -> str:
+        '''Saves a backup of `mods` and returns its name, names sort by when they were made'''
+
+        created: datetime = datetime.now()
+        name: str = created.strftime('backup-%Y%m%d-%H%M%S-%f.json')
+
+        self.writeFile(os.path.join(self.manifestsPath, name), json.dumps({'created' : created.isoformat(timespec='seconds'), 'mods' : mods}).encode())
+
+        logging.info('Saved backup %s with %s mods', name, len(mods))
+
+        return name
+
+    def chunkPath(self, digest: str) -> str:
+        return os.path.join(self.chunksPath, digest[:2], digest)
+
+    def writeFile(self, path: str, data: bytes) -> None:
+        '''Writes a file that doesn't exist until it's complete'''
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path + MOVE_PARTIAL_SUFFIX, 'wb') as f:
+            f.write(data)
+
+        os.replace(path + MOVE_PARTIAL_SUFFIX, path)
+
+    def storeFile(self, path: str, onChunk: Callable[[int], None] = lambda x: None) -> list[str]:
+        '''Saves the chunks of a file that aren't stored yet, returns the hash of each chunk'''
+
+        chunks: list[str] = []
+
+        with open(path, 'rb') as f:
+            while chunk := f.read(BACKUP_CHUNK_SIZE):
+                digest: str = hashlib.blake2b(chunk, digest_size=20).hexdigest()
+
+                if not os.path.exists(self.chunkPath(digest)):
+                    self.writeFile(self.chunkPath(digest), chunk)
+
+                chunks.append(digest)
+                onChunk(len(chunk))
+
+        return chunks
+
+    def readFile(self, chunks: list[str]) -> Iterator[bytes]:
+        '''Yields the content of a stored file'''
+
+        for digest in chunks:
+            with open(self.chunkPath(digest), 'rb') as f:
+                yield f.read()
+
+    def prune(self, keep: int) -> tuple[int, int]:
+        '''
+        Deletes all but the newest `keep` backups and the chunks no backup uses,
+        returns how many backups and chunks were deleted
+        '''
+
+        manifests: list[str] = self.manifests()
+        removed: list[str] = manifests[:-keep] if keep > 0 else manifests
+
+        for name in removed:
+            os.remove(os.path.join(self.manifestsPath, name))
+
+        used: set[str] = set()
+
+        for name in manifests[len(removed):]:
+            for mod in self.loadManifest(name)['mods'].values():
+                for _, _, chunks in mod['files'].values():
+                    used.update(chunks)
+
+        # Also cleans up the chunks of a backup that was canceled
+        chunksRemoved: int = 0
+
+        for root, _, files in os.walk(self.chunksPath):
+            for file in files:
+                if file not in used:
+                    os.remove(os.path.join(root, file))
+                    chunksRemoved += 1
+
+        logging.info('Pruned %s backups and %s chunks from %s', len(removed), chunksRemoved, self.path)
+
+        return len(removed), chunksRemoved
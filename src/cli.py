@@ -0,0 +1,334 @@
+import os
+import sys
+import json
+import logging
+import argparse
+from typing import Any, TextIO
+
+from PySide6.QtCore import QCoreApplication, QMutex
+
+from src.save import Save, OptionsManager
+from src.JSONParser import JSONParser
+from src.sqliteStore import SQLiteStore
+from src.getPath import Pathing
+from src.journal import Journal
+from src.profileManager import ProfileManager
+from src.threaded.applyProfile import ApplyProfile, ProfilePlan, planProfile
+from src.modScanner import ModScan, scanModDirs, sortModScan
+from src.threaded.workerQObject import Worker
+from src.constant_vars import ModType, ModKeys, MOD_CONFIG, OPTIONS_CONFIG, PROFILES_JSON, BACKUP_MODS, STORAGE_SQLITE
+
+class CommandError(Exception):
+    '''Raised by a command when it can't run, the message is printed as the error'''
+
+class CLI():
+    '''
+    Runs mod operations without the GUI
+
+    Usage: `python -m src cli <command> ...`, each command prints a
+    single JSON object with `ok` and `error` keys to stdout
+    '''
+
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG, profilesPath: str = PROFILES_JSON, out: TextIO = sys.stdout) -> None:
+        logging.getLogger(__name__)
+
+        self.optionsPath = optionsPath
+        self.savePath = savePath
+        self.profilesPath = profilesPath
+        self.out = out
+
+        self.optionsManager = OptionsManager(optionsPath)
+        self.saveManager = Save(savePath)
+        self.p = Pathing(optionsPath)
+
+    def scan(self) -> ModScan:
+        '''Finds the mods on disk and updates their type and enabled state in the save'''
+
+        folders: tuple[list[str], ...] = scanModDirs(self.p.mods(), self.p.mod_overrides(), self.p.maps(), self.optionsManager.getDispath())
+        scan: ModScan = sortModScan(folders, self.saveManager.getType)
+
+        self.saveManager.addMods((scan.mod_overrides, ModType.mods_override), (scan.mods, ModType.mods), (scan.maps, ModType.maps))
+
+        for mod in scan.all():
+            self.saveManager.setEnabled(mod, mod not in scan.disabled)
+
+        self.saveManager.saveJSON()
+
+        return scan
+
+    def recover(self) -> None:
+        '''Rolls back an operation the GUI or another command didn't finish, raises `JournalLocked` if it's still running'''
+
+        journal = Journal()
+
+        with journal.locked():
+            if journal.pending():
+                journal.recover(self.savePath)
+
+    def runWorker(self, worker: Worker) -> None:
+        '''Runs a worker in this thread, raises `CommandError` if it fails'''
+
+        errors: list[str] = []
+
+        worker.mutex = QMutex()
+        worker.error.connect(errors.append)
+
+        worker.run()
+
+        if errors:
+            raise CommandError(errors[0])
+
+    def modInfo(self, mod: str, scan: ModScan, profiles: ProfileManager) -> dict[str, Any]:
+        return {
+            'name'     : mod,
+            'type'     : self.saveManager.getType(mod),
+            'enabled'  : mod not in scan.disabled,
+            'ignored'  : self.saveManager.getIgnored(mod),
+            'tags'     : self.saveManager.getTags(mod),
+            'profiles' : sorted(profiles.profilesWithMod(mod))
+        }
+
+    def checkInstalled(self, mods: list[str], scan: ModScan) -> None:
+        installed: set[str] = set(scan.all())
+        missing: list[str] = [x for x in mods if x not in installed]
+
+        if missing:
+            raise CommandError(f'Not installed: {", ".join(missing)}')
+
+    # Commands, each returns the data printed with the result
+
+    def listMods(self, args: argparse.Namespace) -> dict[str, Any]:
+        scan: ModScan = self.scan()
+        names: list[str] = sorted(scan.all())
+
+        # Looked up with the indexes of the database when it's used
+        if args.type:
+            ofType: set[str] = set(self.saveManager.modsWhere(ModKeys.type, args.type))
+            names = [x for x in names if x in ofType]
+        if args.tag:
+            tagged: set[str] = self.saveManager.modsWithTags(*args.tag)
+            names = [x for x in names if x in tagged]
+
+        profiles = ProfileManager(self.profilesPath)
+        mods: list[dict[str, Any]] = [self.modInfo(x, scan, profiles) for x in names]
+
+        if args.enabled:
+            mods = [x for x in mods if x['enabled']]
+        if args.disabled:
+            mods = [x for x in mods if not x['enabled']]
+
+        return {'mods' : mods}
+
+    def enable(self, args: argparse.Namespace) -> dict[str, Any]:
+        return self.setEnabled(args.mods, True)
+
+    def disable(self, args: argparse.Namespace) -> dict[str, Any]:
+        return self.setEnabled(args.mods, False)
+
+    def setEnabled(self, mods: list[str], enabled: bool) -> dict[str, Any]:
+        from src.threaded.moveToEnabledDir import MoveToEnabledModDir
+        from src.threaded.moveToDisabledDir import MoveToDisabledDir
+
+        scan: ModScan = self.scan()
+        self.checkInstalled(mods, scan)
+
+        # Mods that are already in the right folder aren't moved
+        changed: list[str] = [x for x in mods if (x in scan.disabled) == enabled]
+
+        if changed:
+            worker: type[Worker] = MoveToEnabledModDir if enabled else MoveToDisabledDir
+            self.runWorker(worker(*changed, optionsPath=self.optionsPath, savePath=self.savePath))
+            self.scan()
+
+        return {'enabled' if enabled else 'disabled' : changed}
+
+    def applyProfile(self, args: argparse.Namespace) -> dict[str, Any]:
+        profiles = ProfileManager(self.profilesPath)
+
+        if args.profile not in profiles.getJSON():
+            raise CommandError(f'Profile does not exist: {args.profile}')
+
+        plan: ProfilePlan = planProfile(profiles.getMods(args.profile), self.scan())
+
+        if plan.toEnable or plan.toDisable:
+            self.runWorker(ApplyProfile(plan.toEnable, plan.toDisable, optionsPath=self.optionsPath, savePath=self.savePath))
+            self.scan()
+
+        return {
+            'profile'      : args.profile,
+            'enabled'      : plan.toEnable,
+            'disabled'     : plan.toDisable,
+            'notInstalled' : plan.notInstalled
+        }
+
+    def install(self, args: argparse.Namespace) -> dict[str, Any]:
+        from src.threaded.changeModType import ChangeModType
+        from src.threaded.unZipMod import UnZipMod
+
+        paths: list[str] = [os.path.abspath(x) for x in args.paths]
+        missing: list[str] = [x for x in paths if not os.path.exists(x)]
+
+        if missing:
+            raise CommandError(f'Does not exist: {", ".join(missing)}')
+
+        modType = ModType(args.type)
+        dirs: list[tuple[str, ModType]] = [(x, modType) for x in paths if os.path.isdir(x)]
+        archives: list[tuple[str, ModType]] = [(x, modType) for x in paths if not os.path.isdir(x)]
+
+        if dirs:
+            self.runWorker(ChangeModType(*dirs, optionsPath=self.optionsPath, savePath=self.savePath))
+        if archives:
+            self.runWorker(UnZipMod(*archives, optionsPath=self.optionsPath, savePath=self.savePath))
+
+        self.scan()
+
+        return {'installed' : paths, 'type' : modType}
+
+    def delete(self, args: argparse.Namespace) -> dict[str, Any]:
+        from src.threaded.deleteMod import DeleteMod
+
+        self.checkInstalled(args.mods, self.scan())
+
+        # The worker only removes the mods from the save, the mods deleted before an error are saved too
+        try:
+            self.runWorker(DeleteMod(*args.mods, optionsPath=self.optionsPath, savePath=self.savePath))
+        finally:
+            self.saveManager.saveJSON()
+
+        return {'deleted' : args.mods}
+
+    def backup(self, args: argparse.Namespace) -> dict[str, Any]:
+        from src.threaded.backupMods import BackupMods
+        from src.threaded.incrementalBackup import IncrementalBackup
+
+        self.scan()
+
+        if args.incremental:
+            worker = IncrementalBackup(optionsPath=self.optionsPath, savePath=self.savePath)
+            self.runWorker(worker)
+
+            return {'backup' : worker.storePath}
+
+        self.runWorker(BackupMods(optionsPath=self.optionsPath, savePath=self.savePath))
+
+        return {'backup' : os.path.abspath(f'{BACKUP_MODS}.zip')}
+
+    def restore(self, args: argparse.Namespace) -> dict[str, Any]:
+        import zipfile
+
+        from src.backupStore import ManifestEntry
+        from src.threaded.restoreMods import BackupEntry, RestoreMods, readContents, saveRestored
+
+        backupPath: str = os.path.abspath(args.backup)
+
+        if not os.path.isfile(backupPath):
+            raise CommandError(f'Does not exist: {backupPath}')
+
+        try:
+            contents: dict[str, BackupEntry | ManifestEntry] = readContents(backupPath)
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise CommandError(f'{backupPath} is not a backup: {e}')
+
+        # Without mods the contents of the backup are listed
+        if not args.mods:
+            return {'backup' : backupPath, 'mods' : [{'name' : x, 'type' : y.type, 'size' : y.size} for x, y in sorted(contents.items())]}
+
+        missing: list[str] = [x for x in args.mods if x not in contents]
+
+        if missing:
+            raise CommandError(f'Not in the backup: {", ".join(missing)}')
+
+        self.scan()
+
+        worker = RestoreMods(backupPath, *args.mods, optionsPath=self.optionsPath, savePath=self.savePath)
+
+        # The mods restored before an error are kept
+        try:
+            self.runWorker(worker)
+        finally:
+            saveRestored(worker.mods_restored, self.savePath)
+
+        return {'backup' : backupPath, 'restored' : args.mods}
+
+    def run(self, args: argparse.Namespace) -> int:
+        '''Runs a parsed command and prints the result, returns the exit code'''
+
+        result: dict[str, Any] = {'command' : args.command}
+
+        try:
+            self.recover()
+            result.update(getattr(self, args.handler)(args))
+            result.update(ok=True, error=None)
+        except (CommandError, ValueError, OSError) as e:
+            logging.error('cli %s failed: %s', args.command, e)
+            result.update(ok=False, error=str(e))
+
+        self.out.write(json.dumps(result) + '\n')
+        self.out.flush()
+
+        return 0 if result['ok'] else 1
+
+def createParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m src cli', description='Manage mods without the GUI, results are printed as JSON')
+
+    parser.add_argument('--options', default=OPTIONS_CONFIG, help='options file (default: %(default)s)')
+    parser.add_argument('--save', default=MOD_CONFIG, help='mod data file (default: %(default)s)')
+    parser.add_argument('--profiles', default=PROFILES_JSON, help='profiles file (default: %(default)s)')
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    listCommand = commands.add_parser('list', help='list the installed mods')
+    listCommand.add_argument('--type', choices=ModType.all_types())
+    listCommand.add_argument('--tag', action='append', help='only mods with this tag, can be repeated')
+    state = listCommand.add_mutually_exclusive_group()
+    state.add_argument('--enabled', action='store_true')
+    state.add_argument('--disabled', action='store_true')
+    listCommand.set_defaults(handler='listMods')
+
+    for name, handler, help in (
+        ('enable', 'enable', 'move mods out of the disabled mods folder'),
+        ('disable', 'disable', 'move mods into the disabled mods folder'),
+        ('delete', 'delete', 'move mods to the recycle bin')
+    ):
+        command = commands.add_parser(name, help=help)
+        command.add_argument('mods', nargs='+')
+        command.set_defaults(handler=handler)
+
+    applyCommand = commands.add_parser('apply-profile', help='enable only the mods of a profile')
+    applyCommand.add_argument('profile')
+    applyCommand.set_defaults(handler='applyProfile')
+
+    installCommand = commands.add_parser('install', help='install mod folders or archives')
+    installCommand.add_argument('paths', nargs='+')
+    installCommand.add_argument('--type', choices=ModType.all_types(), default=ModType.mods.value)
+    installCommand.set_defaults(handler='install')
+
+    backupCommand = commands.add_parser('backup', help='zip every mod into the backup file')
+    backupCommand.add_argument('--incremental', action='store_true', help='only store the files that changed since the last backup')
+    backupCommand.set_defaults(handler='backup')
+
+    restoreCommand = commands.add_parser('restore', help='extract mods from a backup zip or an incremental backup manifest, lists the mods in it if none are given')
+    restoreCommand.add_argument('mods', nargs='*')
+    restoreCommand.add_argument('--backup', default=f'{BACKUP_MODS}.zip', help='backup zip or incremental backup manifest (default: %(default)s)')
+    restoreCommand.set_defaults(handler='restore')
+
+    return parser
+
+def main(argv: list[str] | None = None, out: TextIO = sys.stdout) -> int:
+    args: argparse.Namespace = createParser().parse_args(argv)
+
+    # Workers are QObjects, no widgets or event loop are needed
+    if QCoreApplication.instance() is None:
+        app = QCoreApplication([sys.argv[0]])
+
+    # Same as the GUI, the JSON files are migrated into the database the first time it's used
+    if OptionsManager(args.options).getStorage() == STORAGE_SQLITE:
+        JSONParser.store = SQLiteStore.open()
+
+    try:
+        return CLI(args.options, args.save, args.profiles, out).run(args)
+
+    finally:
+        if JSONParser.store is not None:
+            JSONParser.store.close()
+            JSONParser.store = None
@@ -25,6 +25,41 @@ class ModKeys(StrEnum):
     ignored       = auto()
     tags          = auto()
 
+class ModCount(StrEnum):
+    '''Counters kept by the mod table, each `ModType` value is counted too'''
+    total    = auto()
+    enabled  = auto()
+    disabled = auto()
+    ignored  = auto()
+    size     = auto() # Bytes
+
+class LinkMode(StrEnum):
+    '''
+    How enabling and disabling changes the game folder
+
+    With a link mode every mod stays in the disabled mods folder
+    and enabling makes a link to it in the game folder
+    '''
+    move     = auto() # Mods are moved between the game folder and the disabled mods folder
+    symlink  = auto() # A symlink, or a junction on Windows
+    hardlink = auto() # A copy of the mod's folders with its files hardlinked, needs the same drive
+
+class JournalAction(StrEnum):
+    '''Steps that `Journal` writes down before a worker does them'''
+    move   = auto() # Rolled back
+    link   = auto() # Rolled back
+    unlink = auto() # Rolled back
+    relink = auto() # Rolled back, a symlink pointed at a mod's new folder
+    delete = auto() # Finished, the user already confirmed the deletion
+    restore = auto() # Rolled back until the restored copy replaced the installed one, then finished
+
+class BackupCodec(StrEnum):
+    '''How files are compressed in the backup zip, each is a compression method of the zip format'''
+    store   = auto() # Not compressed, the fastest
+    deflate = auto()
+    bzip2   = auto()
+    lzma    = auto() # The smallest and the slowest
+
 class OptionKeys(StrEnum):
     '''Option's keys in `OPTIONS_CONFIG`'''
 
@@ -37,6 +72,11 @@ class OptionKeys(StrEnum):
     windowsize_h     = auto()
     mmm_update_alert = auto()
     lang             = auto()
+    storage          = auto()
+    trace            = auto()
+    link_mode        = auto()
+    backup_codec     = auto()
+    backup_level     = auto()
 
     def all_keys() -> list[str]:
         # Splice removes section key
@@ -72,10 +112,14 @@ MOD_CONFIG = 'mods.json'
 OPTIONS_CONFIG = 'config.ini'
 PROFILES_JSON = 'profiles.json'
 TOOLS_JSON = 'externalshortcuts.json'
+METADATA_CACHE = 'metadatacache.json'
+DATABASE = 'mmm.db'
+JOURNAL = 'operations.journal'
 START_PAYDAY = 'runGame.bat'
 OLD_EXE = 'Myth Mod Manager.exe (Old)' if sys.platform.startswith('win') else 'Myth Mod Manager (old)'
 DISABLED_MODS = 'disabled-mods'
 BACKUP_MODS = 'backup mods'
+BACKUP_STORE = 'backup store'
 
 # Graphics names
 MODWORKSHOP_LOGO_W = 'mws_logo_white.svg'
@@ -84,6 +128,40 @@ GITHUB_LOGO_W = 'github-mark-white.svg'
 GITHUB_LOGO_B = 'github-mark.svg'
 KOFI_LOGO_B = 'kofi_s_logo_nolabel.webp'
 
+# Metadata cache eviction limits
+MAX_METADATA_CACHE = 5000 # Entries
+METADATA_CACHE_MAX_AGE = 30 # Days since the entry's mod was last seen
+
+# Search
+SEARCH_DELAY = 150 # Milliseconds after the last keystroke before searching
+SEARCH_FUZZY_THRESHOLD = 0.7 # Share of a query's trigrams a mod needs to be a fuzzy match
+
+# Times a second ProgressWidget reads a worker's progress
+PROGRESS_FPS = 30
+
+# Moving mods to another drive
+MOVE_COPY_THREADS = 4
+MOVE_CHUNK_SIZE = 1024 * 1024 # Bytes
+MOVE_PARTIAL_SUFFIX = '.mmm-partial' # Added to a copy until it's complete
+MOVE_REPLACED_SUFFIX = '.mmm-replaced' # Added to an installed copy while it's being replaced
+
+# Incremental backups
+BACKUP_CHUNK_SIZE = 4 * 1024 * 1024 # Bytes, files are stored in pieces of this size
+BACKUP_GENERATIONS = 5 # Backups that are kept, older ones are deleted
+
+# Backup zips
+BACKUP_LEVEL = 6 # Compression level from 0 to 9
+BACKUP_MEMBER_MAX = 64 * 1024 * 1024 # Bytes, bigger files are compressed to a temporary file instead of in memory
+BACKUP_POOL_MIN = 256 * 1024 # Bytes, smaller files are compressed faster than they can be sent to another process
+BACKUP_FOLDERS: dict[ModType, str] = {ModType.mods : 'mods', ModType.mods_override : 'assets/mod_overrides', ModType.maps : 'Maps'} # Folder of each type in the zip
+
+# Set to log how long each module takes to import at startup
+IMPORT_TIME_ENV = 'MMM_IMPORT_TIME'
+
+# Set to write timing spans to a Chrome trace in LOGS_PATH, the trace option does the same
+TRACE_ENV = 'MMM_TRACE'
+MAX_TRACE_EVENTS = 200000
+
 # Files in PAYDAY2/Mods/ to ignore
 MODSIGNORE = ('base', 'logs', 'saves', 'downloads')
 
@@ -101,6 +179,10 @@ UI_GRAPHICS_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'gra
 DARK = 'dark'
 LIGHT = 'light'
 
+# Storage Backends
+STORAGE_JSON = 'json'
+STORAGE_SQLITE = 'sqlite'
+
 # Program Info
 PROGRAM_NAME = 'Myth Mod Manager'
 
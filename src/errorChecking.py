@@ -9,8 +9,6 @@ from semantic_version import Version
 
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
-from src.widgets.QDialog.announcementQDialog import Notice
-
 from src.getPath import Pathing
 from src.save import OptionsManager
 from src.constant_vars import ModType, OPTIONS_CONFIG
@@ -27,6 +25,9 @@ def openWebPage(link: str) -> bool:
 
         logging.error('Could not open web browser:\n%s', link)
 
+        # Widgets are only imported when needed so the CLI can use this module
+        from src.widgets.QDialog.announcementQDialog import Notice
+
         notice = Notice(qapp.translate("ErrorChecking", 'Could not open to') + f' {link}')
         notice.exec()
     
@@ -47,7 +48,8 @@ def isInstalled(mod: str, optionsPath: str = OPTIONS_CONFIG) -> bool:
 
     path = Pathing(optionsPath)
 
-    possiblePaths: tuple[str, str, str, str] = (path.maps(), path.mod_overrides(), path.mods(), OptionsManager(optionsPath).getDispath())
+    # Pathing loads optionsPath if it isn't loaded already
+    possiblePaths: tuple[str, str, str, str] = (path.maps(), path.mod_overrides(), path.mods(), OptionsManager.getDispath())
 
     for path in possiblePaths:
 
@@ -140,6 +142,8 @@ def startFile(path: str) -> None:
     except Exception as e:
         logging.error('Error in errorChecking.startFile(%s): %s', path, str(e))
 
+        from src.widgets.QDialog.announcementQDialog import Notice
+
         notice = Notice(
             qapp.translate("ErrorChecking", 'Error in') + f' errorChecking.startFile({path}): {e}',
             qapp.translate("ErrorChecking", 'Could not start program')
@@ -10,7 +10,11 @@ class Pathing():
         self.option: str = optionFile
     
     def __getGamepath(self) -> str:
-        return OptionsManager(self.option).getGamepath()
+        # The settings are already in memory unless another file was loaded
+        if OptionsManager.file != self.option:
+            OptionsManager.load(self.option)
+
+        return OptionsManager.getGamepath()
 
     def mod_overrides(self) -> str:
         '''Returns mod_overrides path'''
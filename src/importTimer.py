@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+import logging
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from typing import Iterator
+
+from src.constant_vars import IMPORT_TIME_ENV
+
+class TimedLoader():
+    '''Wraps a module's loader to time loading it, anything else is passed to the wrapped loader'''
+
+    def __init__(self, loader, timer: 'ImportTimer') -> None:
+        self.loader = loader
+        self.timer = timer
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: ModuleSpec):
+        with self.timer.measure(spec.name):
+            return self.loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        with self.timer.measure(module.__name__):
+            self.loader.exec_module(module)
+
+class ImportTimer(MetaPathFinder):
+    '''
+    Logs how long each module takes to import, like `python -X importtime`
+
+    Installed by `install()` when the `MMM_IMPORT_TIME` environment variable is set,
+    works in the packaged build where `-X` options can't be passed
+    '''
+
+    def __init__(self) -> None:
+        logging.getLogger(__name__)
+
+        self.selfTimes: dict[str, int] = {} # Module -> ns spent importing it, without its imports
+        self.cumulative: dict[str, int] = {} # Module -> ns spent importing it and its imports
+        self.children: list[int] = [] # ns spent in the imports of each module being imported
+        self.total: int = 0 # ns spent importing
+
+        self.start: int = time.perf_counter_ns()
+
+    def find_spec(self, fullname: str, path, target=None) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec: ModuleSpec | None = finder.find_spec(fullname, path, target)
+
+            if spec is not None:
+                # Namespace packages have nothing to load
+                if spec.loader is not None:
+                    spec.loader = TimedLoader(spec.loader, self)
+                return spec
+
+        return None
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        self.children.append(0)
+        start: int = time.perf_counter_ns()
+
+        try:
+            yield
+        finally:
+            elapsed: int = time.perf_counter_ns() - start
+            childTime: int = self.children.pop()
+
+            if self.children:
+                self.children[-1] += elapsed
+            else:
+                self.total += elapsed
+
+            self.selfTimes[name] = self.selfTimes.get(name, 0) + elapsed - childTime
+            self.cumulative[name] = self.cumulative.get(name, 0) + elapsed
+
+    def report(self, limit: int = 30) -> None:
+        '''Logs the slowest imports since the timer was installed'''
+
+        logging.info(
+            'Imported %s modules in %.1f ms, %.1f ms since the import timer started',
+            len(self.cumulative), self.total / 1e6, (time.perf_counter_ns() - self.start) / 1e6
+        )
+
+        lines: list[str] = ['import time: self [us] | cumulative | imported package']
+
+        for name in sorted(self.cumulative, key=self.cumulative.get, reverse=True)[:limit]:
+            lines.append(f'import time: {self.selfTimes[name] // 1000:>9} | {self.cumulative[name] // 1000:>10} | {name}')
+
+        logging.info('\n'.join(lines))
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+def install(environ: dict[str, str] | None = None) -> ImportTimer | None:
+    '''Starts timing imports if `MMM_IMPORT_TIME` is set, returns the timer'''
+
+    if not (environ if environ is not None else os.environ).get(IMPORT_TIME_ENV):
+        return None
+
+    timer = ImportTimer()
+    sys.meta_path.insert(0, timer)
+
+    return timer
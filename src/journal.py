@@ -0,0 +1,251 @@
+import os
+import json
+import shutil
+import logging
+from contextlib import contextmanager
+from typing import Generator, NamedTuple
+
+from src.modLinks import isLink, isLinked, linkMod, unlinkMod
+from src.threaded.moveEngine import MoveEngine, planMove
+from src.save import Save
+
+from src.constant_vars import JOURNAL, MOD_CONFIG, MOVE_PARTIAL_SUFFIX, JournalAction, LinkMode
+
+class JournalStep(NamedTuple):
+    '''
+    A step that a worker is about to do
+
+    + move: `src` is moved to `dest`
+    + link, unlink: `link` is made or removed, it's a link to `src` made with `mode`
+    + relink: `link` is changed from pointing at `src` to `dest`
+    + delete: `link` is removed and `src` is sent to the recycle bin
+    + restore: `src` is a restored copy that replaces `dest`, the installed copy is moved to `link` until it's deleted
+    '''
+
+    action: JournalAction
+    src: str
+    dest: str = ''
+    link: str = ''
+    mode: str = ''
+
+class JournalLocked(OSError):
+    '''Raised when another process is in the middle of an operation'''
+
+def lockFile(file) -> None:
+    '''Takes an exclusive lock on an open file without waiting, raises `OSError` if another process has it'''
+
+    if os.name == 'nt':
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+def unlockFile(file) -> None:
+    '''Closing the file is enough on other systems'''
+
+    if os.name == 'nt':
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+class JournalReport(NamedTuple):
+    worker: str
+    rolledBack: int # Steps that were undone
+    finished: int # Deletions that were finished
+
+class Journal():
+    '''
+    Write-ahead log of the file operations of a worker
+
+    Workers write down every step they planned before starting the first one,
+    the journal is deleted once the worker is done. A journal found on startup
+    means the program closed in the middle of an operation, `recover()`
+    rolls back its moves and links and finishes its deletions.
+    A restore is rolled back until the restored copy is in place, then finished.
+
+    Each step is checked against the disk when it's recovered, so it doesn't
+    matter how far the worker got or if recovering is interrupted too.
+    Transactions and recovering hold a lock so the GUI and the cli can't
+    recover an operation the other one is still running
+    '''
+
+    def __init__(self, path: str = JOURNAL) -> None:
+        logging.getLogger(__name__)
+
+        self.path = path
+        self.lockPath: str = path + '.lock'
+        self.file = None
+
+    @contextmanager
+    def locked(self) -> Generator[None, None, None]:
+        '''
+        Holds an exclusive lock until it exits, raises `JournalLocked` if another process has it.
+        The lock is let go by the system if the process closes without exiting this
+        '''
+
+        with open(self.lockPath, 'a+b') as lock:
+            try:
+                lockFile(lock)
+            except OSError as e:
+                raise JournalLocked(f'Another operation is running, try again once it\'s done ({e})')
+
+            try:
+                yield
+            finally:
+                unlockFile(lock)
+
+    def pending(self) -> bool:
+        '''Returns if a journal was left behind by an operation that didn't finish'''
+        return os.path.isfile(self.path)
+
+    @contextmanager
+    def transaction(self, worker: str) -> Generator[None, None, None]:
+        '''Steps written inside of this are kept until it exits, raises `JournalLocked` if another process is running one'''
+
+        with self.locked():
+            self.file = open(self.path, 'w', encoding='utf-8')
+
+            try:
+                self.write({'worker' : worker})
+                yield
+            finally:
+                self.file.close()
+                self.file = None
+
+                os.remove(self.path)
+
+    def write(self, *records: dict) -> None:
+        self.file.writelines(json.dumps(x) + '\n' for x in records)
+        self.file.flush()
+
+        # The steps have to be on disk before the first one is started
+        os.fsync(self.file.fileno())
+
+    def plan(self, *steps: JournalStep) -> None:
+        '''Writes down steps before they are started, nothing is written outside of a transaction'''
+
+        if self.file is None or not steps:
+            return
+
+        self.write(*[x._asdict() for x in steps])
+
+    def read(self) -> tuple[str, list[JournalStep]]:
+        worker: str = ''
+        steps: list[JournalStep] = []
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record: dict = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line can be cut off if it was being written
+                    logging.warning('Skipping a broken line in %s: %s', self.path, line)
+                    continue
+
+                if 'worker' in record:
+                    worker = record['worker']
+                else:
+                    steps.append(JournalStep(JournalAction(record['action']), record['src'], record['dest'], record['link'], record['mode']))
+
+        return worker, steps
+
+    def recover(self, savePath: str = MOD_CONFIG) -> JournalReport:
+        '''Rolls back or finishes the steps of an interrupted operation, then deletes the journal'''
+
+        worker, steps = self.read()
+
+        logging.info('Recovering %s steps of %s from %s', len(steps), worker, self.path)
+
+        rolledBack: int = 0
+        deleted: list[str] = []
+
+        # Undone in the opposite order they were done
+        for step in reversed(steps):
+            try:
+                if step.action == JournalAction.delete:
+                    if self.finishDelete(step):
+                        deleted.append(os.path.basename(step.src))
+
+                elif self.undo(step):
+                    rolledBack += 1
+
+            except OSError as e:
+                logging.error('Could not recover %s:\n%s', step, e)
+
+        if deleted:
+            saveManager = Save(savePath)
+            saveManager.removeMods(*deleted)
+            saveManager.saveJSON()
+
+        os.remove(self.path)
+
+        logging.info('Recovered %s, %s steps rolled back and %s deletions finished', worker, rolledBack, len(deleted))
+
+        return JournalReport(worker, rolledBack, len(deleted))
+
+    def undo(self, step: JournalStep) -> bool:
+        '''Undoes a step if the disk shows it was done, returns if anything changed'''
+
+        match step.action:
+            case JournalAction.move:
+                # An interrupted copy to another drive
+                if os.path.exists(step.dest + MOVE_PARTIAL_SUFFIX):
+                    shutil.rmtree(step.dest + MOVE_PARTIAL_SUFFIX)
+
+                if os.path.exists(step.dest) and not os.path.exists(step.src):
+                    MoveEngine().move(planMove(step.dest, step.src))
+                    return True
+
+            case JournalAction.link:
+                # A hardlinked copy with no files yet was interrupted while its folders were made
+                if os.path.lexists(step.link) and (isLinked(step.link, step.src) or not any(x for _, _, x in os.walk(step.link))):
+                    unlinkMod(step.link)
+                    return True
+
+            case JournalAction.unlink:
+                if not os.path.lexists(step.link) and os.path.isdir(step.src):
+                    linkMod(step.src, step.link, LinkMode(step.mode))
+                    return True
+
+            case JournalAction.relink:
+                if isLink(step.link) and os.path.realpath(step.link) == os.path.realpath(step.dest):
+                    unlinkMod(step.link)
+                    linkMod(step.src, step.link, LinkMode.symlink)
+                    return True
+
+            case JournalAction.restore:
+                # The restored copy isn't in place yet, the installed copy is put back
+                if os.path.exists(step.src):
+                    shutil.rmtree(step.src)
+
+                    if os.path.isdir(step.link) and not os.path.lexists(step.dest):
+                        os.rename(step.link, step.dest)
+
+                    return True
+
+                # The restored copy is in place, only deleting the old one was left
+                if os.path.isdir(step.link):
+                    if os.path.lexists(step.dest):
+                        shutil.rmtree(step.link)
+                    else:
+                        os.rename(step.link, step.dest)
+
+                    return True
+
+        return False
+
+    def finishDelete(self, step: JournalStep) -> bool:
+        import send2trash
+
+        if step.link and os.path.lexists(step.link) and isLinked(step.link, step.src):
+            unlinkMod(step.link)
+
+        if os.path.isdir(step.src):
+            send2trash.send2trash(step.src)
+
+        return True
@@ -1,21 +1,26 @@
+from __future__ import annotations
+
 import os
+import logging
+from typing import Callable, TYPE_CHECKING
 
 import PySide6.QtGui as qtg
 import PySide6.QtWidgets as qtw
-from PySide6.QtCore import QCoreApplication as qapp, QEvent, Slot
+from PySide6.QtCore import QCoreApplication as qapp, QEvent, QTimer, Slot
 
 from src.manager import ModManager
-from src.tools import ToolManager
-from src.settings import Options
-from src.profiles import modProfile
-from src.widgets.aboutQWidget import About
-from src.widgets.QDialog.newUpdateQDialog import updateDetected
 from src.save import OptionsManager, Save
-from src.api.checkUpdate import checkUpdate
 
 from src.constant_vars import ICON, PROGRAM_NAME, VERSION, MOD_CONFIG, OPTIONS_CONFIG, ROOT_PATH
 from src import errorChecking
 
+# The other tabs are imported when they're built
+if TYPE_CHECKING:
+    from src.tools import ToolManager
+    from src.settings import Options
+    from src.profiles import modProfile
+    from src.widgets.aboutQWidget import About
+
 class MainWindow(qtw.QMainWindow):
     def __init__(self, app: qapp | None = None, savePath = MOD_CONFIG, optionsPath = OPTIONS_CONFIG) -> None:
         super().__init__()
@@ -32,33 +37,79 @@ class MainWindow(qtw.QMainWindow):
 
         self.tab = qtw.QTabWidget(self)
 
-        self.manager = ModManager(savePath, optionsPath)
-        self.profile = modProfile()
+        # The mods are scanned once the window is shown
+        self.manager = ModManager(savePath, optionsPath, refresh=False)
+        self.firstShow: bool = True
+
+        # The other tabs are built the first time they're opened
+        self.profile: modProfile | None = None
+        self.tools: ToolManager | None = None
+        self.options: Options | None = None
+        self.about: About | None = None
+
+        self.pageBuilders: dict[int, Callable[[], qtw.QWidget]] = {
+            1 : self.buildProfile,
+            2 : self.buildTools,
+            3 : self.buildOptions,
+            4 : self.buildAbout
+        }
+
+        self.tab.addTab(self.manager, '')
+
+        for _ in self.pageBuilders:
+            page = qtw.QWidget()
+            pageLayout = qtw.QVBoxLayout(page)
+            pageLayout.setContentsMargins(0, 0, 0, 0)
+            self.tab.addTab(page, '')
+
+        self.tab.currentChanged.connect(self.onTabChanged)
+
+        self.setCentralWidget(self.tab)
+
+        self.applyStaticText()
+
+    @Slot(int)
+    def onTabChanged(self, index: int) -> None:
+        builder: Callable[[], qtw.QWidget] | None = self.pageBuilders.pop(index, None)
+
+        if builder is not None:
+            logging.debug('Building tab %s', index)
+            self.tab.widget(index).layout().addWidget(builder())
+
+    def buildProfile(self) -> modProfile:
+        from src.profiles import modProfile
+
+        self.profile = modProfile(modsTable=self.manager.modsTable)
+        return self.profile
+
+    def buildTools(self) -> ToolManager:
+        from src.tools import ToolManager
+
         self.tools = ToolManager()
+        return self.tools
+
+    def buildOptions(self) -> Options:
+        from src.settings import Options
+
         self.options = Options()
-        self.about = About()
 
         self.options.ignoredMods.ignoredModsListWidget.itemsRemoved.connect(self.manager.modsTable.refreshMods)
         self.options.themeSwitched.connect(self.manager.modsTable.swapIcons)
-        self.options.themeSwitched.connect(self.about.updateIcons)
+        self.options.themeSwitched.connect(self.onThemeSwitched)
+        self.options.optionsApplied.connect(self.manager.modsTable.onOptionsApplied)
 
-        for page in (
-                        (self.manager, ''),
-                        (self.profile, ''),
-                        (self.tools, ''),
-                        (self.options, ''),
-                        (self.about, '')
-                    ):
+        return self.options
 
-            self.tab.addTab(page[0], page[1])
+    def buildAbout(self) -> About:
+        from src.widgets.aboutQWidget import About
 
-        self.setCentralWidget(self.tab)
-
-        self.applyStaticText()
+        self.about = About()
+        return self.about
 
-        if self.optionsManager.getMMMUpdateAlert():
-            self.run_checkUpdate = checkUpdate()
-            self.run_checkUpdate.updateDetected.connect(self.updateDetected)
+    @Slot(str)
+    def onThemeSwitched(self, theme: str) -> None:
+        if self.about is not None:
+            self.about.updateIcons(theme)
 
     def applyStaticText(self) -> None:
         tab: qtw.QTabBar = self.tab.tabBar()
@@ -68,8 +119,18 @@ class MainWindow(qtw.QMainWindow):
         tab.setTabText(3, qapp.translate('MainWindow', 'Options'))
         tab.setTabText(4, qapp.translate('MainWindow', 'About'))
 
+    @Slot()
+    def startUpdateCheck(self) -> None:
+        # QtNetwork is only loaded when it's used
+        from src.api.checkUpdate import checkUpdate
+
+        self.run_checkUpdate = checkUpdate()
+        self.run_checkUpdate.updateDetected.connect(self.updateDetected)
+
     @Slot(str, str)
     def updateDetected(self, latestVersion: str, changelog: str) -> None:
+        from src.widgets.QDialog.newUpdateQDialog import updateDetected
+
         notice = updateDetected(latestVersion, changelog)
         notice.exec()
 
@@ -92,20 +153,36 @@ class MainWindow(qtw.QMainWindow):
             self.manager.modsTable.tagViewer.tagQTable.applyStaticText()
             self.manager.modsTable.tagViewer.contextMenu.applyStaticText()
 
-        self.profile.profileDisplay.applyStaticText()
-        self.profile.profileDisplay.menu.applyStaticText()
+        # Tabs that weren't built yet use the new language when they are
+        if self.profile is not None:
+            self.profile.profileDisplay.applyStaticText()
+            self.profile.profileDisplay.menu.applyStaticText()
+
+        if self.about is not None:
+            self.about.applyStaticText()
+
+        if self.tools is not None:
+            self.tools.applyStaticText()
+            for items in self.tools.toolsWidget.external_tools:
+                items.applyStaticText()
+
+        if self.options is not None:
+            self.options.applyStaticText()
+            self.options.ignoredMods.ignoredModsListWidget.contextMenu.applyStaticText()
+            self.options.optionsGeneral.applyStaticText()
+            self.options.shortcuts.applyStaticText()
+            self.options.optionsMisc.applyStaticText()
 
-        self.about.applyStaticText()
+    def showEvent(self, event: qtg.QShowEvent) -> None:
+        # Scan after the first paint so the window appears right away
+        if self.firstShow:
+            self.firstShow = False
+            QTimer.singleShot(0, self.manager.modsTable.refreshMods)
 
-        self.tools.applyStaticText()
-        for items in self.tools.toolsWidget.external_tools:
-            items.applyStaticText()
+            if self.optionsManager.getMMMUpdateAlert():
+                QTimer.singleShot(0, self.startUpdateCheck)
 
-        self.options.applyStaticText()
-        self.options.ignoredMods.ignoredModsListWidget.contextMenu.applyStaticText()
-        self.options.optionsGeneral.applyStaticText()
-        self.options.shortcuts.applyStaticText()
-        self.options.optionsMisc.applyStaticText()
+        return super().showEvent(event)
 
     def closeEvent(self, event: qtg.QCloseEvent) -> None:
         self.optionsManager.setWindowSize(self.size())
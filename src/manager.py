@@ -2,21 +2,21 @@ import os
 import subprocess
 import logging
 import sys
-from typing import List
 
 import PySide6.QtWidgets as qtw
-from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, Slot
+from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, QTimer, Slot
 import PySide6.QtGui as qtg
 
 from src.widgets.managerQTableWidget import ModListWidget
 from src.widgets.QDialog.announcementQDialog import Notice
 from src.save import Save, OptionsManager
 import src.errorChecking as errorChecking
-from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG
+from src.modSizes import formatSize
+from src.constant_vars import ModType, ModCount, MOD_CONFIG, OPTIONS_CONFIG, SEARCH_DELAY
 
 class ModManager(qtw.QWidget):
 
-    def __init__(self, saveManagerPath = MOD_CONFIG, optionsManagerPath = OPTIONS_CONFIG) -> None:
+    def __init__(self, saveManagerPath = MOD_CONFIG, optionsManagerPath = OPTIONS_CONFIG, refresh: bool = True) -> None:
         super().__init__()
 
         self.setObjectName('manager')
@@ -57,7 +57,9 @@ class ModManager(qtw.QWidget):
 
         self.modsTable = ModListWidget(saveManagerPath, optionsManagerPath)
 
-        self.modsTable.refreshMods()
+        # The main window scans after it's shown
+        if refresh:
+            self.modsTable.refreshMods()
 
         for widget in (self.refresh, self.openGameDir, self.startGame, self.labelFrame, self.search, self.modsTable):
             layout.addWidget(widget)
@@ -68,8 +70,16 @@ class ModManager(qtw.QWidget):
         self.refresh.clicked.connect(self.onRefreshClicked)
         self.openGameDir.clicked.connect(self.onOpenGameDirClicked)
         self.startGame.clicked.connect(self.startPayday)
-        self.search.textChanged.connect(self.modsTable.search)
-        self.modsTable.itemChanged.connect(self.updateModCount)
+
+        # Searches once typing pauses instead of on every keystroke
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(SEARCH_DELAY)
+        self.searchTimer.timeout.connect(self.onSearchTimeout)
+
+        self.search.textChanged.connect(self.searchTimer.start)
+        self.search.returnPressed.connect(self.onSearchTimeout)
+        self.modsTable.modModel.countChanged.connect(self.onCountChanged)
 
         # Shortcuts
         self.selectAllShortCut = qtg.QShortcut(qtg.QKeySequence("Ctrl+A"), self)
@@ -84,6 +94,11 @@ class ModManager(qtw.QWidget):
     def onRefreshClicked(self) -> None:
         self.modsTable.refreshMods(True)
     
+    @Slot()
+    def onSearchTimeout(self) -> None:
+        self.searchTimer.stop()
+        self.modsTable.search(self.search.text())
+
     @Slot()
     def onOpenGameDirClicked(self) -> None:
         errorChecking.startFile(self.optionsManager.getGamepath())
@@ -96,14 +111,31 @@ class ModManager(qtw.QWidget):
     
     @Slot()
     def updateModCount(self) -> None:
-
-        self.totalModsLabel.setText(qapp.translate("ModManager", 'Total Mods') + f': {self.modsTable.rowCount()}')
-
-        self.modsLabel.setText(f'Mods: {self.modsTable.getModTypeCount(ModType.mods)}')
-
-        self.overrideLabel.setText(f'Mod_Overrides: {self.modsTable.getModTypeCount(ModType.mods_override)}')
-
-        self.mapsLabel.setText(f'Maps: {self.modsTable.getModTypeCount(ModType.maps)}')
+        for key in (ModCount.total, ModType.mods, ModType.mods_override, ModType.maps, ModCount.size):
+            self.onCountChanged(key, self.modsTable.modModel.counts[key])
+
+    @Slot(str, 'qint64')
+    def onCountChanged(self, key: str, count: int) -> None:
+        '''Updates the label of the counter that changed'''
+
+        counts: dict[str, int] = self.modsTable.modModel.counts
+
+        match key:
+            case ModCount.total:
+                self.totalModsLabel.setText(qapp.translate("ModManager", 'Total Mods') + f': {count}')
+            case ModType.mods:
+                self.modsLabel.setText(f'Mods: {count}')
+            case ModType.mods_override:
+                self.overrideLabel.setText(f'Mod_Overrides: {count}')
+            case ModType.maps:
+                self.mapsLabel.setText(f'Maps: {count}')
+            case ModCount.enabled | ModCount.disabled | ModCount.ignored | ModCount.size:
+                self.totalModsLabel.setToolTip(
+                    qapp.translate("ModManager", 'Enabled') + f': {counts[ModCount.enabled]}\n' +
+                    qapp.translate("ModManager", 'Disabled') + f': {counts[ModCount.disabled]}\n' +
+                    qapp.translate("ModManager", 'Ignored') + f': {counts[ModCount.ignored]}\n' +
+                    qapp.translate("ModManager", 'Size') + f': {formatSize(counts[ModCount.size])}'
+                )
 
     @Slot()
     def startPayday(self) -> None:
@@ -135,12 +167,9 @@ class ModManager(qtw.QWidget):
 
     @Slot()
     def deselectAllShortcut(self) -> None:
-        selectedItems: List[qtw.QTableWidgetItem] = self.modsTable.selectedItems()
-        if selectedItems:
-            for item in selectedItems:
-                item.setSelected(False)
+        self.modsTable.clearSelection()
 
     def keyPressEvent(self, event: qtg.QKeyEvent) -> None:
-        if event.key() == qt.Key.Key_Delete and self.modsTable.selectedItems():
+        if event.key() == qt.Key.Key_Delete and self.modsTable.selectionModel().hasSelection():
             self.modsTable.deleteItem()
         return super().keyPressEvent(event)
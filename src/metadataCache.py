@@ -0,0 +1,131 @@
+import os
+import logging
+from datetime import date
+from typing import Iterable
+
+from src.JSONParser import JSONParser
+from src.api.api import findModVersion, findModworkshopAssetID
+from src.constant_vars import METADATA_CACHE, MAX_METADATA_CACHE, METADATA_CACHE_MAX_AGE
+
+class MetadataCache(JSONParser):
+    '''
+    Caches the version, modworkshop asset ID and size of each mod on disk
+
+    Entries are keyed by the mod's path and are only reparsed when the
+    mtime or size of the mod's `main.xml` or `mod.txt` changes
+    '''
+
+    file: dict[str, dict] = None
+
+    metadataFiles = ('main.xml', 'mod.txt')
+
+    def __init__(self, path: str = METADATA_CACHE) -> None:
+        logging.getLogger(__name__)
+        super().__init__(path)
+        self.modified = False
+
+    def __str__(self) -> str:
+        return f'{len(self.file)} cached mods' if self.file is not None else 'None'
+
+    def signature(self, modPath: str) -> list[list[int] | None]:
+        '''Returns the `[mtime, size]` of each metadata file, `None` if a file doesn't exist'''
+
+        signature: list[list[int] | None] = []
+
+        for fileName in self.metadataFiles:
+            try:
+                stat: os.stat_result = os.stat(os.path.join(modPath, fileName))
+                signature.append([stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                signature.append(None)
+
+        return signature
+
+    def lookup(self, modPath: str) -> tuple[str, str]:
+        '''
+        Returns the version string and modworkshop asset ID of a mod,
+        parsing the mod's files only if they changed since the last lookup
+        '''
+
+        signature: list[list[int] | None] = self.signature(modPath)
+
+        entry: dict | None = self.file.get(modPath)
+
+        if entry is None or entry.get('signature') != signature:
+            logging.debug('Metadata cache miss for %s', os.path.basename(modPath))
+
+            entry = {
+                'signature' : signature,
+                'version'   : str(findModVersion(modPath)),
+                'assetid'   : findModworkshopAssetID(modPath)
+            }
+
+            self.file[modPath] = entry
+            self.modified = True
+
+        # Day granularity keeps a refresh from dirtying the cache every time
+        today: int = date.today().toordinal()
+        if entry.get('seen') != today:
+            entry['seen'] = today
+            self.modified = True
+
+        return entry['version'], entry['assetid']
+
+    def getSize(self, modPath: str) -> tuple[int | None, int]:
+        '''Returns the folder mtime a mod's size was found at and the size, `(None, 0)` if it isn't cached'''
+
+        size: list[int] | None = self.file.get(modPath, {}).get('size')
+
+        return (size[0], size[1]) if size is not None else (None, 0)
+
+    def setSize(self, modPath: str, mtime: int, size: int) -> None:
+        entry: dict | None = self.file.get(modPath)
+
+        # Sizes are only kept with the metadata of a mod
+        if entry is None or entry.get('size') == [mtime, size]:
+            return
+
+        entry['size'] = [mtime, size]
+        self.modified = True
+
+    def invalidate(self, *modPaths: str) -> None:
+        '''Forces the next lookup of each mod path to reparse the mod'''
+
+        for modPath in modPaths:
+            if self.file.pop(modPath, None) is not None:
+                self.modified = True
+
+    def evict(self, keep: Iterable[str] = ()) -> None:
+        '''
+        Removes entries of mods that haven't been seen in `METADATA_CACHE_MAX_AGE` days,
+        then the least recently seen entries until there are at most `MAX_METADATA_CACHE`
+
+        Paths in `keep` are never evicted
+        '''
+
+        keep = set(keep)
+        oldest: int = date.today().toordinal() - METADATA_CACHE_MAX_AGE
+
+        expired: list[str] = [
+            x for x, entry in self.file.items() if x not in keep and entry.get('seen', 0) < oldest
+        ]
+
+        overflow: int = len(self.file) - len(expired) - MAX_METADATA_CACHE
+
+        if overflow > 0:
+            candidates: list[str] = sorted(
+                (x for x in self.file.keys() if x not in keep and x not in expired),
+                key=lambda x: self.file[x].get('seen', 0)
+            )
+            expired.extend(candidates[:overflow])
+
+        if expired:
+            logging.info('Evicting %s entries from %s', len(expired), os.path.basename(self.path))
+            self.invalidate(*expired)
+
+    def flush(self) -> None:
+        '''Saves the cache only if an entry changed since the last flush'''
+
+        if self.modified:
+            self.saveJSON()
+            self.modified = False
@@ -0,0 +1,104 @@
+import os
+import stat
+import shutil
+import logging
+
+from src.constant_vars import LinkMode
+
+def isLink(path: str) -> bool:
+    '''Returns if `path` is a symlink or a Windows junction'''
+
+    try:
+        st: os.stat_result = os.lstat(path)
+    except OSError:
+        return False
+
+    if stat.S_ISLNK(st.st_mode):
+        return True
+
+    # Junctions are only reported by st_reparse_tag before Python 3.12
+    return os.name == 'nt' and st.st_reparse_tag == stat.IO_REPARSE_TAG_MOUNT_POINT
+
+def sharesFiles(path: str, other: str) -> bool:
+    '''
+    Returns if every file in `path` is a hardlink of the same file in `other`,
+    a copy with a file that was added or replaced isn't only links and can't be removed like one
+    '''
+
+    found: bool = False
+
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                if not os.path.samefile(os.path.join(root, file), os.path.join(other, os.path.relpath(root, path), file)):
+                    return False
+            except OSError:
+                return False
+
+            found = True
+
+    return found
+
+def isLinked(modPath: str, libraryPath: str) -> bool:
+    '''Returns if the mod folder in the game is a link or a hardlinked copy of the one in the library'''
+
+    if isLink(modPath):
+        return True
+
+    return os.path.isdir(modPath) and os.path.isdir(libraryPath) and sharesFiles(modPath, libraryPath)
+
+def linkTree(target: str, link: str) -> None:
+    '''Recreates the folders of `target` in `link` and hardlinks every file, both must be on the same drive'''
+
+    try:
+        for root, dirs, files in os.walk(target):
+            linkRoot: str = os.path.join(link, os.path.relpath(root, target))
+            os.makedirs(linkRoot, exist_ok=True)
+
+            for file in files:
+                os.link(os.path.join(root, file), os.path.join(linkRoot, file))
+
+    except OSError:
+        shutil.rmtree(link, ignore_errors=True)
+        raise
+
+def linkMod(target: str, link: str, mode: LinkMode) -> LinkMode:
+    '''
+    Makes the mod folder `target` appear at `link`, returns the mode that was used
+
+    Symlinks are junctions on Windows since they don't need admin rights.
+    A symlink that can't be made falls back to a hardlinked copy
+    '''
+
+    if mode == LinkMode.symlink:
+        try:
+            if os.name == 'nt':
+                import _winapi
+                _winapi.CreateJunction(target, link)
+            else:
+                os.symlink(target, link, target_is_directory=True)
+
+            logging.info('Linked %s to %s', link, target)
+            return LinkMode.symlink
+
+        except OSError as e:
+            logging.warning('Could not link %s, making a hardlinked copy instead: %s', link, e)
+
+    linkTree(target, link)
+    logging.info('Hardlinked the files of %s into %s', target, link)
+
+    return LinkMode.hardlink
+
+def unlinkMod(link: str) -> None:
+    '''Removes a link or hardlinked copy made by `linkMod()`, the mod in the library is kept'''
+
+    if isLink(link):
+        # Directory links and junctions on Windows are removed like an empty folder
+        if os.name == 'nt':
+            os.rmdir(link)
+        else:
+            os.unlink(link)
+    else:
+        shutil.rmtree(link)
+
+    logging.info('Unlinked %s', link)
@@ -0,0 +1,116 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from src.constant_vars import MODSIGNORE, MOVE_PARTIAL_SUFFIX, MOVE_REPLACED_SUFFIX, ModType
+
+logging.getLogger(__name__)
+
+class ModScan(NamedTuple):
+    '''
+    Mod folders found by `scanModDirs()`
+
+    Disabled mods are listed by the type they were installed as
+    and are also in `disabled`
+    '''
+
+    mod_overrides: list[str]
+    mods: list[str]
+    maps: list[str]
+    disabled: set[str]
+
+    def all(self) -> list[str]:
+        return self.mod_overrides + self.mods + self.maps
+
+def scanDir(path: str, ignore: tuple[str, ...] = ()) -> list[str]:
+    '''
+    Returns the names of the folders inside of `path`
+
+    The type of each entry comes from `os.scandir()` so no extra stat
+    calls are made on most platforms, returns an empty list if `path` doesn't exist.
+    Copies that aren't complete yet or are being replaced end with a suffix and aren't mods
+    '''
+
+    folders: list[str] = []
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    isDir: bool = entry.is_dir()
+                except OSError:
+                    isDir = False
+
+                if isDir and entry.name not in ignore and not entry.name.endswith((MOVE_PARTIAL_SUFFIX, MOVE_REPLACED_SUFFIX)):
+                    folders.append(entry.name)
+                else:
+                    logging.debug('Skipping %s in %s', entry.name, path)
+
+    except FileNotFoundError:
+        logging.error('The path does not exist:\n%s\nSkipping...', path)
+
+    except OSError as e:
+        logging.error('Could not scan %s:\n%s\nSkipping...', path, str(e))
+
+    return folders
+
+def scanModDirs(modsPath: str, mod_overridesPath: str, mapsPath: str, disabledPath: str) -> tuple[list[str], list[str], list[str], list[str]]:
+    '''
+    Scans the three mod roots and the disabled mods folder concurrently
+
+    Returning Indexes:
+    + 0: mods
+    + 1: mod_overrides
+    + 2: Maps
+    + 3: disabled mods
+    '''
+
+    jobs: tuple[tuple[str, tuple[str, ...]], ...] = (
+        (modsPath, MODSIGNORE),
+        (mod_overridesPath, ()),
+        (mapsPath, ()),
+        (disabledPath, ())
+    )
+
+    with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix='scanModDirs') as pool:
+        results: list[list[str]] = list(pool.map(lambda x: scanDir(*x), jobs))
+
+    return tuple(results)
+
+def sortModScan(folders: tuple[list[str], ...], getType: Callable[[str], ModType | None]) -> ModScan:
+    '''
+    Returns a `ModScan` of the folders from `scanModDirs()`,
+    disabled mods are sorted into the type `getType` returns for them
+
+    A mod in the disabled folder that is also in the game folder is
+    linked into the game (`LinkMode`) and counts as enabled
+    '''
+
+    modsFolder, mod_overrideFolder, mapsFolder, disabledModsFolder = folders
+
+    scan = ModScan(list(mod_overrideFolder), list(modsFolder), list(mapsFolder), set())
+
+    enabled: set[str] = set(scan.all())
+
+    typeToList: dict[ModType, list[str]] = {
+        ModType.mods : scan.mods,
+        ModType.mods_override : scan.mod_overrides,
+        ModType.maps : scan.maps
+    }
+
+    for mod in disabledModsFolder:
+
+        if mod in enabled:
+            continue
+
+        modType: ModType | None = getType(mod)
+
+        if modType in typeToList:
+            typeToList[modType].append(mod)
+            scan.disabled.add(mod)
+
+        else:
+            logging.error('%s needs to be installed first before becoming disabled', mod)
+
+    return scan
@@ -0,0 +1,143 @@
+import os
+import logging
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+def dirSize(path: str) -> int:
+    '''Returns the total size of the files in a folder and its subfolders, symlinks aren't followed'''
+
+    total: int = 0
+    folders: list[str] = [path]
+
+    while folders:
+        try:
+            with os.scandir(folders.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            folders.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return total
+
+def folderMtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def formatSize(size: int) -> str:
+    '''Returns a size in bytes as a readable string, ex. `1.5 GB`'''
+
+    value: float = float(size)
+
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024:
+            return f'{value:.0f} {unit}' if unit == 'B' else f'{value:.1f} {unit}'
+        value /= 1024
+
+    return f'{value:.1f} TB'
+
+class SizeSignals(QObject):
+    found = Signal(int, str, str, 'qint64', 'qint64') # Generation, mod, path, mtime, size
+    done = Signal(int)
+
+class SizeTask(QRunnable):
+    '''Walks each mod folder whose mtime differs from the cached one'''
+
+    def __init__(self, generation: int, mods: dict[str, tuple[str, int | None]], isCurrent: Callable[[], bool]) -> None:
+        super().__init__()
+
+        self.generation = generation
+        self.mods = mods
+        self.isCurrent = isCurrent
+
+        # Emitted from the pool's thread
+        self.signals = SizeSignals()
+
+    def run(self) -> None:
+        for mod, (path, cachedMtime) in self.mods.items():
+
+            # A newer scan replaced this one
+            if not self.isCurrent():
+                return
+
+            mtime: int | None = folderMtime(path)
+
+            if mtime is None or mtime == cachedMtime:
+                continue
+
+            self.signals.found.emit(self.generation, mod, path, mtime, dirSize(path))
+
+        self.signals.done.emit(self.generation)
+
+class ModSizeScanner(QObject):
+    '''
+    Finds the size of mods on a background thread
+
+    A size is reused until the mod's folder mtime changes, files
+    changed deeper in a mod can leave its size out of date until then
+    '''
+
+    sizeFound = Signal(str, str, 'qint64', 'qint64') # Mod, path, mtime, size
+    finished = Signal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        logging.getLogger(__name__)
+
+        self.generation: int = 0
+        self.running: int = 0
+
+        # One folder walk at a time keeps the disk from thrashing
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def scan(self, mods: dict[str, tuple[str, int | None]], restart: bool = False) -> None:
+        '''
+        Finds the size of each mod, `mods` is the mod's path and the mtime its size was cached at
+
+        `restart` stops the scans that are still running
+        '''
+
+        if restart:
+            self.generation += 1
+            self.running = 0
+
+        if not mods:
+            return
+
+        generation: int = self.generation
+        task = SizeTask(generation, dict(mods), lambda: self.generation == generation)
+
+        # Queued, the slots run in the scanner's thread
+        task.signals.found.connect(self.__onFound)
+        task.signals.done.connect(self.__onDone)
+
+        self.running += 1
+        self.pool.start(task)
+
+    def wait(self) -> None:
+        '''Blocks until every scan is done'''
+        self.pool.waitForDone()
+
+    @Slot(int, str, str, 'qint64', 'qint64')
+    def __onFound(self, generation: int, mod: str, path: str, mtime: int, size: int) -> None:
+        if generation == self.generation:
+            self.sizeFound.emit(mod, path, mtime, size)
+
+    @Slot(int)
+    def __onDone(self, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self.running = max(0, self.running - 1)
+
+        if self.running == 0:
+            self.finished.emit()
@@ -0,0 +1,206 @@
+import os
+import logging
+from typing import Iterable
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal, Slot
+
+from src.modScanner import scanDir
+
+class ModWatcher(QObject):
+    '''
+    Watches the mod roots and the disabled mods folder for changes
+
+    Changed folders are rescanned after a short delay and diffed against the
+    last known contents, only the mods that changed are reported
+    '''
+
+    modAdded = Signal(str)
+
+    modRemoved = Signal(str)
+
+    modRenamed = Signal(str, str) # Old name, new name
+
+    modMoved = Signal(str) # A mod that moved between watched folders (Enabled, disabled, etc)
+
+    syncStarted = Signal() # Emitted before the changes of a sync are emitted
+
+    syncFinished = Signal()
+
+    def __init__(self, parent: QObject | None = None, delay: int = 250) -> None:
+        super().__init__(parent)
+        logging.getLogger(__name__)
+
+        self.fileWatcher = QFileSystemWatcher(self)
+        self.fileWatcher.directoryChanged.connect(self.onDirectoryChanged)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.sync)
+
+        # Watched folder path -> Folder names to ignore
+        self.roots: dict[str, tuple[str, ...]] = {}
+
+        # Watched folder path -> Mod names last seen in it
+        self.snapshots: dict[str, set[str]] = {}
+
+        # Watched folder path -> (Device, inode) of each mod when it was first seen, a renamed folder keeps them
+        self.identities: dict[str, dict[str, tuple[int, int]]] = {}
+
+        self.pendingRoots: set[str] = set()
+
+    def watch(self, roots: dict[str, tuple[str, ...]]) -> None:
+        '''
+        Replaces the watched folders,
+        `roots` is a dict of each folder path and the folder names to ignore in it
+        '''
+
+        if self.fileWatcher.directories():
+            self.fileWatcher.removePaths(self.fileWatcher.directories())
+
+        self.roots = {os.path.abspath(k):v for k, v in roots.items()}
+        self.snapshots = {k:set() for k in self.roots.keys()}
+        self.identities = {k:{} for k in self.roots.keys()}
+        self.pendingRoots.clear()
+
+        self.__addWatchPaths()
+
+    def setSnapshots(self, snapshots: dict[str, list[str]]) -> None:
+        '''
+        Sets the known contents of each root without emitting anything, used after a full refresh
+
+        Changes already reported in these roots are part of the new contents, so they're dropped
+        and the pending sync is stopped if no other root is waiting for one
+        '''
+
+        for root, mods in snapshots.items():
+            root = os.path.abspath(root)
+
+            if root in self.roots:
+                self.snapshots[root] = set(mods)
+                self.identities[root] = self.identify(root, mods)
+                self.pendingRoots.discard(root)
+
+        if not self.pendingRoots:
+            self.timer.stop()
+
+    @staticmethod
+    def identify(root: str, mods: Iterable[str]) -> dict[str, tuple[int, int]]:
+        '''
+        Returns the (device, inode) of each mod folder, Windows gives its file ID as the inode
+        '''
+
+        identities: dict[str, tuple[int, int]] = {}
+
+        for mod in mods:
+            try:
+                stat: os.stat_result = os.stat(os.path.join(root, mod))
+            except OSError:
+                continue
+
+            identities[mod] = (stat.st_dev, stat.st_ino)
+
+        return identities
+
+    def locate(self, mod: str) -> list[str]:
+        '''Returns the watched folders that the mod was last seen in'''
+        return [root for root, mods in self.snapshots.items() if mod in mods]
+
+    @Slot(str)
+    def onDirectoryChanged(self, path: str) -> None:
+        path = os.path.abspath(path)
+
+        if path in self.roots:
+            self.pendingRoots.add(path)
+            self.timer.start()
+
+    @Slot()
+    def sync(self, force: bool = False) -> None:
+        '''
+        Rescans the folders that changed and emits a signal for each changed mod
+
+        `force` rescans every watched folder even if no change was reported yet
+        '''
+
+        self.timer.stop()
+
+        roots: set[str] = set(self.roots.keys()) if force else set(self.pendingRoots)
+        self.pendingRoots.clear()
+
+        if not roots:
+            return
+
+        added: dict[str, set[str]] = {}
+        removed: dict[str, set[str]] = {}
+
+        before: set[str] = set().union(*self.snapshots.values())
+
+        for root in roots:
+            current: set[str] = set(scanDir(root, self.roots[root]))
+            previous: set[str] = self.snapshots.get(root, set())
+
+            added[root] = current - previous
+            removed[root] = previous - current
+
+            self.snapshots[root] = current
+
+            # Only the new folders are looked at, the ones that left keep their identity until the renames are found
+            identities: dict[str, tuple[int, int]] = self.identities.setdefault(root, {})
+            identities.update(self.identify(root, added[root]))
+
+        after: set[str] = set().union(*self.snapshots.values())
+
+        changed: set[str] = set().union(*added.values(), *removed.values())
+
+        newMods: set[str] = {x for x in changed if x in after and x not in before}
+        goneMods: set[str] = {x for x in changed if x in before and x not in after}
+        movedMods: set[str] = changed - newMods - goneMods
+
+        self.syncStarted.emit()
+
+        # A mod leaving and another appearing in the same folder is a rename if it's the same folder on disk,
+        # an uninstall and an install at the same time are a removal and an addition
+        for root in roots:
+            newInRoot: set[str] = added[root] & newMods
+            goneInRoot: set[str] = removed[root] & goneMods
+
+            identities: dict[str, tuple[int, int]] = self.identities[root]
+
+            if len(newInRoot) == 1 and len(goneInRoot) == 1:
+                oldName: str = next(iter(goneInRoot))
+                newName: str = next(iter(newInRoot))
+
+                if oldName in identities and identities[oldName] == identities.get(newName):
+                    newMods.discard(newName)
+                    goneMods.discard(oldName)
+
+                    logging.info('ModWatcher: %s was renamed to %s', oldName, newName)
+                    self.modRenamed.emit(oldName, newName)
+
+            for mod in removed[root]:
+                identities.pop(mod, None)
+
+        for mod in sorted(goneMods):
+            logging.info('ModWatcher: %s was removed', mod)
+            self.modRemoved.emit(mod)
+
+        for mod in sorted(newMods):
+            logging.info('ModWatcher: %s was added', mod)
+            self.modAdded.emit(mod)
+
+        for mod in sorted(movedMods):
+            logging.debug('ModWatcher: %s was moved', mod)
+            self.modMoved.emit(mod)
+
+        self.syncFinished.emit()
+
+        # Folders that were deleted and recreated are dropped by QFileSystemWatcher
+        self.__addWatchPaths()
+
+    def __addWatchPaths(self) -> None:
+        watched: list[str] = self.fileWatcher.directories()
+
+        paths: list[str] = [x for x in self.roots.keys() if x not in watched and os.path.isdir(x)]
+
+        if paths:
+            self.fileWatcher.addPaths(paths)
@@ -0,0 +1,356 @@
+import io
+import os
+import bz2
+import lzma
+import time
+import zlib
+import shutil
+import struct
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple
+
+from src.constant_vars import BackupCodec, BACKUP_LEVEL, BACKUP_MEMBER_MAX, BACKUP_POOL_MIN, MOVE_CHUNK_SIZE
+
+# Compression method and version needed to extract of each codec in the zip format
+ZIP_METHODS: dict[BackupCodec, tuple[int, int]] = {
+    BackupCodec.store   : (0, 20),
+    BackupCodec.deflate : (8, 20),
+    BackupCodec.bzip2   : (12, 46),
+    BackupCodec.lzma    : (14, 63)
+}
+
+ZIP64_VERSION = 45
+ZIP64_LIMIT = (1 << 31) - 1 # Same as zipfile, some readers treat the 32 bit fields as signed
+ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
+
+# Dictionary size of each lzma preset
+LZMA_DICT_SIZES: tuple[int, ...] = (1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22, 1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26)
+
+class StoreCompressor():
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b''
+
+class LZMACompressor():
+    '''Raw LZMA1 with the header the zip format puts before it, the same as zipfile writes'''
+
+    def __init__(self, level: int) -> None:
+        dictSize: int = LZMA_DICT_SIZES[level]
+
+        self.compressor = lzma.LZMACompressor(lzma.FORMAT_RAW, filters=[{'id' : lzma.FILTER_LZMA1, 'preset' : level, 'dict_size' : dictSize, 'lc' : 3, 'lp' : 0, 'pb' : 2}])
+
+        # Version 9.4 of the LZMA SDK, then the 5 bytes of filter properties
+        self.header: bytes = struct.pack('<BBH', 9, 4, 5) + struct.pack('<BI', (2 * 5 + 0) * 9 + 3, dictSize)
+
+    def compress(self, data: bytes) -> bytes:
+        out: bytes = self.header + self.compressor.compress(data)
+        self.header = b''
+        return out
+
+    def flush(self) -> bytes:
+        out: bytes = self.header + self.compressor.flush()
+        self.header = b''
+        return out
+
+def makeCompressor(codec: BackupCodec, level: int) -> StoreCompressor | LZMACompressor:
+    match codec:
+        case BackupCodec.deflate:
+            return zlib.compressobj(level, zlib.DEFLATED, -15)
+        case BackupCodec.bzip2:
+            return bz2.BZ2Compressor(max(level, 1))
+        case BackupCodec.lzma:
+            return LZMACompressor(level)
+
+    return StoreCompressor()
+
+def compressStream(src: BinaryIO, dest: BinaryIO, codec: BackupCodec, level: int, onBytes: Callable[[int], None] | None = None) -> tuple[int, int, int]:
+    '''Compresses `src` into `dest` in chunks, returns the CRC, size and compressed size'''
+
+    compressor = makeCompressor(codec, level)
+
+    crc: int = 0
+    size: int = 0
+    compressSize: int = 0
+
+    while chunk := src.read(MOVE_CHUNK_SIZE):
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+
+        out: bytes = compressor.compress(chunk)
+        dest.write(out)
+        compressSize += len(out)
+
+        if onBytes is not None:
+            onBytes(len(chunk))
+
+    out = compressor.flush()
+    dest.write(out)
+    compressSize += len(out)
+
+    return crc, size, compressSize
+
+class CompressedFile(NamedTuple):
+    crc: int
+    size: int
+    compressSize: int
+    data: bytes | None # None if it was written to `spillPath`
+    spillPath: str | None
+
+def compressFile(path: str, codec: BackupCodec, level: int, spillPath: str) -> CompressedFile:
+    '''
+    Compresses a file, this runs in the processes of `ParallelCompressor`
+
+    Files bigger than `BACKUP_MEMBER_MAX` are written to `spillPath` instead of being sent back in memory
+    '''
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > BACKUP_MEMBER_MAX:
+            with open(spillPath, 'wb') as out:
+                return CompressedFile(*compressStream(f, out, codec, level), None, spillPath)
+
+        out = io.BytesIO()
+
+        return CompressedFile(*compressStream(f, out, codec, level), out.getvalue(), None)
+
+class ParallelCompressor():
+    '''
+    Compresses files on a pool of processes, results are returned in order
+
+    Only a few files ahead of the one being written are compressed at a time so
+    memory use doesn't grow with the backup. Without processes the files are
+    compressed by `ZipAssembler` while they are written
+    '''
+
+    def __init__(self, codec: BackupCodec, level: int, processes: int, spillPath: str) -> None:
+        self.codec = codec
+        self.level = level
+        self.processes = processes
+        self.spillPath = spillPath
+
+        self.pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> 'ParallelCompressor':
+        if self.processes > 0:
+            # Forking copies Qt's threads in the state they are in, spawn starts clean processes
+            self.pool = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn'))
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def imap(self, paths: Iterable[str]) -> Iterator[CompressedFile | None]:
+        '''
+        Yields each file compressed, or `None` for the files `ZipAssembler` should compress
+
+        That's every file if there are no processes, and files smaller than `BACKUP_POOL_MIN`
+        '''
+
+        if self.pool is None:
+            for _ in paths:
+                yield None
+            return
+
+        paths = iter(paths)
+        pending: deque[Future | None] = deque()
+        inPool: int = 0
+        submitted: int = 0
+
+        def submit(path: str) -> None:
+            nonlocal inPool, submitted
+
+            if os.path.getsize(path) < BACKUP_POOL_MIN:
+                pending.append(None)
+                return
+
+            pending.append(self.pool.submit(compressFile, path, self.codec, self.level, os.path.join(self.spillPath, str(submitted))))
+            inPool += 1
+            submitted += 1
+
+        # Small files don't count, so a run of them doesn't leave the processes waiting
+        for path in paths:
+            submit(path)
+
+            if inPool >= self.processes * 2:
+                break
+
+        while pending:
+            future: Future | None = pending.popleft()
+
+            if future is None:
+                yield None
+                continue
+
+            result: CompressedFile = future.result()
+            inPool -= 1
+
+            while inPool < self.processes * 2 and (path := next(paths, None)) is not None:
+                submit(path)
+
+            yield result
+
+class ZipMember(NamedTuple):
+    name: bytes
+    flags: int
+    method: int
+    version: int
+    dosTime: int
+    dosDate: int
+    crc: int
+    compressSize: int
+    size: int
+    externalAttr: int
+    offset: int
+
+class ZipAssembler():
+    '''
+    Writes a standard zip from files that were compressed somewhere else
+
+    Every member uses the same codec, zip64 records are added when the
+    sizes, offsets or number of members need them
+    '''
+
+    def __init__(self, fp: BinaryIO, codec: BackupCodec = BackupCodec.deflate, level: int = BACKUP_LEVEL) -> None:
+        self.fp = fp
+        self.codec = codec
+        self.level = level
+
+        self.method, self.version = ZIP_METHODS[codec]
+
+        self.members: list[ZipMember] = []
+
+    def memberInfo(self, path: str, arcname: str) -> tuple[bytes, int, int, int, int]:
+        '''Returns the name, flags, time, date and attributes of a member from its file'''
+
+        st: os.stat_result = os.stat(path)
+
+        try:
+            name: bytes = arcname.encode('ascii')
+            flags: int = 0
+        except UnicodeEncodeError:
+            name = arcname.encode('utf-8')
+            flags = 0x800
+
+        dateTime: tuple[int, ...] = time.localtime(st.st_mtime)[:6]
+
+        if dateTime[0] < 1980:
+            dateTime = (1980, 1, 1, 0, 0, 0)
+
+        dosDate: int = (dateTime[0] - 1980) << 9 | dateTime[1] << 5 | dateTime[2]
+        dosTime: int = dateTime[3] << 11 | dateTime[4] << 5 | dateTime[5] // 2
+
+        externalAttr: int = (st.st_mode & 0xFFFF) << 16
+
+        if os.path.isdir(path):
+            externalAttr |= 0x10
+
+        return name, flags, dosTime, dosDate, externalAttr
+
+    def localHeader(self, member: ZipMember, zip64: bool) -> bytes:
+        extra: bytes = b''
+        size, compressSize, version = member.size, member.compressSize, member.version
+
+        if zip64:
+            extra = struct.pack('<HHQQ', 1, 16, size, compressSize)
+            size = compressSize = 0xFFFFFFFF
+            version = max(version, ZIP64_VERSION)
+
+        return struct.pack(
+            '<4s2B4HL2L2H', b'PK\x03\x04', version, 0, member.flags, member.method,
+            member.dosTime, member.dosDate, member.crc, compressSize, size, len(member.name), len(extra)
+        ) + member.name + extra
+
+    def addFolder(self, path: str, arcname: str) -> None:
+        name, flags, dosTime, dosDate, externalAttr = self.memberInfo(path, arcname.rstrip('/') + '/')
+
+        member = ZipMember(name, flags, 0, 20, dosTime, dosDate, 0, 0, 0, externalAttr, self.fp.tell())
+
+        self.fp.write(self.localHeader(member, False))
+        self.members.append(member)
+
+    def addFile(self, path: str, arcname: str, compressed: CompressedFile | None = None, onBytes: Callable[[int], None] | None = None) -> None:
+        '''Writes a file compressed by `compressFile()`, or compresses it while it's written if `compressed` is `None`'''
+
+        name, flags, dosTime, dosDate, externalAttr = self.memberInfo(path, arcname)
+
+        # The end of the data is marked for lzma
+        if self.codec == BackupCodec.lzma:
+            flags |= 0x02
+
+        offset: int = self.fp.tell()
+
+        if compressed is None:
+            size: int = os.path.getsize(path)
+
+            # The header is written again once the sizes are known
+            zip64: bool = size * 1.05 > ZIP64_LIMIT
+            member = ZipMember(name, flags, self.method, self.version, dosTime, dosDate, 0, 0, size, externalAttr, offset)
+            self.fp.write(self.localHeader(member, zip64))
+
+            with open(path, 'rb') as f:
+                crc, size, compressSize = compressStream(f, self.fp, self.codec, self.level, onBytes)
+
+            if not zip64 and (size > ZIP64_LIMIT or compressSize > ZIP64_LIMIT):
+                raise OSError(f'{path} grew while it was being backed up')
+
+            end: int = self.fp.tell()
+            member = member._replace(crc=crc, compressSize=compressSize, size=size)
+
+            self.fp.seek(offset)
+            self.fp.write(self.localHeader(member, zip64))
+            self.fp.seek(end)
+
+        else:
+            member = ZipMember(name, flags, self.method, self.version, dosTime, dosDate, compressed.crc, compressed.compressSize, compressed.size, externalAttr, offset)
+            self.fp.write(self.localHeader(member, compressed.size > ZIP64_LIMIT or compressed.compressSize > ZIP64_LIMIT))
+
+            if compressed.spillPath is None:
+                self.fp.write(compressed.data)
+            else:
+                with open(compressed.spillPath, 'rb') as f:
+                    shutil.copyfileobj(f, self.fp, MOVE_CHUNK_SIZE)
+
+                os.remove(compressed.spillPath)
+
+            if onBytes is not None:
+                onBytes(compressed.size)
+
+        self.members.append(member)
+
+    def close(self) -> None:
+        '''Writes the central directory, the zip is complete after this'''
+
+        createSystem: int = 0 if os.name == 'nt' else 3
+        centralStart: int = self.fp.tell()
+
+        for member in self.members:
+            # Fields that don't fit are moved into the zip64 extra field in this order
+            fields: list[int] = [x for x in (member.size, member.compressSize, member.offset) if x > ZIP64_LIMIT]
+            size, compressSize, offset = (0xFFFFFFFF if x > ZIP64_LIMIT else x for x in (member.size, member.compressSize, member.offset))
+
+            extra: bytes = struct.pack(f'<HH{len(fields)}Q', 1, 8 * len(fields), *fields) if fields else b''
+            version: int = max(member.version, ZIP64_VERSION) if fields else member.version
+
+            self.fp.write(struct.pack(
+                '<4s4B4HL2L5H2L', b'PK\x01\x02', version, createSystem, version, 0, member.flags, member.method,
+                member.dosTime, member.dosDate, member.crc, compressSize, size, len(member.name), len(extra), 0, 0, 0,
+                member.externalAttr, offset
+            ) + member.name + extra)
+
+        centralEnd: int = self.fp.tell()
+        centralSize: int = centralEnd - centralStart
+        count: int = len(self.members)
+
+        if count > ZIP_FILECOUNT_LIMIT or centralStart > ZIP64_LIMIT or centralSize > ZIP64_LIMIT:
+            self.fp.write(struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, ZIP64_VERSION, ZIP64_VERSION, 0, 0, count, count, centralSize, centralStart))
+            self.fp.write(struct.pack('<4sLQL', b'PK\x06\x07', 0, centralEnd, 1))
+
+        self.fp.write(struct.pack(
+            '<4s4H2LH', b'PK\x05\x06', 0, 0, min(count, ZIP_FILECOUNT_LIMIT), min(count, ZIP_FILECOUNT_LIMIT),
+            min(centralSize, 0xFFFFFFFF), min(centralStart, 0xFFFFFFFF), 0
+        ))
@@ -1,11 +1,14 @@
+import sqlite3
+
 from src.JSONParser import JSONParser
+from src.sqliteStore import SQLiteStore
 
 from src.constant_vars import PROFILES_JSON
 
 class ProfileManager(JSONParser):
     file: dict[str:list[str]] = None
     def __init__(self, path: str = PROFILES_JSON) -> None:
-        super().__init__(path)
+        super().__init__(path, table=SQLiteStore.PROFILES)
     
     def __str__(self) -> str:
 
@@ -22,6 +25,17 @@ class ProfileManager(JSONParser):
     def getJSON(self) -> dict[str: list[str]]:
         return self.file
 
+    def profilesWithMod(self, mod: str) -> list[str]:
+        '''Returns the profiles that have `mod`, the database's index is used once every change is saved'''
+
+        if self.usesStore() and self.savedRows is not None and not self.pendingSave:
+            try:
+                return JSONParser.store.profilesWithMod(mod)
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        return [x for x, y in self.file.items() if mod in y]
+
     def addProfile(self, *profiles: str) -> None:
 
         for profile in profiles:
@@ -67,4 +81,4 @@ class ProfileManager(JSONParser):
         
         self.file[profile] = currentMods
 
-        self.saveJSON()
\ No newline at end of file
+        self.saveJSON()
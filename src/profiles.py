@@ -6,24 +6,27 @@ import PySide6.QtWidgets as qtw
 import PySide6.QtGui as qtg
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
-import src.errorChecking as errorChecking
-
 from src.widgets.QDialog.announcementQDialog import Notice
 from src.widgets.progressWidget import ProgressWidget
 from src.widgets.modProfileQTreeWidget import ProfileList
 from src.widgets.managerQTableWidget import ModListWidget
-from src.threaded.moveToDisabledDir import MoveToDisabledDir
-from src.threaded.moveToEnabledDir import MoveToEnabledModDir
-from src.save import Save
+from src.threaded.applyProfile import ApplyProfile, ProfilePlan, planProfile
+from src.modScanner import ModScan, scanModDirs, sortModScan
+from src.getPath import Pathing
+from src.save import Save, OptionsManager
+from src.tracer import span
 
 from src.constant_vars import MOD_CONFIG, PROFILES_JSON
 
 class modProfile(qtw.QWidget):
-    def __init__(self, savePath = MOD_CONFIG, profilePath: str = PROFILES_JSON) -> None:
+    def __init__(self, savePath = MOD_CONFIG, profilePath: str = PROFILES_JSON, modsTable: ModListWidget | None = None) -> None:
         super().__init__()
 
         self.saveManager = Save(savePath)
 
+        # Patched directly after a profile is applied
+        self.modsTable = modsTable
+
         layout = qtw.QVBoxLayout()
 
         self.addProfileButton = qtw.QPushButton(self)
@@ -45,38 +48,40 @@ class modProfile(qtw.QWidget):
     def applyStaticText(self) -> None:
         self.addProfileButton.setText(qapp.translate('modProfile', 'Add Profile'))
 
+    def getMods(self) -> ModScan:
+        '''Scans the mod folders once, through the mods table if there is one so its watcher stays in sync'''
+
+        if self.modsTable is not None:
+            return self.modsTable.getMods()
+
+        p = Pathing()
+        folders: tuple[list[str], ...] = scanModDirs(p.mods(), p.mod_overrides(), p.maps(), OptionsManager.getDispath())
+
+        return sortModScan(folders, self.saveManager.getType)
+
     @Slot(tuple)
+    @span('applyProfile', 'profile')
     def applyMods(self, mods: tuple[str, ...]) -> None:
-        disabledMods: list[str] = [x for x in mods if errorChecking.isInstalled(x)]
-        enabledMods: list[str] = [x for x in self.saveManager.mods() if errorChecking.isInstalled(x) and x not in mods]
-        enableProgressWidget = ProgressWidget(MoveToEnabledModDir(*disabledMods))
-        disableProgressWidget = ProgressWidget(MoveToDisabledDir(*enabledMods))
-
-        notice = Notice('Canceled or something went wrong when applying the mod profile')
+        plan: ProfilePlan = planProfile(mods, self.getMods())
 
-        logging.info('Enabled mods to be disabled:%s\nDisabled mods to be disabled:%s', enabledMods, disabledMods)
-        if enableProgressWidget.exec() != qtw.QDialog.DialogCode.Accepted:
-            notice.exec()
-            return
+        logging.info('Applying a profile, mods to be enabled:%s\nMods to be disabled:%s', plan.toEnable, plan.toDisable)
 
-        if disableProgressWidget.exec() != qtw.QDialog.DialogCode.Accepted:
-            notice.exec()
-            return
+        if plan.toEnable or plan.toDisable:
+            progressWidget = ProgressWidget(ApplyProfile(plan.toEnable, plan.toDisable))
+            accepted: bool = progressWidget.exec() == qtw.QDialog.DialogCode.Accepted
 
-        # Refresh table so it is updated after all of this is done
-        # TODO: Refactor to make this not loop through all widgets
-        widget: ModListWidget
-        for widget in qtw.QApplication.allWidgets():
-            if isinstance(widget, ModListWidget):
-                widget.refreshMods()
-                break
+            # The watcher patches the rows of the mods that were moved, even the ones moved back after a cancel
+            if self.modsTable is not None:
+                self.modsTable.watcher.sync(True)
 
-        notInstalledMods: list[str] = [x for x in mods if not errorChecking.isInstalled(x)]
+            if not accepted:
+                Notice('Canceled or something went wrong when applying the mod profile').exec()
+                return
 
-        if notInstalledMods:
+        if plan.notInstalled:
             notice = Notice(
                 qapp.translate("modProfile", 'The following mods were not applied because they are not installed:') + 
-                f'\n{" ,".join(notInstalledMods)}',
+                f'\n{" ,".join(plan.notInstalled)}',
                 qapp.translate("modProfile", 'Profile: Some mods were not applied')
             )
             notice.exec()
@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import logging
 from typing import TextIO, Sequence
 from configparser import ConfigParser
@@ -6,24 +7,94 @@ from configparser import ConfigParser
 from PySide6.QtCore import QSize
 
 from src.JSONParser import JSONParser
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType, LIGHT, MODS_DISABLED_PATH_DEFAULT, ModKeys, OptionKeys
+from src.sqliteStore import SQLiteStore
+from src.tracer import span
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType, LIGHT, MODS_DISABLED_PATH_DEFAULT, ModKeys, OptionKeys, STORAGE_JSON, LinkMode, BackupCodec, BACKUP_LEVEL
 
 class Save():
-    '''Manages the data of each mod'''
+    '''
+    Manages the data of each mod
 
-    jsonParser: JSONParser = JSONParser(MOD_CONFIG)
+    The data is shared by every instance and is only read again when the file changes on disk
+    '''
+
+    jsonParser: JSONParser = JSONParser(MOD_CONFIG, table=SQLiteStore.MODS)
+
+    dirty: set[str] = set() # Mods changed since the last save
+
+    tagIndex: dict[str, set[str]] = {} # Tag -> Mods that have the tag
+    tagIndexSource: dict | None = None # The data `tagIndex` was built from
 
     def __init__(self, file=MOD_CONFIG) -> None:
-        Save.jsonParser.path = file
-        Save.jsonParser.loadJSON()
+        Save.load(file)
+
+    @staticmethod
+    def load(file: str = MOD_CONFIG) -> None:
+        '''Loads `file` if it isn't loaded yet or if it changed since it was last loaded or saved'''
+
+        if file != Save.jsonParser.path:
+            Save.jsonParser.path = file
+            Save.dirty.clear()
+            Save.jsonParser.loadJSON()
+
+        elif Save.jsonParser.isStale() and Save.jsonParser.exists():
+            logging.info('%s changed on disk, reloading', os.path.basename(file))
+
+            unsaved: dict[str, dict | None] = {x : Save.getMod(x) for x in Save.dirty}
+
+            Save.jsonParser.loadJSON()
+
+            # Keep the changes that haven't been saved yet
+            for mod, data in unsaved.items():
+                if data is None:
+                    Save.jsonParser.file.pop(mod, None)
+                else:
+                    Save.jsonParser.file[mod] = data
 
     @staticmethod
+    @span('Save.saveJSON', 'io')
     def saveJSON() -> None:
         Save.jsonParser.saveJSON()
 
+        # Still dirty until the batch is written
+        if not Save.jsonParser.pendingSave:
+            Save.dirty.clear()
+
+    @staticmethod
+    def beginBatch() -> None:
+        '''Delays `saveJSON()` until `endBatch()` so several changes are written at once'''
+        Save.jsonParser.beginBatch()
+
+    @staticmethod
+    def endBatch() -> None:
+        saving: bool = Save.jsonParser.pendingSave
+
+        Save.jsonParser.endBatch()
+
+        if saving and not Save.jsonParser.pendingSave:
+            Save.dirty.clear()
+
     @staticmethod
     def mods() -> list[str]:
         return list(Save.jsonParser.file.keys())
+
+    @staticmethod
+    def usesStore() -> bool:
+        '''Returns True if lookups can use the indexes of the database, the mods in `dirty` are looked up in memory'''
+        return Save.jsonParser.usesStore() and Save.jsonParser.savedRows is not None
+
+    @staticmethod
+    def modsWhere(key: ModKeys, value: str | bool) -> list[str]:
+        '''Returns the mods that have `key` set to `value`, `key` has to be indexed by `SQLiteStore`'''
+
+        if Save.usesStore():
+            try:
+                saved: list[str] = [x for x in JSONParser.store.modsWhere(key, value) if x not in Save.dirty]
+                return saved + [x for x in Save.dirty if Save.hasMod(x) and Save.getMod(x).get(key) == value]
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        return [x for x, y in Save.jsonParser.file.items() if y.get(key) == value]
     
     @staticmethod
     def hasModOption(mod: str, option: str) -> bool:
@@ -56,6 +127,7 @@ class Save():
                 if not Save.hasMod(mod):
                     logging.info('Adding new mod to %s: %s', MOD_CONFIG, mod)
                     Save.jsonParser.file[mod] = {}
+                    Save.dirty.add(mod)
 
                 Save.setEnabled(mod)
                 Save.setType(mod, arg[1])
@@ -71,6 +143,7 @@ class Save():
     def setEnabled(mod: str, value: bool = True) -> None:
         if Save.hasMod(mod):
             Save.getMod(mod)[ModKeys.enabled.value] = value
+            Save.dirty.add(mod)
 
     @staticmethod
     def getIgnored(mod: str) -> bool:
@@ -84,6 +157,7 @@ class Save():
     def setIgnored(mod: str, value: bool = False) -> None:
         if Save.hasMod(mod):
             Save.getMod(mod)[ModKeys.ignored.value] = value
+            Save.dirty.add(mod)
     
     @staticmethod
     def getType(mod: str) -> ModType | None:
@@ -107,6 +181,7 @@ class Save():
     def setType(mod: str, type: ModType) -> None:
         if Save.hasMod(mod):
             Save.getMod(mod)[ModKeys.type.value] = type
+            Save.dirty.add(mod)
     
     @staticmethod
     def getModworkshopAssetID(mod: str) -> str:
@@ -120,6 +195,7 @@ class Save():
     def setModWorkshopAssetID(mod: str, id: str = '') -> None:
         if Save.hasMod(mod):
             Save.getMod(mod)[ModKeys.modworkshopid.value] = id
+            Save.dirty.add(mod)
     
     @staticmethod
     def getTags(mod: str) -> list[str]:
@@ -130,23 +206,61 @@ class Save():
         else:
             return fallback
     
+    @staticmethod
+    def getTagIndex() -> dict[str, set[str]]:
+        '''Returns the tag -> mods index, it's only rebuilt when the data is loaded again'''
+
+        if Save.tagIndexSource is not Save.jsonParser.file:
+            index: dict[str, set[str]] = {}
+
+            for mod, data in Save.jsonParser.file.items():
+                for tag in data.get(ModKeys.tags.value) or ():
+                    index.setdefault(tag, set()).add(mod)
+
+            Save.tagIndex = index
+            Save.tagIndexSource = Save.jsonParser.file
+
+        return Save.tagIndex
+
     @staticmethod
     def getAllTags() -> list[str]:
-        allTags = set()
-        for mod in Save.mods():
-            if not Save.getTags(mod):
-                continue
-            for tag in Save.getTags(mod):
-                allTags.add(tag)
+        if Save.usesStore():
+            try:
+                saved: list[str] = JSONParser.store.allTags(Save.dirty)
+                return sorted(set(saved).union(*[Save.getTags(x) for x in Save.dirty]))
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        return sorted(Save.getTagIndex().keys())
 
-        return sorted(list(allTags))
+    @staticmethod
+    def modsWithTags(*tags: str) -> set[str]:
+        '''Returns the mods that have every tag'''
+
+        if not tags:
+            return set()
+
+        if Save.usesStore():
+            try:
+                saved: set[str] = set.intersection(*[set(JSONParser.store.modsWithTag(x)) for x in tags]) - Save.dirty
+                return saved | {x for x in Save.dirty if set(tags).issubset(Save.getTags(x))}
+            except sqlite3.Error as e:
+                JSONParser.storeFailed(e)
+
+        index: dict[str, set[str]] = Save.getTagIndex()
+
+        return set.intersection(*[index.get(x, set()) for x in tags])
     
     @staticmethod
     def setTags(tags: Sequence[str], *mods: str) -> None:
+        index: dict[str, set[str]] = Save.getTagIndex()
+
         if not tags:
             for mod in mods:
                 if Save.hasMod(mod):
+                    Save.__unindexTags(index, mod, Save.getTags(mod))
                     Save.getMod(mod)[ModKeys.tags] = None
+                    Save.dirty.add(mod)
             return
 
         for mod in mods:
@@ -161,10 +275,17 @@ class Save():
             logging.info('Setting the tags of %s from %s to %s', mod, currentTags, updatedTags)
 
             Save.getMod(mod)[ModKeys.tags.value] = updatedTags
+            Save.dirty.add(mod)
+
+            for tag in updatedTags:
+                index.setdefault(tag, set()).add(mod)
     
     @staticmethod
     def removeTags(tags: Sequence[str], *mods: str) -> None:
-        logging.info('Removing the tags %s from %')
+        logging.info('Removing the tags %s from %s', tags, ', '.join(mods))
+
+        index: dict[str, set[str]] = Save.getTagIndex()
+
         for mod in mods:
             modTags = Save.getTags(mod)
 
@@ -175,12 +296,32 @@ class Save():
             logging.info('Removing the tags of %s from %s to %s', mod, modTags, updatedTags)
 
             Save.getMod(mod)[ModKeys.tags] = updatedTags
+            Save.dirty.add(mod)
+
+            Save.__unindexTags(index, mod, [x for x in modTags if x in tags])
     
     @staticmethod
     def clearTags() -> None:
         logging.info('CLEARING ALL TAGS')
         for mod in Save.mods():
             Save.getMod(mod)[ModKeys.tags] = None
+            Save.dirty.add(mod)
+
+        Save.tagIndex = {}
+        Save.tagIndexSource = Save.jsonParser.file
+
+    @staticmethod
+    def __unindexTags(index: dict[str, set[str]], mod: str, tags: Sequence[str]) -> None:
+        for tag in tags:
+            mods: set[str] | None = index.get(tag)
+
+            if mods is None:
+                continue
+
+            mods.discard(mod)
+
+            if not mods:
+                index.pop(tag)
 
     @staticmethod
     def removeMods(*mods: str) -> None:
@@ -188,8 +329,28 @@ class Save():
 
         logging.info('Removing mod(s): %s', ', '.join(mods))
 
+        index: dict[str, set[str]] = Save.getTagIndex()
+
         for mod in mods:
+            Save.__unindexTags(index, mod, Save.getTags(mod))
             Save.jsonParser.file.pop(mod, None)
+            Save.dirty.add(mod)
+
+    @staticmethod
+    def renameMod(oldName: str, newName: str) -> None:
+        '''Moves a mod's data to a new name'''
+
+        if Save.hasMod(oldName):
+            logging.info('Renaming mod %s to %s', oldName, newName)
+
+            index: dict[str, set[str]] = Save.getTagIndex()
+
+            for tag in Save.getTags(oldName):
+                index[tag].discard(oldName)
+                index[tag].add(newName)
+
+            Save.jsonParser.file[newName] = Save.jsonParser.file.pop(oldName)
+            Save.dirty.update((oldName, newName))
 
     @staticmethod
     def clearModData() -> None:
@@ -197,15 +358,29 @@ class Save():
 
         logging.info('DELETING ALL MODS FROM %s', MOD_CONFIG)
 
-        Save.jsonParser.file = Save.jsonParser.default
+        Save.dirty.update(Save.mods())
+        Save.jsonParser.file = dict(Save.jsonParser.default)
 
 class OptionsManager():
-    '''Manages Program's Settings'''
+    '''
+    Manages Program's Settings
+
+    The settings are kept in memory and `file` is only read again when it changes on disk
+    '''
 
     config = ConfigParser()
     file = OPTIONS_CONFIG
+    stamp: tuple[int, int, int] | None = None # The file's (mtime, size, inode) when it was last read or written
 
     def __init__(self, file=OPTIONS_CONFIG) -> None:
+        OptionsManager.load(file)
+
+    @staticmethod
+    def load(file: str = OPTIONS_CONFIG) -> None:
+        '''Reads `file` if it isn't the loaded file or if it changed since it was last read or written'''
+
+        if file == OptionsManager.file and OptionsManager.stamp is not None and not OptionsManager.isStale():
+            return
 
         OptionsManager.file = file
 
@@ -221,6 +396,20 @@ class OptionsManager():
 
         if not OptionsManager.config.has_section(OptionKeys.section.value):
             OptionsManager.config.add_section(OptionKeys.section.value)
+
+    @staticmethod
+    def fileStamp() -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(OptionsManager.file)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    @staticmethod
+    def isStale() -> bool:
+        '''Returns True if the file changed on disk since it was last read or written'''
+        return OptionsManager.fileStamp() != OptionsManager.stamp
     
     @staticmethod
     def getList(section: str, option: str, delimiter: str = ',') -> list:
@@ -244,6 +433,7 @@ class OptionsManager():
     @staticmethod
     def read() -> list[str]:
         '''Reads `OptionsManager.file`'''
+        OptionsManager.stamp = OptionsManager.fileStamp()
         return OptionsManager.config.read(OptionsManager.file)
 
     @staticmethod
@@ -252,6 +442,8 @@ class OptionsManager():
             f: TextIO
             OptionsManager.config.write(f)
 
+        OptionsManager.stamp = OptionsManager.fileStamp()
+
         logging.info('%s has been saved', OptionsManager.file)
 
     @staticmethod
@@ -308,3 +500,52 @@ class OptionsManager():
     @staticmethod
     def setLang(lang: str = 'en_US') -> None:
         OptionsManager.config.set(OptionKeys.section.value, OptionKeys.lang.value, lang)
+
+    @staticmethod
+    def getTrace() -> bool:
+        return OptionsManager.config.getboolean(OptionKeys.section.value, OptionKeys.trace.value, fallback=False)
+
+    @staticmethod
+    def setTrace(trace: bool = False) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.trace.value, str(trace))
+
+    @staticmethod
+    def getLinkMode() -> LinkMode:
+        mode: str = OptionsManager.config.get(OptionKeys.section.value, OptionKeys.link_mode.value, fallback=LinkMode.move.value)
+
+        return LinkMode(mode) if mode in LinkMode.__members__ else LinkMode.move
+
+    @staticmethod
+    def setLinkMode(mode: LinkMode = LinkMode.move) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.link_mode.value, mode.value)
+
+    @staticmethod
+    def getBackupCodec() -> BackupCodec:
+        codec: str = OptionsManager.config.get(OptionKeys.section.value, OptionKeys.backup_codec.value, fallback=BackupCodec.deflate.value)
+
+        return BackupCodec(codec) if codec in BackupCodec.__members__ else BackupCodec.deflate
+
+    @staticmethod
+    def setBackupCodec(codec: BackupCodec = BackupCodec.deflate) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_codec.value, codec.value)
+
+    @staticmethod
+    def getBackupLevel() -> int:
+        try:
+            level: int = OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.backup_level.value, fallback=BACKUP_LEVEL)
+        except ValueError:
+            level = BACKUP_LEVEL
+
+        return min(max(level, 0), 9)
+
+    @staticmethod
+    def setBackupLevel(level: int = BACKUP_LEVEL) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_level.value, str(level))
+
+    @staticmethod
+    def getStorage() -> str:
+        return OptionsManager.config.get(OptionKeys.section.value, OptionKeys.storage.value, fallback=STORAGE_JSON)
+
+    @staticmethod
+    def setStorage(storage: str = STORAGE_JSON) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.storage.value, storage)
@@ -0,0 +1,146 @@
+import re
+import logging
+from collections import Counter
+from typing import Iterable
+
+from src.constant_vars import SEARCH_FUZZY_THRESHOLD
+
+SEPERATORS = re.compile(r'[\s_\-.,]+')
+
+def trigrams(text: str) -> set[str]:
+    '''Returns the trigrams of each word in `text`, words are padded so their start and end count'''
+
+    grams: set[str] = set()
+
+    for word in SEPERATORS.split(text.lower()):
+        if not word:
+            continue
+
+        padded: str = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return grams
+
+class SearchIndex():
+    '''
+    Trigram index over mod names, tags and versions
+
+    `search()` ranks exact, prefix and substring matches above fuzzy
+    trigram matches, a query that extends the last one only rechecks
+    the last query's substring matches
+    '''
+
+    def __init__(self) -> None:
+        logging.getLogger(__name__)
+
+        self.names: dict[str, str] = {} # Mod -> Lowercase name
+        self.wordStarts: dict[str, str] = {} # Mod -> Lowercase name with each seperator as a space, starting with a space
+        self.texts: dict[str, str] = {} # Mod -> Lowercase tags and metadata
+        self.trigrams: dict[str, set[str]] = {} # Trigram -> Mods
+
+        self.revision: int = 0 # Increases each time the index changes
+
+        self.lastQuery: str | None = None
+        self.lastMatches: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, mod: str, fields: Iterable[str] = ()) -> None:
+        '''Indexes a mod's name and other searchable text, replacing what it had before'''
+
+        self.remove(mod)
+
+        name: str = mod.lower()
+        text: str = ' '.join(fields).lower()
+
+        self.names[mod] = name
+        self.wordStarts[mod] = ' ' + SEPERATORS.sub(' ', name)
+        self.texts[mod] = text
+
+        for gram in trigrams(f'{name} {text}'):
+            self.trigrams.setdefault(gram, set()).add(mod)
+
+        self.__changed()
+
+    def remove(self, mod: str) -> None:
+        name: str | None = self.names.pop(mod, None)
+
+        if name is None:
+            return
+
+        self.wordStarts.pop(mod)
+
+        for gram in trigrams(f'{name} {self.texts.pop(mod)}'):
+            mods: set[str] | None = self.trigrams.get(gram)
+
+            if mods is not None:
+                mods.discard(mod)
+
+                if not mods:
+                    self.trigrams.pop(gram)
+
+        self.__changed()
+
+    def clear(self) -> None:
+        self.names.clear()
+        self.wordStarts.clear()
+        self.texts.clear()
+        self.trigrams.clear()
+        self.__changed()
+
+    def search(self, query: str) -> dict[str, float]:
+        '''Returns the score of each mod that matches `query`, higher is a better match'''
+
+        query = query.strip().lower()
+
+        if not query:
+            return {x : 0.0 for x in self.names.keys()}
+
+        # Extending the last query can only narrow down its substring matches
+        candidates: Iterable[str] = self.names.keys()
+
+        if self.lastQuery is not None and query.startswith(self.lastQuery):
+            candidates = self.lastMatches
+
+        matches: set[str] = {x for x in candidates if query in self.names[x] or query in self.texts[x]}
+
+        self.lastQuery = query
+        self.lastMatches = matches
+
+        scores: dict[str, float] = {x : self.__rank(query, x) for x in matches}
+
+        # Fuzzy matches for typos, scored below every substring match
+        if len(query) >= 3:
+            queryGrams: set[str] = trigrams(query)
+            counts: Counter = Counter()
+
+            for gram in queryGrams:
+                counts.update(self.trigrams.get(gram, ()))
+
+            for mod, count in counts.items():
+                similarity: float = count / len(queryGrams)
+
+                if mod not in scores and similarity >= SEARCH_FUZZY_THRESHOLD:
+                    scores[mod] = similarity
+
+        return scores
+
+    def __rank(self, query: str, mod: str) -> float:
+        name: str = self.names[mod]
+
+        if name == query:
+            return 5.0
+        elif name.startswith(query):
+            return 4.0
+        elif f' {query}' in self.wordStarts[mod]:
+            return 3.0
+        elif query in name:
+            return 2.0
+
+        # Only the tags or version matched
+        return 1.5
+
+    def __changed(self) -> None:
+        self.revision += 1
+        self.lastQuery = None
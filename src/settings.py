@@ -12,12 +12,9 @@ from src.save import OptionsManager
 from src.getPath import Pathing
 from src.style import StyleManager
 from src.widgets.ignoredModsQListWidget import IgnoredMods
-from src.constant_vars import DARK, LIGHT, OPTIONS_CONFIG, ROOT_PATH, OptionKeys, LANG_FOLDER_PATH
-from src.widgets.QDialog.newUpdateQDialog import updateDetected
+from src.constant_vars import DARK, LIGHT, OPTIONS_CONFIG, ROOT_PATH, OptionKeys, LANG_FOLDER_PATH, LinkMode, BackupCodec, STORAGE_JSON, STORAGE_SQLITE
 from src.widgets.QDialog.announcementQDialog import Notice
 
-from src.api.checkUpdate import checkUpdate
-
 from src import errorChecking
 
 language_string_to_code: dict[str:str] = {
@@ -39,6 +36,8 @@ language_code_to_string: dict = {x:y for y,x in language_string_to_code.items()}
 
 class Options(qtw.QWidget):
     themeSwitched = Signal(str)
+
+    optionsApplied = Signal() # New settings were written to the options file
     def __init__(self, optionsPath = OPTIONS_CONFIG) -> None:
         super().__init__()
 
@@ -214,6 +213,19 @@ class Options(qtw.QWidget):
 
         if self.optionChanged.get(OptionKeys.mmm_update_alert):
             self.optionsManager.setMMMUpdateAlert(self.optionsGeneral.updateAlertCheckbox.isChecked())
+
+        if self.optionChanged.get(OptionKeys.link_mode):
+            self.optionsManager.setLinkMode(LinkMode(self.optionsGeneral.linkMode.currentData()))
+
+        # The database is opened or closed the next time the program starts
+        if self.optionChanged.get(OptionKeys.storage):
+            self.optionsManager.setStorage(self.optionsGeneral.storage.currentData())
+
+        if self.optionChanged.get(OptionKeys.backup_codec):
+            self.optionsManager.setBackupCodec(BackupCodec(self.optionsMisc.backupCodec.currentData()))
+
+        if self.optionChanged.get(OptionKeys.backup_level):
+            self.optionsManager.setBackupLevel(self.optionsMisc.backupLevel.value())
         
         if self.optionChanged.get(OptionKeys.lang):
             app: qtw.QApplication = qtw.QApplication.instance()
@@ -237,6 +249,8 @@ class Options(qtw.QWidget):
 
         self.optionsManager.writeData()
 
+        self.optionsApplied.emit()
+
     @Slot()
     @Slot(bool)
     def cancelChanges(self, reset: bool = False) -> None:
@@ -264,6 +278,18 @@ class Options(qtw.QWidget):
         if self.optionChanged.get(OptionKeys.lang) or reset:
             self.optionsGeneral.language.setCurrentText(language_code_to_string.get(self.optionsManager.getLang()))
 
+        if self.optionChanged.get(OptionKeys.link_mode) or reset:
+            self.optionsGeneral.linkMode.setCurrentIndex(self.optionsGeneral.linkMode.findData(self.optionsManager.getLinkMode().value))
+
+        if self.optionChanged.get(OptionKeys.storage) or reset:
+            self.optionsGeneral.storage.setCurrentIndex(self.optionsGeneral.storage.findData(self.optionsManager.getStorage()))
+
+        if self.optionChanged.get(OptionKeys.backup_codec) or reset:
+            self.optionsMisc.backupCodec.setCurrentIndex(self.optionsMisc.backupCodec.findData(self.optionsManager.getBackupCodec().value))
+
+        if self.optionChanged.get(OptionKeys.backup_level) or reset:
+            self.optionsMisc.backupLevel.setValue(self.optionsManager.getBackupLevel())
+
         self.resetPendingOptions()
 
         self.applyButton.setEnabled(False)
@@ -307,6 +333,20 @@ class OptionsGeneral(OptionsSectionBase):
         self.language.addItems(list(language_string_to_code.keys()))
         self.language.currentTextChanged.connect(self.langChanged)
 
+        self.linkMode = qtw.QComboBox(self)
+        self.linkMode.setEditable(False)
+        self.linkMode.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        for mode in LinkMode:
+            self.linkMode.addItem('', mode.value)
+        self.linkMode.currentIndexChanged.connect(self.linkModeChanged)
+
+        self.storage = qtw.QComboBox(self)
+        self.storage.setEditable(False)
+        self.storage.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        for storage in (STORAGE_JSON, STORAGE_SQLITE):
+            self.storage.addItem('', storage)
+        self.storage.currentIndexChanged.connect(self.storageChanged)
+
         gbLayout = qtw.QHBoxLayout()
 
         self.buttonFrame = qtw.QGroupBox(self)
@@ -350,12 +390,16 @@ class OptionsGeneral(OptionsSectionBase):
         self.gameDirLabel = qtw.QLabel(self)
         self.disabledModDirLabel = qtw.QLabel(self)
         self.LanguageLabel = qtw.QLabel(self)
+        self.linkModeLabel = qtw.QLabel(self)
+        self.storageLabel = qtw.QLabel(self)
 
         # Setting rows for General Sub Section Layout
         for label, widget in (
                                 (self.gameDirLabel, self.gameDir),
                                 (self.disabledModDirLabel, self.disabledModDir),
-                                (self.LanguageLabel, self.language)
+                                (self.LanguageLabel, self.language),
+                                (self.linkModeLabel, self.linkMode),
+                                (self.storageLabel, self.storage)
                               ):
             self.generalLayout.addRow(label, widget)
         
@@ -380,6 +424,17 @@ class OptionsGeneral(OptionsSectionBase):
         self.disabledModDirLabel.setText(qapp.translate("OptionsGeneral", "Disabled Mods Path:"))
         self.LanguageLabel.setText(qapp.translate("OptionsGeneral", "Language:"))
 
+        self.linkModeLabel.setText(qapp.translate("OptionsGeneral", "Enabling Mods:"))
+        self.linkMode.setItemText(0, qapp.translate("OptionsGeneral", "Move folders"))
+        self.linkMode.setItemText(1, qapp.translate("OptionsGeneral", "Link to the disabled mods folder"))
+        self.linkMode.setItemText(2, qapp.translate("OptionsGeneral", "Hardlink files from the disabled mods folder"))
+        self.linkMode.setToolTip(qapp.translate("OptionsGeneral", "Linked mods stay in the disabled mods folder so enabling and disabling them is instant"))
+
+        self.storageLabel.setText(qapp.translate("OptionsGeneral", "Mod Data Storage:"))
+        self.storage.setItemText(0, qapp.translate("OptionsGeneral", "JSON files"))
+        self.storage.setItemText(1, qapp.translate("OptionsGeneral", "SQLite database"))
+        self.storage.setToolTip(qapp.translate("OptionsGeneral", "The database only writes the mods that changed and looks up tags with an index, it's used after Myth Mod Manager restarts"))
+
         self.gbUpdates.setTitle(qapp.translate("OptionsGeneral", "Updates"))
         self.updateAlertCheckbox.setText(qapp.translate("OptionsGeneral", 'Update alerts on startup'))
         self.checkUpdateButton.setText(qapp.translate("OptionsGeneral", "Check for updates"))
@@ -406,12 +461,26 @@ class OptionsGeneral(OptionsSectionBase):
         changed: bool = True if theme != self.optionsManager.getTheme() else False
         self.pendingChanges.emit(OptionKeys.color_theme, changed)
     
+    @Slot(int)
+    def linkModeChanged(self, index: int) -> None:
+        changed: bool = self.linkMode.itemData(index) != self.optionsManager.getLinkMode().value
+        self.pendingChanges.emit(OptionKeys.link_mode, changed)
+    
+    @Slot(int)
+    def storageChanged(self, index: int) -> None:
+        changed: bool = self.storage.itemData(index) != self.optionsManager.getStorage()
+        self.pendingChanges.emit(OptionKeys.storage, changed)
+
     @Slot()
     def setUpdateAlert(self) -> None:
         changed: bool = True if self.updateAlertCheckbox.isChecked() != self.optionsManager.getMMMUpdateAlert() else False
         self.pendingChanges.emit(OptionKeys.mmm_update_alert, changed)
     
     def checkUpdate(self) -> None:
+        # QtNetwork is only loaded when it's used
+        from src.api.checkUpdate import checkUpdate
+        from src.widgets.QDialog.newUpdateQDialog import updateDetected
+
         @Slot(str, str)
         def updateFound(latestVersion: str, changelog: str) -> None:
             notice = updateDetected(latestVersion, changelog)
@@ -488,6 +557,9 @@ class OptionsMisc(OptionsSectionBase):
     def __init__(self, parent: Options = None) -> None:
         super().__init__(parent= parent)
 
+        parent = self.parentWidget()
+        self.optionsManager: OptionsManager = parent.optionsManager
+
         layout = qtw.QVBoxLayout()
         
         self.miscGroup = qtw.QGroupBox(self)
@@ -497,13 +569,40 @@ class OptionsMisc(OptionsSectionBase):
         self.backupMods = qtw.QPushButton(self)
         self.backupMods.clicked.connect(self.startBackupMods)
 
+        self.incrementalBackup = qtw.QPushButton(self)
+        self.incrementalBackup.clicked.connect(self.startIncrementalBackup)
+
+        self.restoreMods = qtw.QPushButton(self)
+        self.restoreMods.clicked.connect(self.startRestoreMods)
+
         self.log = qtw.QPushButton(self)
         self.log.clicked.connect(self.openCrashLogs)
 
         self.modLog = qtw.QPushButton(self)
         self.modLog.clicked.connect(self.openCrashLogBLT)
 
-        for widget in (self.backupMods, self.log, self.modLog):
+        self.backupCodec = qtw.QComboBox(self)
+        self.backupCodec.setEditable(False)
+        self.backupCodec.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        for codec in BackupCodec:
+            self.backupCodec.addItem('', codec.value)
+        self.backupCodec.currentIndexChanged.connect(self.backupCodecChanged)
+
+        self.backupLevel = qtw.QSpinBox(self)
+        self.backupLevel.setRange(0, 9)
+        self.backupLevel.valueChanged.connect(self.backupLevelChanged)
+
+        self.backupCodecLabel = qtw.QLabel(self)
+        self.backupLevelLabel = qtw.QLabel(self)
+
+        backupLayout = qtw.QFormLayout()
+
+        for label, widget in ((self.backupCodecLabel, self.backupCodec), (self.backupLevelLabel, self.backupLevel)):
+            backupLayout.addRow(label, widget)
+
+        miscGroupLayout.addLayout(backupLayout)
+
+        for widget in (self.backupMods, self.incrementalBackup, self.restoreMods, self.log, self.modLog):
             miscGroupLayout.addWidget(widget)
         
         self.miscGroup.setLayout(miscGroupLayout)
@@ -521,12 +620,40 @@ class OptionsMisc(OptionsSectionBase):
         self.backupMods.setText(qapp.translate("OptionsMisc", "Backup Mods"))
         self.backupMods.setToolTip(qapp.translate("OptionsMisc", "Copies and compresses all of your mods to MMM's installation folder"))
 
+        self.backupCodecLabel.setText(qapp.translate("OptionsMisc", "Backup Compression:"))
+        self.backupCodec.setItemText(0, qapp.translate("OptionsMisc", "None (Fastest)"))
+        self.backupCodec.setItemText(1, qapp.translate("OptionsMisc", "Deflate"))
+        self.backupCodec.setItemText(2, qapp.translate("OptionsMisc", "Bzip2"))
+        self.backupCodec.setItemText(3, qapp.translate("OptionsMisc", "LZMA (Smallest)"))
+        self.backupCodec.setToolTip(qapp.translate("OptionsMisc", "How the backup zip is compressed, files are compressed on every core at once"))
+
+        self.backupLevelLabel.setText(qapp.translate("OptionsMisc", "Compression Level:"))
+        self.backupLevel.setToolTip(qapp.translate("OptionsMisc", "Higher levels make a smaller backup but take longer"))
+
+        self.incrementalBackup.setText(qapp.translate("OptionsMisc", "Incremental Backup"))
+        self.incrementalBackup.setToolTip(qapp.translate("OptionsMisc", "Only stores the files that changed since the last backup, the last few backups are kept"))
+
+        self.restoreMods.setText(qapp.translate("OptionsMisc", "Restore Mods..."))
+        self.restoreMods.setToolTip(qapp.translate("OptionsMisc", "Choose mods from a backup zip or an incremental backup to restore, only those mods are extracted"))
+
         self.log.setText(qapp.translate("OptionsMisc", "Open Crash Logs..."))
         self.log.setToolTip(qapp.translate("OptionsMisc", "Opens the crash log directory used by vanilla Payday 2"))
 
         self.modLog.setText(qapp.translate("OptionsMisc", "Open Mod Crash Logs..."))
         self.modLog.setToolTip(qapp.translate("OptionsMisc", "Opens the crash log directory that BLT uses"))
     
+    @Slot(int)
+    def backupCodecChanged(self, index: int) -> None:
+        changed: bool = self.backupCodec.itemData(index) != self.optionsManager.getBackupCodec().value
+        self.pendingChanges.emit(OptionKeys.backup_codec, changed)
+
+        # Stored files have no level
+        self.backupLevel.setEnabled(self.backupCodec.itemData(index) != BackupCodec.store.value)
+
+    @Slot(int)
+    def backupLevelChanged(self, level: int) -> None:
+        self.pendingChanges.emit(OptionKeys.backup_level, level != self.optionsManager.getBackupLevel())
+
     @Slot()
     def openCrashLogBLT(self) -> None:
         modPath = Pathing().mods()
@@ -550,3 +677,48 @@ class OptionsMisc(OptionsSectionBase):
         
         startFileMover = ProgressWidget(BackupMods())
         startFileMover.exec()
+
+    @Slot()
+    def startIncrementalBackup(self) -> None:
+        from src.threaded.incrementalBackup import IncrementalBackup
+
+        startFileMover = ProgressWidget(IncrementalBackup())
+        startFileMover.exec()
+
+    @Slot()
+    def startRestoreMods(self) -> None:
+        import zipfile
+
+        from src.threaded.restoreMods import RestoreMods, saveRestored
+        from src.widgets.QDialog.restoreModsQDialog import SelectRestore
+
+        dialog = qtw.QFileDialog()
+        backupPath: str = dialog.getOpenFileName(
+            self,
+            caption=qapp.translate("OptionsMisc", 'Select a Backup'),
+            dir=f'{BackupMods.bundledFilePath}.zip',
+            filter=qapp.translate("OptionsMisc", 'Backups') + ' (*.zip);;' + qapp.translate("OptionsMisc", 'Incremental backups') + ' (*.json)'
+        )[0]
+
+        if not os.path.isfile(backupPath):
+            return
+
+        try:
+            selectRestore = SelectRestore(backupPath)
+        except (zipfile.BadZipFile, KeyError, ValueError):
+            notice = Notice(
+                qapp.translate("OptionsMisc", 'This file is not a backup'),
+                qapp.translate("OptionsMisc", 'Myth Mod Manager: Could not read the backup')
+            )
+            notice.exec()
+            return
+
+        if selectRestore.exec() and selectRestore.mods:
+            worker = RestoreMods(backupPath, *selectRestore.mods)
+            restored = worker.mods_restored
+
+            startFileMover = ProgressWidget(worker)
+            startFileMover.exec()
+
+            # Saved here, the worker was deleted with its thread
+            saveRestored(restored)
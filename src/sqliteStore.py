@@ -0,0 +1,200 @@
+import os
+import json
+import sqlite3
+import logging
+from datetime import datetime
+from typing import Iterable
+
+from src.constant_vars import DATABASE, ModKeys
+
+class SQLiteStore():
+    '''
+    Stores the data of `JSONParser` files as rows of an SQLite database
+
+    Each top level key of a file is a row in `entries`, only the rows
+    that changed are written. Mod tags and profile mods are copied into
+    their own indexed tables so they can be queried without loading every row,
+    `Save` and `ProfileManager` use these queries while the store is active
+    '''
+
+    MODS = 'mods'
+    PROFILES = 'profiles'
+    TOOLS = 'tools'
+
+    # Mod keys that have an index, the expressions must match the indexes to be used
+    modIndexes: dict[str, str] = {
+        ModKeys.type.value    : "json_extract(value, '$.type')",
+        ModKeys.enabled.value : "json_extract(value, '$.enabled')",
+        ModKeys.ignored.value : "json_extract(value, '$.ignored')"
+    }
+
+    def __init__(self, path: str = DATABASE) -> None:
+        logging.getLogger(__name__)
+
+        self.path = path
+
+        # Workers in other threads only read, saves are done on the thread that opened the store
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+
+        self.createTables()
+
+    @staticmethod
+    def open(path: str = DATABASE) -> 'SQLiteStore | None':
+        '''Returns a new store, `None` if the database could not be opened'''
+
+        try:
+            return SQLiteStore(path)
+        except sqlite3.Error as e:
+            logging.error('Could not open %s, using JSON files instead:\n%s', path, e)
+            return None
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def createTables(self) -> None:
+        with self.connection:
+            self.connection.executescript('''
+                CREATE TABLE IF NOT EXISTS entries (
+                    tbl   TEXT NOT NULL,
+                    key   TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (tbl, key)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS migrations (
+                    tbl      TEXT PRIMARY KEY,
+                    source   TEXT,
+                    migrated TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS mod_tags (
+                    mod TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (mod, tag)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS mod_tags_tag ON mod_tags (tag);
+
+                CREATE TABLE IF NOT EXISTS profile_mods (
+                    profile TEXT NOT NULL,
+                    mod     TEXT NOT NULL,
+                    PRIMARY KEY (profile, mod)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS profile_mods_mod ON profile_mods (mod);
+            ''')
+
+            for key, expression in self.modIndexes.items():
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS mods_{key} ON entries ({expression}) WHERE tbl = '{self.MODS}'"
+                )
+
+    def isMigrated(self, table: str) -> bool:
+        return self.connection.execute('SELECT 1 FROM migrations WHERE tbl = ?', (table, )).fetchone() is not None
+
+    def migrate(self, table: str, jsonPath: str, default: dict) -> None:
+        '''Copies a JSON file into `table`, this is only done once for each table'''
+
+        data: dict = dict(default)
+
+        if os.path.isfile(jsonPath):
+            with open(jsonPath, 'r') as f:
+                try:
+                    data = json.loads(f.read())
+                except json.decoder.JSONDecodeError as e:
+                    logging.error('Could not migrate %s, starting with default data:\n%s', jsonPath, e)
+
+        logging.info('Migrating %s entries from %s to %s', len(data), os.path.basename(jsonPath), self.path)
+
+        with self.connection:
+            self.__write(table, {k : json.dumps(v) for k, v in data.items()}, ())
+            self.connection.execute(
+                'INSERT OR REPLACE INTO migrations VALUES (?, ?, ?)',
+                (table, os.path.abspath(jsonPath), datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def load(self, table: str, jsonPath: str, default: dict) -> dict[str, str]:
+        '''Returns every row of `table` as serialized JSON, migrating `jsonPath` if it's the first load'''
+
+        if not self.isMigrated(table):
+            self.migrate(table, jsonPath, default)
+
+        return dict(self.connection.execute('SELECT key, value FROM entries WHERE tbl = ?', (table, )).fetchall())
+
+    def save(self, table: str, rows: dict[str, str], previous: dict[str, str]) -> int:
+        '''
+        Writes the serialized rows that differ from `previous` in a single transaction,
+        rows in `previous` that aren't in `rows` are deleted
+
+        Returns the amount of rows changed
+        '''
+
+        changed: dict[str, str] = {k : v for k, v in rows.items() if previous.get(k) != v}
+        removed: list[str] = [x for x in previous.keys() if x not in rows]
+
+        if changed or removed:
+            with self.connection:
+                self.__write(table, changed, removed)
+
+        return len(changed) + len(removed)
+
+    def modsWhere(self, key: ModKeys | str, value: str | bool) -> list[str]:
+        '''Returns the mods that have `key` set to `value`, `key` must be indexed'''
+
+        expression: str = self.modIndexes[key]
+
+        rows: list[tuple] = self.connection.execute(
+            f'SELECT key FROM entries WHERE tbl = ? AND {expression} = ?',
+            (self.MODS, value)
+        ).fetchall()
+
+        return [x[0] for x in rows]
+
+    def modsWithTag(self, tag: str) -> list[str]:
+        return [x[0] for x in self.connection.execute('SELECT mod FROM mod_tags WHERE tag = ?', (tag, )).fetchall()]
+
+    def allTags(self, excluding: Iterable[str] = ()) -> list[str]:
+        '''Returns the tags of every mod that isn't in `excluding`'''
+
+        rows: list[tuple] = self.connection.execute(
+            'SELECT DISTINCT tag FROM mod_tags WHERE mod NOT IN (SELECT value FROM json_each(?)) ORDER BY tag',
+            (json.dumps(list(excluding)), )
+        ).fetchall()
+
+        return [x[0] for x in rows]
+
+    def profilesWithMod(self, mod: str) -> list[str]:
+        return [x[0] for x in self.connection.execute('SELECT profile FROM profile_mods WHERE mod = ?', (mod, )).fetchall()]
+
+    def __write(self, table: str, changed: dict[str, str], removed: list[str] | tuple) -> None:
+        '''Must be called inside of a transaction'''
+
+        self.connection.executemany(
+            'INSERT INTO entries VALUES (?, ?, ?) ON CONFLICT (tbl, key) DO UPDATE SET value = excluded.value',
+            [(table, k, v) for k, v in changed.items()]
+        )
+        self.connection.executemany(
+            'DELETE FROM entries WHERE tbl = ? AND key = ?',
+            [(table, x) for x in removed]
+        )
+
+        # Keep the lookup tables in sync
+        if table == self.MODS:
+            self.__writeMembers('mod_tags', 'mod', changed, removed, lambda x: x.get(ModKeys.tags.value) if isinstance(x, dict) else None)
+        elif table == self.PROFILES:
+            self.__writeMembers('profile_mods', 'profile', changed, removed, lambda x: x)
+
+    def __writeMembers(self, name: str, owner: str, changed: dict[str, str], removed: list[str] | tuple, getMembers) -> None:
+        self.connection.executemany(f'DELETE FROM {name} WHERE {owner} = ?', [(x, ) for x in list(changed.keys()) + list(removed)])
+
+        rows: list[tuple[str, str]] = []
+
+        for key, value in changed.items():
+            members = getMembers(json.loads(value))
+
+            if members:
+                rows.extend((key, x) for x in set(members))
+
+        self.connection.executemany(f'INSERT INTO {name} VALUES (?, ?)', rows)
@@ -0,0 +1,49 @@
+from typing import NamedTuple
+
+from PySide6.QtCore import QCoreApplication as qapp, Slot
+
+from src.threaded.modToggler import ModToggler
+from src.modScanner import ModScan
+
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
+
+class ProfilePlan(NamedTuple):
+    '''The least mods that have to move to apply a profile, made by `planProfile()`'''
+
+    toEnable: list[str]
+    toDisable: list[str]
+    notInstalled: list[str] # Mods in the profile that aren't in any mod folder
+
+def planProfile(profileMods: list[str] | tuple[str, ...], scan: ModScan) -> ProfilePlan:
+    '''Diffs the mods of a profile against the mods that are enabled in `scan`'''
+
+    installed: set[str] = set(scan.all())
+    enabled: set[str] = installed - scan.disabled
+    wanted: set[str] = set(profileMods)
+
+    return ProfilePlan(
+        sorted(wanted & scan.disabled),
+        sorted(enabled - wanted),
+        sorted(wanted - installed)
+    )
+
+class ApplyProfile(ModToggler):
+    '''Enables and disables the mods of a `ProfilePlan` as one task, canceling undoes both'''
+
+    def __init__(self, toEnable: list[str], toDisable: list[str], optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
+
+        self.toEnable = toEnable
+        self.toDisable = toDisable
+
+    @Slot()
+    def start(self) -> None:
+        try:
+            if self.toggle(self.toEnable, self.toDisable):
+                self.succeeded.emit()
+
+        except OSError as e:
+            self.error.emit(
+                qapp.translate('ApplyProfile', 'An error was raised while applying the profile') +
+                f':\n{e}'
+            )
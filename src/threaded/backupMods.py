@@ -1,127 +1,151 @@
 import os
-import shutil
 import logging
+import tempfile
+from typing import Iterator
 
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
 from src.threaded.workerQObject import Worker
-from src.constant_vars import ModType, BACKUP_MODS, MODSIGNORE, MOD_CONFIG
+from src.modScanner import scanDir
+from src.parallelZip import ParallelCompressor, ZipAssembler, CompressedFile
+from src.constant_vars import ModType, BackupCodec, BACKUP_MODS, BACKUP_FOLDERS, MODSIGNORE, MOD_CONFIG, MOVE_PARTIAL_SUFFIX
 
 class BackupMods(Worker):
 
+    # The backup is written to this path with .zip added
     bundledFilePath = os.path.join(os.path.abspath(os.curdir), BACKUP_MODS)
 
+    # Processes that compress files at the same time
+    processes: int = os.cpu_count() or 1
+
     @Slot()
     def start(self) -> None:
-            '''Takes all of the mods and compresses them into a zip file, the output is in the exe directory'''
+            '''
+            Takes all of the mods and compresses them into a zip file, the output is in the exe directory
 
-            # Step 1: Gather Options
+            Files are read from where each mod is, enabled or disabled, and compressed on a pool
+            of processes with the backup codec option. The zip is written to a partial file
+            that replaces the old backup once it's complete
+            '''
 
-            disPath: str = self.optionsManager.getDispath()
+            zipPath: str = f'{self.bundledFilePath}.zip'
+            partialPath: str = zipPath + MOVE_PARTIAL_SUFFIX
 
-            # Step 2: Set Paths
+            try:
 
-            modPath: str = self.p.mods()
+                self.progress.setTotal(1)
 
-            mod_overridePath: str = self.p.mod_overrides()
+                self.progress.advance(1, qapp.translate('BackupMods', 'Finding the files of each mod'))
 
-            maps_path: str = self.p.maps()
+                # Mod -> (Path, Path in the zip) of each folder and file
+                modFiles: dict[str, tuple[list[tuple[str, str]], list[tuple[str, str]]]] = {
+                    mod : self.findFiles(src, f'{BACKUP_FOLDERS[modType]}/{mod}') for mod, (modType, src) in self.gatherMods().items()
+                }
 
-            bundledModsPath: str = os.path.join(self.bundledFilePath, 'mods')
+                self.progress.setTotal(len(modFiles))
+                self.progress.setBytes(sum(os.path.getsize(path) for _, files in modFiles.values() for path, _ in files))
 
-            bundledOverridePath: str = os.path.join(self.bundledFilePath, 'assets', 'mod_overrides')
+                zipping: str = qapp.translate('BackupMods', 'Zipping')
 
-            bundledMapsPath: str = os.path.join(self.bundledFilePath, 'Maps')
+                codec: BackupCodec = self.optionsManager.getBackupCodec()
+                level: int = self.optionsManager.getBackupLevel()
 
-            outputPathDict: dict[ModType, str] = {ModType.mods_override : bundledOverridePath, ModType.mods : bundledModsPath, ModType.maps : bundledMapsPath}
+                # Stored files aren't worth sending to another process
+                processes: int = self.processes if codec != BackupCodec.store else 0
 
-            srcPathDict: dict[ModType, str] = {ModType.mods_override : mod_overridePath, ModType.mods : modPath, ModType.maps : maps_path}
+                logging.info('Backing up with %s level %s on %s processes', codec, level, processes)
 
-            try:
+                with (
+                    open(partialPath, 'wb') as f,
+                    tempfile.TemporaryDirectory(dir=os.path.dirname(partialPath)) as spillPath,
+                    ParallelCompressor(codec, level, processes, spillPath) as compressor
+                ):
+                    archive = ZipAssembler(f, codec, level)
 
-                # Step 4: Create Folders
+                    compressed: Iterator[CompressedFile | None] = compressor.imap(path for _, files in modFiles.values() for path, _ in files)
 
-                # Every mod
-                mods = list([x for x in os.listdir(modPath) if x not in MODSIGNORE] + os.listdir(mod_overridePath) + os.listdir(disPath) + os.listdir(maps_path))
+                    for mod, (folders, files) in modFiles.items():
 
-                self.setTotalProgress.emit(len(mods) + 3)
+                        self.progress.advance(1, f'{zipping} {mod}')
 
-                self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Validating backup folder paths'))
+                        for path, arcname in folders:
+                            archive.addFolder(path, arcname)
 
-                # Creating backup environment
-                for path in (self.bundledFilePath, bundledModsPath, bundledMapsPath):
+                        for path, arcname in files:
+                            archive.addFile(path, arcname, next(compressed), self.progress.addBytes)
 
-                    if not os.path.isdir(path):
+                            if self.isCanceled():
+                                break
 
-                        os.mkdir(path)
+                        if self.isCanceled():
+                            break
 
-                # Because this dir is a nested one, needs os.makedirs unlike the others
-                if not os.path.isdir(bundledOverridePath):
+                    archive.close()
 
-                    os.makedirs(bundledOverridePath)
+                # Removes the partial zip
+                if self.isCanceled():
+                    self.cancelCheck()
+                    return
 
-                # Step 5: Copy each mod into the backup folder
-                for mod in (x for x in mods):
+                os.replace(partialPath, zipPath)
 
-                    self.setCurrentProgress.emit(1,
-                        qapp.translate('BackupMods', 'Copying') +
-                        f' {mod} ' +
-                        qapp.translate('BackupMods', 'to') +
-                        f' {BACKUP_MODS}'
-                    )
+                logging.info('Backed up %s mods to %s', len(modFiles), zipPath)
 
-                    modType: ModType | None = self.saveManager.getType(mod)
+                self.succeeded.emit()
 
-                    # In the case this file is not a mod
-                    if modType is None:
-                        logging.warning('File %s is not a mod or does not have an entry in %s. Skipping...', mod, MOD_CONFIG)
-                        continue
+            except Exception as e:
+                self.onCancel()
 
-                    # If the mod is disabled then the src will go to the disabled mods directory
-                    src: str = os.path.join(srcPathDict[modType], mod) if self.saveManager.getEnabled(mod) else os.path.join(disPath, mod)
+                self.error.emit(
+                    qapp.translate('BackupMods', 'An error was raised while backing up mods') +
+                    f':\n{e}'
+                )
 
-                    output: str = os.path.join(outputPathDict[modType], mod)
+    def gatherMods(self) -> dict[str, tuple[ModType, str]]:
+        '''Returns the type and folder of every mod, disabled mods are read from the disabled mods folder'''
 
-                    # shutil.copytree() can't overwrite files, so if it already exists it must be deleted first
-                    if os.path.exists(output):
+        disPath: str = self.optionsManager.getDispath()
 
-                        logging.info('%s already exists within the backup, overwriting...', mod)
+        srcPathDict: dict[ModType, str] = {ModType.mods_override : self.p.mod_overrides(), ModType.mods : self.p.mods(), ModType.maps : self.p.maps()}
 
-                        shutil.rmtree(output)
+        # Every mod, linked mods are in the game folder and the disabled mods folder
+        mods: list[str] = list(dict.fromkeys(
+            scanDir(srcPathDict[ModType.mods], MODSIGNORE) + scanDir(srcPathDict[ModType.mods_override]) + scanDir(disPath) + scanDir(srcPathDict[ModType.maps])
+        ))
 
-                    shutil.copytree(src, output)
-                    self.cancelCheck()
-                    self.rest()
-                
-                self.cancelCheck()
-
-                # Step 6: Zip Backup folder
-                self.setCurrentProgress.emit(1,
-                    qapp.translate('BackupMods', 'Zipping to') +
-                    f' {self.bundledFilePath}\n' +
-                    qapp.translate('BackupMods', 'This might take some time...')
-                )
+        found: dict[str, tuple[ModType, str]] = {}
 
-                # This should overwrite if it already exists
-                shutil.make_archive(BACKUP_MODS, 'zip', self.bundledFilePath)
+        for mod in mods:
 
-                # Step 7: Cleanup
+            modType: ModType | None = self.saveManager.getType(mod)
 
-                self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Cleanup'))
+            # In the case this file is not a mod
+            if modType is None:
+                logging.warning('File %s is not a mod or does not have an entry in %s. Skipping...', mod, MOD_CONFIG)
+                continue
 
-                # Delete Folder
-                shutil.rmtree(self.bundledFilePath)
+            # If the mod is disabled then the src will go to the disabled mods directory
+            found[mod] = (modType, os.path.join(srcPathDict[modType], mod) if self.saveManager.getEnabled(mod) else os.path.join(disPath, mod))
 
-                self.succeeded.emit()
+        return found
 
-            except Exception as e:
-                self.onCancel()
+    def findFiles(self, src: str, arcname: str) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        '''Returns the folders and files in a mod with their paths in the zip'''
 
-                self.error.emit(
-                    qapp.translate('BackupMods', 'An error was raised while backing up mods') +
-                    f':\n{e}'
-                )
+        folders: list[tuple[str, str]] = []
+        files: list[tuple[str, str]] = []
+
+        for root, _, names in os.walk(src):
+            relative: str = os.path.relpath(root, src).replace(os.sep, '/')
+            archiveRoot: str = arcname if relative == '.' else f'{arcname}/{relative}'
+
+            folders.append((root, archiveRoot))
+            files.extend((os.path.join(root, x), f'{archiveRoot}/{x}') for x in names)
+
+        return folders, files
 
     def onCancel(self) -> None:
-        if os.path.exists(self.bundledFilePath):
-            shutil.rmtree(self.bundledFilePath)
\ No newline at end of file
+        partialPath: str = f'{self.bundledFilePath}.zip' + MOVE_PARTIAL_SUFFIX
+
+        if os.path.exists(partialPath):
+            os.remove(partialPath)
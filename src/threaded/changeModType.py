@@ -5,11 +5,11 @@ from PySide6.QtCore import QCoreApplication as qapp, Slot
 
 import src.errorChecking as errorChecking
 from src.threaded.workerQObject import Worker
-from src.constant_vars import ModType
+from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG
 
 class ChangeModType(Worker):
-    def __init__(self, *mods: tuple[str, ModType]) -> None:
-        super().__init__()
+    def __init__(self, *mods: tuple[str, ModType], optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
         logging.getLogger(__name__)
 
         self.mods: tuple[tuple[str, ModType], ...] = mods
@@ -21,37 +21,31 @@ class ChangeModType(Worker):
         Moves the mod to a new directory
         '''
 
-        self.setTotalProgress.emit(len(self.mods))
+        moves: list[tuple[str, str]] = []
 
-        ChosenDir = None
-        
-        for mod in self.mods:
-
-            modsDirPath: str = mod[0]
-            ChosenDir: ModType = mod[1]
-
-            mod: str = os.path.basename(modsDirPath)
-
-            self.setCurrentProgress.emit(1, qapp.translate('ChangeModType', 'Installing') + f' {mod}')
+        for modsDirPath, ChosenDir in self.mods:
 
             # Setting the Destination path
             if errorChecking.isTypeMod(ChosenDir):
+                moves.append((modsDirPath, self.p.mod(ChosenDir, os.path.basename(modsDirPath))))
+
+        self.progress.setTotal(len(moves))
+
+        for plan in self.planMoves(moves):
 
-                modDestPath: list[str] | str = self.p.mod(ChosenDir, mod)
+            self.progress.advance(1, qapp.translate('ChangeModType', 'Installing') + f' {os.path.basename(plan.src)}')
 
-                self.move(modsDirPath, modDestPath)
-                self.mods_moved.append((modsDirPath, modDestPath))
+            if self.move(plan.src, plan.dest, plan):
+                self.mods_moved.append((plan.src, plan.dest))
 
             self.cancelCheck()
-            self.rest()
 
         
         self.succeeded.emit()
     
     def onCancel(self) -> None:
-        self.setTotalProgress.emit(len(self.mods_moved))
+        self.progress.setTotal(len(self.mods_moved))
         for modPaths in self.mods_moved:
-            self.setCurrentProgress.emit(1, qapp.translate('ChangeModType', 'Uninstalling') + f' {os.path.basename(modPaths[0])}')
+            self.progress.advance(1, qapp.translate('ChangeModType', 'Uninstalling') + f' {os.path.basename(modPaths[0])}')
             self.move(modPaths[1], modPaths[0])
-            self.rest()
 
@@ -3,11 +3,11 @@ import os
 
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
-import send2trash
-
 from src.threaded.workerQObject import Worker
+from src.modLinks import isLinked, unlinkMod
+from src.journal import JournalStep
 
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType, JournalAction
 
 class DeleteMod(Worker):
     def __init__(self, *mods: str, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
@@ -19,32 +19,51 @@ class DeleteMod(Worker):
     def start(self) -> None:
         '''Removes the mod(s) from the user's computer'''
 
+        import send2trash
+
         logging.info('Deleting mods from computer: %s', ', '.join(self.mods))
 
-        self.setTotalProgress.emit(len(self.mods))
+        self.progress.setTotal(len(self.mods))
 
         disPath: str = self.optionsManager.getDispath()
 
         try: 
-            for modName in self.mods:
+            steps: list[JournalStep] = []
 
-                self.setCurrentProgress.emit(1, qapp.translate('DeleteMod', 'Deleting') + f'{modName}')
+            for modName in self.mods:
 
                 enabled: bool = self.saveManager.getEnabled(modName)
 
                 type: ModType | str | None = self.saveManager.getType(modName) if enabled else 'disabled'
 
+                path: list[str] | str = self.p.mod(type, modName) if type != 'disabled' else os.path.join(disPath, modName)
+
+                # A linked mod is removed from the game folder and its files are in the disabled mods folder
+                libraryPath: str = os.path.join(disPath, modName)
+
+                if type != 'disabled' and isLinked(path, libraryPath):
+                    steps.append(JournalStep(JournalAction.delete, libraryPath, link=path))
+                else:
+                    steps.append(JournalStep(JournalAction.delete, path))
+
+            # Deletions are finished on the next start if the program closes halfway
+            self.journal.plan(*steps)
+
+            for modName, step in zip(self.mods, steps):
+
+                self.progress.advance(1, qapp.translate('DeleteMod', 'Deleting') + f'{modName}')
+
                 self.saveManager.removeMods(modName)
 
-                path: list[str] | str = self.p.mod(type, modName) if type != 'disabled' else disPath
+                if step.link:
+                    unlinkMod(step.link)
 
-                if os.path.isdir(path):
-                    send2trash.send2trash(path)
+                if os.path.isdir(step.src):
+                    send2trash.send2trash(step.src)
                 else:
-                    logging.error('An error was raised in FileMover.deleteMod(), %s path does not exist:\n%s', os.path.basename(path), path)
+                    logging.error('An error was raised in FileMover.deleteMod(), %s path does not exist:\n%s', os.path.basename(step.src), step.src)
 
                 self.cancelCheck()
-                self.rest()
 
             self.succeeded.emit()
 
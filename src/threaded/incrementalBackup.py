@@ -0,0 +1,97 @@
+import os
+import logging
+from typing import Any
+
+from PySide6.QtCore import QCoreApplication as qapp, Slot
+
+from src.threaded.backupMods import BackupMods
+from src.backupStore import BackupStore
+from src.constant_vars import BACKUP_STORE, BACKUP_GENERATIONS
+
+class IncrementalBackup(BackupMods):
+    '''
+    Backs up every mod into a `BackupStore`
+
+    Files with the same size and modified time as in the last backup
+    aren't read again, so only the mods that changed are copied
+    '''
+
+    storePath = os.path.join(os.path.abspath(os.curdir), BACKUP_STORE)
+
+    generations: int = BACKUP_GENERATIONS
+
+    @Slot()
+    def start(self) -> None:
+        store = BackupStore(self.storePath)
+
+        try:
+            self.progress.setTotal(1)
+
+            self.progress.advance(1, qapp.translate('IncrementalBackup', 'Finding the files that changed'))
+
+            latest: dict[str, Any] | None = store.latestManifest()
+            previous: dict[str, dict[str, Any]] = latest['mods'] if latest is not None else {}
+
+            mods: dict[str, dict[str, Any]] = {}
+
+            # Files that have to be read, (Mod, Path in the mod, Path)
+            changed: list[tuple[str, str, str]] = []
+            changedBytes: int = 0
+
+            for mod, (modType, src) in self.gatherMods().items():
+
+                oldFiles: dict[str, list] = previous.get(mod, {}).get('files', {})
+
+                folders, files = self.findFiles(src, '')
+
+                mods[mod] = {
+                    'type' : modType,
+                    'enabled' : self.saveManager.getEnabled(mod),
+                    'folders' : [x.lstrip('/') for _, x in folders],
+                    'files' : {}
+                }
+
+                for path, relative in files:
+                    relative = relative.lstrip('/')
+                    stat: os.stat_result = os.stat(path)
+
+                    old: list | None = oldFiles.get(relative)
+
+                    if old is not None and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+                        mods[mod]['files'][relative] = old
+                    else:
+                        mods[mod]['files'][relative] = [stat.st_size, stat.st_mtime_ns, []]
+                        changed.append((mod, relative, path))
+                        changedBytes += stat.st_size
+
+            logging.info('Backing up %s mods, %s files changed since the last backup', len(mods), len(changed))
+
+            self.progress.setTotal(len(changed))
+            self.progress.setBytes(changedBytes)
+
+            storing: str = qapp.translate('IncrementalBackup', 'Storing')
+
+            for mod, relative, path in changed:
+
+                self.progress.advance(1, f'{storing} {mod}')
+
+                mods[mod]['files'][relative][2] = store.storeFile(path, self.progress.addBytes)
+
+                # The chunks stored so far are deleted by the next prune
+                if self.isCanceled():
+                    self.cancelCheck()
+                    return
+
+            store.saveManifest(mods)
+            store.prune(self.generations)
+
+            self.succeeded.emit()
+
+        except Exception as e:
+            self.error.emit(
+                qapp.translate('BackupMods', 'An error was raised while backing up mods') +
+                f':\n{e}'
+            )
+
+    def onCancel(self) -> None:
+        ...
@@ -0,0 +1,176 @@
+import os
+import logging
+
+from PySide6.QtCore import QCoreApplication as qapp
+
+from src.threaded.workerQObject import Worker
+from src.threaded.moveEngine import MovePlan
+from src.modLinks import isLink, isLinked, linkMod, unlinkMod
+from src.journal import JournalStep
+
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, LinkMode, JournalAction
+
+class ModToggler(Worker):
+    '''
+    Base of the workers that enable and disable mods
+
+    `toggle()` finds what has to happen to every mod first, then unlinks,
+    links and moves them with one progress count. Canceling undoes
+    every step that was done, for both the enabled and disabled mods
+    '''
+
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
+
+        self.mods_moved: list[tuple[str, str]] = []
+        self.mods_linked: list[str] = []
+        self.mods_unlinked: list[tuple[str, str, LinkMode]] = []
+
+    def gatherEnabled(self, mods: tuple[str, ...] | list[str]) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        '''Returns the moves and links that return the mods to their respective directory'''
+
+        disabledModsPath: str = self.optionsManager.getDispath()
+        linkMode: LinkMode = self.optionsManager.getLinkMode()
+
+        moves: list[tuple[str, str]] = []
+        links: list[tuple[str, str]] = []
+
+        for mod in mods:
+
+            modPath: str = os.path.join(disabledModsPath, mod)
+
+            if not os.path.isdir(modPath):
+                logging.warning('%s was not found in:\n%s\nIgnoring...', mod, disabledModsPath)
+                continue
+
+            modDestPath: list[str] | str = self.p.mod(self.saveManager.getType(mod), mod)
+
+            # A mod linked with another link mode is already enabled
+            if isLinked(modDestPath, modPath):
+                logging.info('%s is already linked into the game folder', mod)
+            elif linkMode == LinkMode.move:
+                moves.append((modPath, modDestPath))
+            elif os.path.lexists(modDestPath):
+                logging.info('%s is already in the game folder', mod)
+            else:
+                links.append((modPath, modDestPath))
+
+        return moves, links
+
+    def gatherDisabled(self, mods: tuple[str, ...] | list[str]) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        '''Returns the moves to the disabled folder and the links to remove for the mods'''
+
+        disabledModsPath: str = self.optionsManager.getDispath()
+
+        moves: list[tuple[str, str]] = []
+        unlinks: list[tuple[str, str]] = []
+
+        for mod in mods:
+
+            modDest: str = os.path.join(disabledModsPath, mod)
+            modPath: list[str] | str = self.p.mod(self.saveManager.getType(mod), mod)
+
+            # Linked mods are still in the disabled mods folder, whatever the link mode is now
+            if isLinked(modPath, modDest):
+                unlinks.append((modDest, modPath))
+
+            # Checking if the mod is already in the disabled mods folder
+            elif not os.path.isdir(modDest):
+                moves.append((modPath, modDest))
+            else:
+                logging.info('%s is already in the disabled directory', mod)
+
+        return moves, unlinks
+
+    def toggle(self, enable: tuple[str, ...] | list[str] = (), disable: tuple[str, ...] | list[str] = ()) -> bool:
+        '''
+        Enables and disables mods in one pass, the mods being disabled go first to free their folders
+
+        Returns False if it was canceled, every step is undone by then
+        '''
+
+        disableMoves, unlinks = self.gatherDisabled(disable)
+        enableMoves, links = self.gatherEnabled(enable)
+
+        self.progress.setTotal(len(disableMoves) + len(unlinks) + len(enableMoves) + len(links))
+
+        enableMode: LinkMode = self.optionsManager.getLinkMode()
+
+        self.journal.plan(
+            *[JournalStep(JournalAction.unlink, x, link=y, mode=LinkMode.symlink if isLink(y) else LinkMode.hardlink) for x, y in unlinks],
+            *[JournalStep(JournalAction.link, x, link=y, mode=enableMode) for x, y in links]
+        )
+
+        enabling: str = qapp.translate('MoveToEnabledModDir', 'Enabling')
+        disabling: str = qapp.translate('MoveToDisabledDir', 'Disabling')
+
+        for target, link in unlinks:
+
+            self.progress.advance(1, f'{disabling} {os.path.basename(target)}')
+
+            linkMode: LinkMode = LinkMode.symlink if isLink(link) else LinkMode.hardlink
+
+            unlinkMod(link)
+            self.mods_unlinked.append((target, link, linkMode))
+
+            if self.canceled():
+                return False
+
+        for target, link in links:
+
+            self.progress.advance(1, f'{enabling} {os.path.basename(target)}')
+
+            if self.link(target, link) is not None:
+                self.mods_linked.append(link)
+            else:
+                # Hardlinks can't be made on another drive
+                enableMoves.append((target, link))
+                self.progress.addTotal(1)
+
+            if self.canceled():
+                return False
+
+        plans: list[MovePlan] = self.planMoves(disableMoves + enableMoves)
+
+        for i, plan in enumerate(plans):
+
+            self.progress.advance(1, f'{disabling if i < len(disableMoves) else enabling} {os.path.basename(plan.src)}')
+
+            if self.move(plan.src, plan.dest, plan):
+                self.mods_moved.append((plan.src, plan.dest))
+
+            if self.canceled():
+                return False
+
+        return True
+
+    def canceled(self) -> bool:
+        '''Undoes every step done so far and returns True if the worker was canceled'''
+
+        if not self.isCanceled():
+            return False
+
+        self.cancelCheck()
+        return True
+
+    def onCancel(self) -> None:
+        self.progress.setTotal(len(self.mods_moved) + len(self.mods_linked) + len(self.mods_unlinked))
+
+        moving: str = qapp.translate('ModToggler', 'Moving')
+
+        for link in self.mods_linked:
+            self.progress.advance(1, f'{moving} {os.path.basename(link)}')
+            unlinkMod(link)
+
+        for target, link, linkMode in self.mods_unlinked:
+            self.progress.advance(1, f'{moving} {os.path.basename(target)}')
+            linkMod(target, link, linkMode)
+
+        for modPaths in self.mods_moved:
+            self.progress.advance(1, f'{moving} {os.path.basename(modPaths[0])}')
+            self.move(modPaths[1], modPaths[0])
+
+        # Everything was undone, a second cancel has nothing left to undo
+        self.mods_moved.clear()
+        self.mods_linked.clear()
+        self.mods_unlinked.clear()
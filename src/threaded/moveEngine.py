@@ -0,0 +1,214 @@
+import os
+import stat
+import errno
+import shutil
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from src.modSizes import dirSize, formatSize
+from src.threaded.progressChannel import ProgressChannel
+from src.constant_vars import MOVE_COPY_THREADS, MOVE_CHUNK_SIZE, MOVE_PARTIAL_SUFFIX
+
+class MoveCanceled(Exception):
+    '''Raised by `MoveEngine` when a copy is canceled, the source is left as it was'''
+
+class MovePlan(NamedTuple):
+    '''How a folder will be moved, made by `planMove()` before anything is moved'''
+
+    src: str
+    dest: str
+    sameDevice: bool # Moved with a rename instead of a copy
+    size: int # Bytes that have to be copied, 0 when it's renamed
+
+def deviceOf(path: str) -> int | None:
+    '''Returns the device of `path` or of its closest parent that exists'''
+
+    path = os.path.abspath(path)
+
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent: str = os.path.dirname(path)
+
+            if parent == path:
+                return None
+
+            path = parent
+
+def planMove(src: str, dest: str) -> MovePlan:
+    '''Checks if `src` can be renamed to `dest`, if not finds how much has to be copied'''
+
+    srcDevice: int | None = deviceOf(src)
+    sameDevice: bool = srcDevice is not None and srcDevice == deviceOf(os.path.dirname(os.path.abspath(dest)))
+
+    return MovePlan(src, dest, sameDevice, 0 if sameDevice else dirSize(src))
+
+def syncFolder(path: str) -> None:
+    '''Writes the entries of a folder to disk, Windows can't open folders and syncs them with their files'''
+
+    if os.name == 'nt':
+        return
+
+    fd: int = os.open(path, os.O_RDONLY)
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def removeReadOnly(func: Callable, path: str, exc_info) -> None:
+    '''Used for `shutil.rmtree()`s `onerror` kwarg, read only files can't be deleted on Windows'''
+
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+def describePlans(plans: list[MovePlan]) -> str:
+    copied: list[MovePlan] = [x for x in plans if not x.sameDevice]
+
+    return f'{len(plans) - len(copied)} renamed on the same drive, {len(copied)} copied to another drive ({formatSize(sum(x.size for x in copied))})'
+
+class MoveEngine():
+    '''
+    Moves folders, using a rename when the destination is on the same drive
+
+    Moves to another drive copy the files on a few threads in chunks, check
+    the copies against the source and only then delete the source.
+    Copies go to a partial folder that is synced to disk and renamed when it's
+    complete so a failed or canceled move never leaves a half copied mod behind.
+    Once it's renamed the copy is kept, even if the source can't be deleted
+    '''
+
+    def __init__(self, progress: ProgressChannel | None = None, isCanceled: Callable[[], bool] = lambda: False,
+                 threads: int = MOVE_COPY_THREADS, chunkSize: int = MOVE_CHUNK_SIZE, verify: bool = True) -> None:
+        logging.getLogger(__name__)
+
+        self.progress = progress
+        self.isCanceled = isCanceled
+        self.threads = threads
+        self.chunkSize = chunkSize
+        self.verify = verify
+
+    def move(self, plan: MovePlan) -> None:
+        '''Moves `plan.src` to `plan.dest`, which shouldn't exist yet'''
+
+        if plan.sameDevice:
+            try:
+                os.rename(plan.src, plan.dest)
+                logging.info('Renamed %s to %s', plan.src, plan.dest)
+                return
+
+            # Bind mounts and some network drives share a device but can't rename across
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+
+            plan = MovePlan(plan.src, plan.dest, False, dirSize(plan.src))
+
+            if self.progress is not None:
+                self.progress.addByteTotal(plan.size)
+
+        self.copyMove(plan)
+
+    def copyMove(self, plan: MovePlan) -> None:
+        partial: str = plan.dest + MOVE_PARTIAL_SUFFIX
+
+        # Left over from a move that was interrupted
+        if os.path.exists(partial):
+            shutil.rmtree(partial)
+
+        try:
+            files: list[tuple[str, str]] = self.copyFolders(plan.src, partial)
+
+            with ThreadPoolExecutor(max_workers=self.threads) as pool:
+                digests: list[str] = list(pool.map(lambda x: self.copyFile(*x), files))
+
+                # Each copy is read back and compared to what was read from the original
+                if self.verify:
+                    for (src, _), digest, copied in zip(files, digests, pool.map(lambda x: self.hashFile(x[1]), files)):
+                        if digest != copied:
+                            raise OSError(f'The copy of {src} does not match the original')
+
+            # The files were synced when they were copied, the folders have to be too
+            for root, _, _ in os.walk(partial):
+                syncFolder(root)
+
+            os.rename(partial, plan.dest)
+            syncFolder(os.path.dirname(os.path.abspath(plan.dest)))
+
+        except BaseException:
+            shutil.rmtree(partial, ignore_errors=True)
+            raise
+
+        # The copy is the only complete one now, it's kept if the original can't be deleted
+        try:
+            shutil.rmtree(plan.src, onerror=removeReadOnly)
+        except OSError as e:
+            logging.error('Copied %s to %s but could not delete the original:\n%s', plan.src, plan.dest, e)
+            return
+
+        logging.info('Copied %s to %s and deleted the original, %s', plan.src, plan.dest, formatSize(plan.size))
+
+    def copyFolders(self, src: str, dest: str) -> list[tuple[str, str]]:
+        '''Creates the folders and links of `src` in `dest`, returns the files left to copy'''
+
+        files: list[tuple[str, str]] = []
+
+        for root, dirs, names in os.walk(src):
+            destRoot: str = os.path.join(dest, os.path.relpath(root, src))
+            os.makedirs(destRoot, exist_ok=True)
+
+            # Links are copied as links, os.walk() doesn't go into linked folders
+            for name in dirs:
+                path: str = os.path.join(root, name)
+
+                if os.path.islink(path):
+                    os.symlink(os.readlink(path), os.path.join(destRoot, name))
+
+            for name in names:
+                path: str = os.path.join(root, name)
+
+                if os.path.islink(path):
+                    os.symlink(os.readlink(path), os.path.join(destRoot, name))
+                else:
+                    files.append((path, os.path.join(destRoot, name)))
+
+        return files
+
+    def copyFile(self, src: str, dest: str) -> str:
+        '''Copies a file in chunks, returns the hash of what was read'''
+
+        digest = hashlib.blake2b()
+
+        with open(src, 'rb') as r, open(dest, 'wb') as w:
+            while chunk := r.read(self.chunkSize):
+                if self.isCanceled():
+                    raise MoveCanceled(src)
+
+                digest.update(chunk)
+                w.write(chunk)
+
+                if self.progress is not None:
+                    self.progress.addBytes(len(chunk))
+
+            w.flush()
+            os.fsync(w.fileno())
+
+            # Verifying reads the copy from disk instead of from the cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(w.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+        shutil.copystat(src, dest)
+
+        return digest.hexdigest()
+
+    def hashFile(self, path: str) -> str:
+        digest = hashlib.blake2b()
+
+        with open(path, 'rb') as f:
+            while chunk := f.read(self.chunkSize):
+                digest.update(chunk)
+
+        return digest.hexdigest()
@@ -4,8 +4,10 @@ import os
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
 from src.threaded.workerQObject import Worker
+from src.modLinks import isLink, linkMod, unlinkMod
+from src.journal import JournalStep
 
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, LinkMode, ModType, JournalAction
 
 class NewDisabledDir(Worker):
 
@@ -21,36 +23,61 @@ class NewDisabledDir(Worker):
     def start(self) -> None:
         '''Moves disabled mods to a new folder'''
 
-        self.setTotalProgress.emit(len(self.mods_to_move))
+        moves: list[tuple[str, str]] = []
 
         for mod in self.mods_to_move:
 
-            self.setCurrentProgress.emit(1, qapp.translate('NewDisabledDir', 'Moving') + f' {mod}')
-
-            modDestPath: str = os.path.join(self.new_path, mod)
             modCurrentPath: str = os.path.join(self.old_path, mod)
 
             if os.path.isdir(modCurrentPath):
+                moves.append((modCurrentPath, os.path.join(self.new_path, mod)))
+            else:
+                logging.warning('%s was not found in:\n%s\nIgnoring...', mod, modCurrentPath)
+
+        self.progress.setTotal(len(moves))
+
+        self.journal.plan(*[JournalStep(JournalAction.relink, x, y, link) for x, y in moves if isLink(link := self.gameLink(os.path.basename(x)))])
+
+        for plan in self.planMoves(moves):
+
+            mod: str = os.path.basename(plan.src)
+
+            self.progress.advance(1, qapp.translate('NewDisabledDir', 'Moving') + f' {mod}')
 
-                self.move(modCurrentPath, modDestPath)
+            if self.move(plan.src, plan.dest, plan):
                 self.mods_moved.append(mod)
                 self.mods_to_move.remove(mod)
-            else:
-                logging.warning('%s was not found in:\n%s\nIgnoring...', mod, modCurrentPath)
+                self.relink(mod, plan.dest)
 
             self.cancelCheck()
-            self.rest()
         
         self.succeeded.emit()
     
     def onCancel(self) -> None:
-        self.setTotalProgress.emit(len(self.mods_moved))
+        self.progress.setTotal(len(self.mods_moved))
 
         for mod in self.mods_moved:
-            self.setCurrentProgress.emit(1, qapp.translate('NewDisabledDir', 'Moving') + f' {mod}')
+            self.progress.advance(1, qapp.translate('NewDisabledDir', 'Moving') + f' {mod}')
 
             modDestPath: str = os.path.join(self.old_path, mod)
             modCurrentPath: str = os.path.join(self.new_path, mod)
 
             self.move(modCurrentPath, modDestPath)
-            self.rest()
+            self.relink(mod, modDestPath)
+
+    def gameLink(self, mod: str) -> str:
+        '''Returns where the mod would be in the game folder, an empty string if it isn't installed'''
+
+        modType: ModType | None = self.saveManager.getType(mod)
+
+        return self.p.mod(modType, mod) if modType is not None else ''
+
+    def relink(self, mod: str, target: str) -> None:
+        '''Points the link of an enabled mod in the game folder at the mod's new folder'''
+
+        link: str = self.gameLink(mod)
+
+        # Hardlinked copies share the files so they don't need to change
+        if link and isLink(link):
+            unlinkMod(link)
+            linkMod(target, link, LinkMode.symlink)
@@ -0,0 +1,79 @@
+from typing import NamedTuple
+
+from PySide6.QtCore import QMutex, QMutexLocker
+
+class ProgressState(NamedTuple):
+    revision: int
+    value: int
+    total: int
+    message: str
+    bytesDone: int
+    bytesTotal: int # 0 if the task doesn't count bytes
+
+class ProgressChannel():
+    '''
+    Progress of a worker that the widget showing it reads
+
+    Workers update it without emitting signals and `ProgressWidget` reads it
+    at a fixed frame rate, so a worker never waits on the UI.
+    Messages set in between two reads are never shown
+    '''
+
+    def __init__(self) -> None:
+        self.mutex = QMutex()
+
+        self.total: int = 0
+        self.value: int = 0
+        self.message: str = ''
+
+        self.bytesDone: int = 0
+        self.bytesTotal: int = 0
+
+        # Changes on every update so readers can skip repainting
+        self.revision: int = 0
+
+    def setTotal(self, total: int) -> None:
+        '''Starts counting again with `total` steps'''
+
+        with QMutexLocker(self.mutex):
+            self.total = total
+            self.value = 0
+            self.revision += 1
+
+    def addTotal(self, steps: int) -> None:
+        with QMutexLocker(self.mutex):
+            self.total += steps
+            self.revision += 1
+
+    def advance(self, steps: int = 1, message: str | None = None) -> None:
+        '''Adds `steps` to the progress and replaces the message if one is given'''
+
+        with QMutexLocker(self.mutex):
+            self.value += steps
+
+            if message is not None:
+                self.message = message
+
+            self.revision += 1
+
+    def setBytes(self, total: int) -> None:
+        '''Starts counting bytes again with `total` bytes to go, for tasks that copy files'''
+
+        with QMutexLocker(self.mutex):
+            self.bytesTotal = total
+            self.bytesDone = 0
+            self.revision += 1
+
+    def addByteTotal(self, total: int) -> None:
+        with QMutexLocker(self.mutex):
+            self.bytesTotal += total
+            self.revision += 1
+
+    def addBytes(self, done: int) -> None:
+        with QMutexLocker(self.mutex):
+            self.bytesDone += done
+            self.revision += 1
+
+    def snapshot(self) -> ProgressState:
+        with QMutexLocker(self.mutex):
+            return ProgressState(self.revision, self.value, self.total, self.message, self.bytesDone, self.bytesTotal)
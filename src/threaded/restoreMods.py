@@ -0,0 +1,300 @@
+import os
+import time
+import shutil
+import logging
+import zipfile
+from typing import NamedTuple
+from contextlib import ExitStack
+
+from PySide6.QtCore import QCoreApplication as qapp, Slot
+
+from src.threaded.workerQObject import Worker
+from src.modLinks import isLink, isLinked, unlinkMod
+from src.journal import JournalStep
+from src.backupStore import BackupStore, ManifestEntry
+from src.save import Save
+from src.constant_vars import ModType, JournalAction, BACKUP_FOLDERS, MOD_CONFIG, OPTIONS_CONFIG, MOVE_CHUNK_SIZE, MOVE_PARTIAL_SUFFIX, MOVE_REPLACED_SUFFIX
+
+class BackupEntry(NamedTuple):
+    type: ModType
+    members: list[zipfile.ZipInfo]
+
+    @property
+    def size(self) -> int:
+        return sum(x.file_size for x in self.members)
+
+def readBackup(archive: zipfile.ZipFile) -> dict[str, BackupEntry]:
+    '''
+    Returns the mods in a backup made by `BackupMods` with their type and members,
+    only the central directory at the end of the zip is read
+    '''
+
+    mods: dict[str, BackupEntry] = {}
+
+    for info in archive.infolist():
+        for modType, folder in BACKUP_FOLDERS.items():
+
+            if not info.filename.startswith(f'{folder}/'):
+                continue
+
+            mod: str = info.filename[len(folder) + 1:].split('/')[0]
+
+            if mod:
+                mods.setdefault(mod, BackupEntry(modType, [])).members.append(info)
+
+            break
+
+    return mods
+
+def isManifest(backupPath: str) -> bool:
+    '''Returns True if `backupPath` is a manifest of a `BackupStore` instead of a zip'''
+
+    return os.path.splitext(backupPath)[1].lower() == '.json'
+
+def readContents(backupPath: str) -> dict[str, BackupEntry | ManifestEntry]:
+    '''Returns the mods in a backup zip or in an incremental backup'''
+
+    if isManifest(backupPath):
+        return BackupStore.fromManifest(backupPath).readMods(os.path.basename(backupPath))
+
+    with zipfile.ZipFile(backupPath) as archive:
+        return readBackup(archive)
+
+def saveRestored(restored: list[tuple[str, ModType, bool]], savePath: str = MOD_CONFIG) -> None:
+    '''Adds the mods in `RestoreMods.mods_restored` to the save and writes it once, call it from the GUI thread'''
+
+    if not restored:
+        return
+
+    saveManager = Save(savePath)
+
+    saveManager.addMods(*[([x for x, y, _ in restored if y == modType], modType) for modType in ModType])
+
+    for mod, _, enabled in restored:
+        saveManager.setEnabled(mod, enabled)
+
+    saveManager.saveJSON()
+
+class RestoreMods(Worker):
+    '''
+    Extracts the chosen mods from a backup zip or from a manifest of an incremental backup
+
+    Each mod is streamed into a partial folder that replaces the installed copy
+    once it's complete. Disabled and linked mods are restored to the disabled mods folder.
+    The save isn't written in the worker's thread, pass `mods_restored` to `saveRestored()` once it's done
+    '''
+
+    def __init__(self, backupPath: str, *mods: str, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
+
+        self.backupPath = backupPath
+        self.mods: tuple[str, ...] = mods
+
+        # Manifests are restored from the chunks in their store, zips from `archive`
+        self.store: BackupStore | None = BackupStore.fromManifest(backupPath) if isManifest(backupPath) else None
+        self.archive: zipfile.ZipFile | None = None
+
+        # (Mod, ModType, Enabled) of each mod that was restored
+        self.mods_restored: list[tuple[str, ModType, bool]] = []
+
+        self.partialPath: str | None = None
+
+    @Slot()
+    def start(self) -> None:
+
+        try:
+            self.progress.setTotal(1)
+
+            self.progress.advance(1, qapp.translate('RestoreMods', 'Reading the backup'))
+
+            with ExitStack() as stack:
+
+                contents: dict[str, BackupEntry | ManifestEntry]
+
+                if self.store is None:
+                    self.archive = stack.enter_context(zipfile.ZipFile(self.backupPath))
+                    contents = readBackup(self.archive)
+                else:
+                    contents = self.store.readMods(os.path.basename(self.backupPath))
+
+                for mod in self.mods:
+                    if mod not in contents:
+                        logging.warning('%s is not in the backup %s', mod, self.backupPath)
+
+                selected: dict[str, BackupEntry | ManifestEntry] = {x : contents[x] for x in self.mods if x in contents}
+
+                self.progress.setTotal(len(selected))
+                self.progress.setBytes(sum(x.size for x in selected.values()))
+
+                restoring: str = qapp.translate('RestoreMods', 'Restoring')
+
+                for mod, entry in selected.items():
+
+                    self.progress.advance(1, f'{restoring} {mod}')
+
+                    dest, enabled, relink = self.destination(mod, entry.type)
+
+                    self.partialPath = dest + MOVE_PARTIAL_SUFFIX
+
+                    self.journal.plan(JournalStep(JournalAction.restore, self.partialPath, dest, dest + MOVE_REPLACED_SUFFIX))
+
+                    if not self.extract(mod, entry, self.partialPath):
+                        break
+
+                    self.replace(self.partialPath, dest)
+                    self.partialPath = None
+
+                    # Hardlinks still point to the files that were replaced
+                    if relink:
+                        link: str = self.p.mod(entry.type, mod)
+                        unlinkMod(link)
+
+                        if self.link(dest, link) is None:
+                            enabled = False
+
+                    self.mods_restored.append((mod, entry.type, enabled))
+
+            # Removes the partial mod, the mods restored before it are kept
+            if self.isCanceled():
+                self.cancelCheck()
+                return
+
+            logging.info('Restored %s mods from %s', len(self.mods_restored), self.backupPath)
+
+            self.succeeded.emit()
+
+        except Exception as e:
+            self.onCancel()
+
+            self.error.emit(
+                qapp.translate('RestoreMods', 'An error was raised while restoring mods') +
+                f':\n{e}'
+            )
+
+    def destination(self, mod: str, modType: ModType) -> tuple[str, bool, bool]:
+        '''
+        Returns where a mod is restored to, if it's enabled after
+        and if its hardlinks in the game folder have to be made again
+        '''
+
+        libraryPath: str = os.path.join(self.optionsManager.getDispath(), mod)
+        gamePath: str = self.p.mod(modType, mod)
+
+        if os.path.isdir(libraryPath):
+
+            if isLinked(gamePath, libraryPath):
+                return libraryPath, True, not isLink(gamePath)
+
+            if not self.saveManager.getEnabled(mod):
+                return libraryPath, False, False
+
+        return gamePath, True, False
+
+    def extract(self, mod: str, entry: BackupEntry | ManifestEntry, root: str) -> bool:
+        '''Writes the files of a mod into `root`, returns False if it was canceled'''
+
+        if os.path.isdir(root):
+            shutil.rmtree(root, onerror=self.onError)
+
+        os.makedirs(root)
+
+        if isinstance(entry, ManifestEntry):
+            return self.extractStored(entry, root)
+
+        return self.extractMembers(entry.members, f'{BACKUP_FOLDERS[entry.type]}/{mod}/', root)
+
+    def target(self, root: str, name: str) -> str | None:
+        '''Returns where a file of a mod is written, `None` if it would be outside of `root`'''
+
+        rootPath: str = os.path.realpath(root)
+        target: str = os.path.realpath(os.path.join(root, name))
+
+        # A name like ../../file or an absolute path would be written outside of the mod
+        if os.path.commonpath((rootPath, target)) != rootPath:
+            logging.warning('%s is outside of its mod folder, skipping...', name)
+            return None
+
+        return target
+
+    def extractMembers(self, members: list[zipfile.ZipInfo], prefix: str, root: str) -> bool:
+        '''Streams the members of a mod from the zip'''
+
+        for info in members:
+
+            target: str | None = self.target(root, info.filename[len(prefix):])
+
+            if target is None:
+                continue
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            with self.archive.open(info) as src, open(target, 'wb') as dest:
+                while chunk := src.read(MOVE_CHUNK_SIZE):
+                    dest.write(chunk)
+                    self.progress.addBytes(len(chunk))
+
+                    if self.isCanceled():
+                        return False
+
+            modified: float = time.mktime(info.date_time + (0, 0, -1))
+            os.utime(target, (modified, modified))
+
+        return True
+
+    def extractStored(self, entry: ManifestEntry, root: str) -> bool:
+        '''Writes the files of a mod from the chunks in the store'''
+
+        for folder in entry.folders:
+            target: str | None = self.target(root, folder)
+
+            if target is not None:
+                os.makedirs(target, exist_ok=True)
+
+        for relative, (_, modified, chunks) in entry.files.items():
+
+            target: str | None = self.target(root, relative)
+
+            if target is None:
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            with open(target, 'wb') as dest:
+                for chunk in self.store.readFile(chunks):
+                    dest.write(chunk)
+                    self.progress.addBytes(len(chunk))
+
+                    if self.isCanceled():
+                        return False
+
+            os.utime(target, ns=(modified, modified))
+
+        return True
+
+    def replace(self, src: str, dest: str) -> None:
+        '''
+        Replaces the installed copy of a mod with the restored one,
+        the installed copy is only deleted once the restored one is in place
+        '''
+
+        replacedPath: str = dest + MOVE_REPLACED_SUFFIX
+
+        if isLink(dest):
+            unlinkMod(dest)
+        elif os.path.isdir(dest):
+            os.rename(dest, replacedPath)
+
+        os.rename(src, dest)
+
+        if os.path.isdir(replacedPath):
+            shutil.rmtree(replacedPath, onerror=self.onError)
+
+    def onCancel(self) -> None:
+        if self.partialPath is not None and os.path.isdir(self.partialPath):
+            shutil.rmtree(self.partialPath, onerror=self.onError)
+
+        self.partialPath = None
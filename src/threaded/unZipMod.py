@@ -1,16 +1,14 @@
 import os
 import logging
 
-import patoolib
-
 from PySide6.QtCore import QCoreApplication as qapp, Slot
 
 from src.threaded.workerQObject import Worker
-from src.constant_vars import ModType
+from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG
 
 class UnZipMod(Worker):
-    def __init__(self, *mods: tuple[str, ModType]) -> None:
-        super().__init__()
+    def __init__(self, *mods: tuple[str, ModType], optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
 
         self.mods: tuple[tuple[str, ModType], ...] = mods
 
@@ -18,7 +16,10 @@ class UnZipMod(Worker):
     def start(self) -> None:
         '''Extracts a mod and puts it into a destination based off the ModType Enum given'''
 
-        self.setTotalProgress.emit(len(self.mods))
+        # Loading patoolib is slow, it's only needed when installing archives
+        import patoolib
+
+        self.progress.setTotal(len(self.mods))
 
         modDestDict: dict[ModType, str] = {ModType.mods : self.p.mods(), ModType.mods_override : self.p.mod_overrides(), ModType.maps : self.p.maps()}
 
@@ -32,7 +33,7 @@ class UnZipMod(Worker):
 
                 modType: ModType = modURL[1]
 
-                self.setCurrentProgress.emit(1, qapp.translate("UnZipMod", "Unpacking") + f" {mod}")
+                self.progress.advance(1, qapp.translate("UnZipMod", "Unpacking") + f" {mod}")
 
                 logging.info('Unzipping %s to %s', src, modDestDict[modType])
 
@@ -43,7 +44,6 @@ class UnZipMod(Worker):
                     logging.warning('%s does not exist', src)
 
                 self.cancelCheck()
-                self.rest()
 
             self.succeeded.emit()
         
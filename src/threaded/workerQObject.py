@@ -8,18 +8,17 @@ from PySide6.QtCore import QCoreApplication as qapp
 from PySide6.QtCore import QObject, Signal, QMutex, QMutexLocker
 
 import src.errorChecking as errorChecking
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, LinkMode, JournalAction
 from src.getPath import Pathing
+from src.threaded.progressChannel import ProgressChannel
+from src.threaded.moveEngine import MoveEngine, MovePlan, MoveCanceled, planMove, describePlans
+from src.modLinks import linkMod
+from src.journal import Journal, JournalStep, JournalLocked
 from src.save import OptionsManager, Save
+from src.tracer import span
 
 
 class Worker(QObject):
-    setTotalProgress = Signal(int)
-
-    addTotalProgress = Signal(int)
-
-    setCurrentProgress = Signal(int, str)
-
     succeeded = Signal()
 
     doneCanceling = Signal()
@@ -28,6 +27,8 @@ class Worker(QObject):
 
     cancel = False
 
+    undoing = False # Set while `onCancel()` runs so its moves back can't be canceled
+
     mutex: QMutex = None # Should be set externally by the ProgressWidget class
 
     def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
@@ -39,17 +40,32 @@ class Worker(QObject):
 
         self.p = Pathing(optionsPath)
 
-    def start() -> None:
-        ...
+        # Read by ProgressWidget on a timer instead of a signal for each step
+        self.progress = ProgressChannel()
 
-    def onCancel(self) -> None:
+        # Steps are only written down while `run()` runs
+        self.journal = Journal()
+
+    def start() -> None:
         ...
 
-    def rest(self) -> None:
+    def run(self) -> None:
         '''
-        Emits signals too fast even with signal blockers so we need this until we can find a better way
+        Runs `start()` inside of a trace span and a journal transaction,
+        this is what `ProgressWidget` starts
         '''
-        self.thread().msleep(1)
+
+        try:
+            with span(f'{type(self).__name__}.start', 'worker'), self.journal.transaction(type(self).__name__):
+                self.start()
+
+        # The cli or another copy of the program is changing mods
+        except JournalLocked as e:
+            logging.error('%s could not start: %s', type(self).__name__, e)
+            self.error.emit(qapp.translate('Worker', 'Another operation is running, try again once it\'s done'))
+
+    def onCancel(self) -> None:
+        ...
 
     def cancelCheck(self) -> None:
         with QMutexLocker(self.mutex):
@@ -57,11 +73,47 @@ class Worker(QObject):
                 return
         
         logging.info('%s was canceled', self.__class__)
-        self.onCancel()
+
+        self.undoing = True
+        try:
+            self.onCancel()
+        finally:
+            self.undoing = False
+
         self.doneCanceling.emit()
 
-    def move(self, src: str, dest: str) -> None:
-        '''`shutil.move()` with some extra exception handling'''
+    def isCanceled(self) -> bool:
+        '''Checked by `MoveEngine` between chunks, it can be called from any thread'''
+
+        with QMutexLocker(self.mutex):
+            return self.cancel and not self.undoing
+
+    def planMoves(self, moves: list[tuple[str, str]]) -> list[MovePlan]:
+        '''
+        Checks how each move will be made before any are started,
+        the bytes that have to be copied to another drive are added to the progress
+        and the moves are written to the journal
+        '''
+
+        plans: list[MovePlan] = [planMove(src, dest) for src, dest in moves]
+
+        self.journal.plan(*[JournalStep(JournalAction.move, x.src, x.dest) for x in plans])
+
+        self.progress.setBytes(sum(x.size for x in plans))
+
+        logging.info('%s is moving %s mods, %s', type(self).__name__, len(plans), describePlans(plans))
+
+        return plans
+
+    def move(self, src: str, dest: str, plan: MovePlan | None = None) -> bool:
+        '''
+        Moves a mod folder with `MoveEngine`, it's renamed if `dest` is on the same drive
+
+        Returns False if the move was canceled or failed from a permission error
+        '''
+
+        if plan is None:
+            plan = planMove(src, dest)
 
         # Overwrite mod
         if os.path.exists(dest):
@@ -69,36 +121,54 @@ class Worker(QObject):
 
         # Will try to move the file, if there is an exception, fix the issue and try again
         try:
-            shutil.move(src, dest)
-            logging.info('Moved file %s to destination %s', src, dest)
+            MoveEngine(self.progress, self.isCanceled).move(plan)
+            return True
+
+        except MoveCanceled:
+            logging.info('Moving %s was canceled, it was left where it was', src)
 
         except PermissionError:
             
+            checkingFile: str = qapp.translate('Worker', 'Checking file permissions of')
+            checkingFolder: str = qapp.translate('Worker', 'Checking folder permissions of')
+
             # Grab all files in mod
             for root, dirs, files in os.walk(src):
 
-                self.addTotalProgress.emit(2 + len(dirs) + len(files))
+                self.progress.addTotal(2 + len(dirs) + len(files))
                 
                 # Checking files for perm errors
                 for file in files:
-                    self.setCurrentProgress.emit(1, qapp.translate('Worker', 'Checking file permissions of') + f' {file}')
+                    self.progress.advance(1, f'{checkingFile} {file}')
                     file_path = os.path.join(root, file)
                     errorChecking.permissionCheck(file_path)
                 
                 # Checking folders for perm errors
                 for dir in dirs:
-                    self.setCurrentProgress.emit(1, qapp.translate('Worker', 'Checking folder permissions of') + f' {dir}')
+                    self.progress.advance(1, f'{checkingFolder} {dir}')
                     dir_path = os.path.join(root, dir)
                     errorChecking.permissionCheck(dir_path)
                 
                 # Checking mod directory for perm errors
-                self.setCurrentProgress.emit(1, qapp.translate('Worker', 'Checking folder permissions of') + f' {root}')
+                self.progress.advance(1, f'{checkingFolder} {root}')
                 errorChecking.permissionCheck(root)
 
-            self.setCurrentProgress.emit(1, qapp.translate('Worker', 'Fixing install for') + f' {os.path.basename(src)}')
-            # If shutil.move made a partial dir of the mod delete it
-            if os.path.exists(dest):
-                shutil.rmtree(dest, onerror=self.onError)
+            # The partial copy is removed by `MoveEngine`, `dest` is only there if the move finished
+            self.progress.advance(1, qapp.translate('Worker', 'Fixing install for') + f' {os.path.basename(src)}')
+
+        return False
+
+    def link(self, target: str, link: str) -> LinkMode | None:
+        '''
+        Links a mod in the disabled mods folder into the game folder with the link mode option,
+        returns the mode that was used or `None` if it couldn't be linked
+        '''
+
+        try:
+            return linkMod(target, link, self.optionsManager.getLinkMode())
+        except OSError as e:
+            logging.warning('Could not link %s to %s:\n%s', link, target, e)
+            return None
 
     def onError(self, func: Callable[[Any], Any], path: str, exc_info: int) -> None:
         """Used for `shutil.rmtree()`s `onerror` kwarg"""
@@ -2,13 +2,14 @@ import os
 import logging
 
 from src.JSONParser import JSONParser
+from src.sqliteStore import SQLiteStore
 from src.constant_vars import TOOLS_JSON
 
 class ToolJSON(JSONParser):
     file: dict[str:list[str]] = None
     def __init__(self, path: str = TOOLS_JSON) -> None:
         logging.getLogger(__name__)
-        super().__init__(path, default={'shortcuts' : []})
+        super().__init__(path, default={'shortcuts' : []}, table=SQLiteStore.TOOLS)
         self.path = path
 
     def __str__(self) -> str:
@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from contextlib import ContextDecorator
+from datetime import datetime
+
+from src.constant_vars import LOGS_PATH, TRACE_ENV, MAX_TRACE_EVENTS
+
+class Tracer():
+    '''
+    Records timing spans and writes them as a Chrome trace,
+    the file can be opened in `chrome://tracing` or https://ui.perfetto.dev
+
+    Enabled by the `MMM_TRACE` environment variable or the `trace` option,
+    spans cost one attribute check while tracing is off
+    '''
+
+    enabled: bool = False
+    events: list[dict] = []
+    threads: dict[int, str] = {} # Thread ID -> name
+    dropped: int = 0
+    path: str | None = None
+
+    lock = threading.Lock()
+    origin: int = time.perf_counter_ns()
+
+    @staticmethod
+    def start(path: str | None = None) -> None:
+        '''Starts recording, the trace is written to `path` when the program exits'''
+
+        if Tracer.enabled:
+            return
+
+        if path is None:
+            path = os.path.join(LOGS_PATH, f'trace-{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.json')
+
+        if Tracer.path is None:
+            atexit.register(Tracer.save)
+
+        Tracer.path = path
+        Tracer.enabled = True
+
+        logging.info('Tracing enabled, writing spans to %s', path)
+
+    @staticmethod
+    def startFromEnvironment(option: bool = False, environ: dict[str, str] | None = None) -> bool:
+        '''Starts recording if `MMM_TRACE` is set or `option` is True, returns if tracing is on'''
+
+        if (environ if environ is not None else os.environ).get(TRACE_ENV) or option:
+            Tracer.start()
+
+        return Tracer.enabled
+
+    @staticmethod
+    def stop() -> None:
+        Tracer.enabled = False
+
+    @staticmethod
+    def now() -> float:
+        '''Microseconds since the tracer was imported'''
+        return (time.perf_counter_ns() - Tracer.origin) / 1000
+
+    @staticmethod
+    def record(name: str, category: str, start: float, end: float, args: dict | None = None) -> None:
+        thread: threading.Thread = threading.current_thread()
+
+        event: dict = {
+            'name' : name,
+            'cat'  : category,
+            'ph'   : 'X',
+            'ts'   : round(start, 1),
+            'dur'  : round(end - start, 1),
+            'pid'  : os.getpid(),
+            'tid'  : thread.ident
+        }
+
+        if args:
+            event['args'] = args
+
+        with Tracer.lock:
+            if len(Tracer.events) >= MAX_TRACE_EVENTS:
+                Tracer.dropped += 1
+                return
+
+            Tracer.events.append(event)
+            Tracer.threads.setdefault(thread.ident, thread.name)
+
+    @staticmethod
+    def save() -> str | None:
+        '''Writes the recorded spans, returns the path written to'''
+
+        if Tracer.path is None:
+            return None
+
+        with Tracer.lock:
+            events: list[dict] = list(Tracer.events)
+            threads: dict[int, str] = dict(Tracer.threads)
+
+        if not events:
+            return None
+
+        metadata: list[dict] = [
+            {'name' : 'thread_name', 'ph' : 'M', 'pid' : os.getpid(), 'tid' : x, 'args' : {'name' : y}}
+            for x, y in threads.items()
+        ]
+
+        if Tracer.dropped:
+            logging.warning('%s spans were not traced, the limit is %s', Tracer.dropped, MAX_TRACE_EVENTS)
+
+        os.makedirs(os.path.dirname(os.path.abspath(Tracer.path)), exist_ok=True)
+
+        with open(Tracer.path, 'w') as f:
+            json.dump({'traceEvents' : metadata + events, 'displayTimeUnit' : 'ms'}, f)
+
+        logging.info('Wrote %s spans to %s', len(events), Tracer.path)
+
+        return Tracer.path
+
+    @staticmethod
+    def clear() -> None:
+        with Tracer.lock:
+            Tracer.events = []
+            Tracer.threads = {}
+            Tracer.dropped = 0
+
+class span(ContextDecorator):
+    '''
+    Times a block of code or a function while tracing is enabled
+
+    ```
+    with span('refreshMods'):
+        ...
+
+    @span('findModVersion', 'io')
+    def findModVersion(...):
+        ...
+    ```
+
+    Work that finishes in a callback can call `begin()` and `end()` instead
+    '''
+
+    def __init__(self, name: str, category: str = 'mmm', **args) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start: float | None = None
+
+    def begin(self) -> 'span':
+        self.start = Tracer.now() if Tracer.enabled else None
+        return self
+
+    def end(self, **args) -> None:
+        if self.start is None or not Tracer.enabled:
+            return
+
+        self.args.update(args)
+        Tracer.record(self.name, self.category, self.start, Tracer.now(), dict(self.args))
+        self.start = None
+
+    def _recreate_cm(self) -> 'span':
+        # Each call of a decorated function gets its own span
+        return span(self.name, self.category, **self.args)
+
+    def __enter__(self) -> 'span':
+        return self.begin()
+
+    def __exit__(self, excType, exc, traceback) -> bool:
+        if excType is not None:
+            self.end(error=excType.__name__)
+        else:
+            self.end()
+        return False
@@ -0,0 +1,73 @@
+import PySide6.QtWidgets as qtw
+from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, Slot
+
+from src.widgets.QDialog.QDialog import Dialog
+
+from src.threaded.restoreMods import BackupEntry, readContents
+from src.backupStore import ManifestEntry
+from src.modSizes import formatSize
+from src.constant_vars import BACKUP_FOLDERS
+
+class SelectRestore(Dialog):
+    '''Lists the mods in a backup zip or an incremental backup, the selected mods are in `mods` after it's accepted'''
+
+    mods: list[str] = None
+
+    def __init__(self, backupPath: str) -> None:
+        super().__init__()
+
+        self.setWindowTitle(qapp.translate('SelectRestore', 'Mods to be restored:'))
+
+        layout = qtw.QVBoxLayout()
+
+        self.modList = qtw.QTreeWidget(self)
+        self.modList.setRootIsDecorated(False)
+        self.modList.setFocusPolicy(qt.FocusPolicy.NoFocus)
+        self.modList.setSelectionMode(qtw.QTreeWidget.SelectionMode.MultiSelection)
+        self.modList.setHeaderLabels([
+            qapp.translate('SelectRestore', 'Mod'),
+            qapp.translate('SelectRestore', 'Folder'),
+            qapp.translate('SelectRestore', 'Size')
+        ])
+
+        self.searchBar = qtw.QLineEdit()
+        self.searchBar.setPlaceholderText(qapp.translate('SelectRestore', 'Search...'))
+        self.searchBar.textChanged.connect(self.search)
+
+        buttons = qtw.QDialogButtonBox.StandardButton.Ok | qtw.QDialogButtonBox.StandardButton.Cancel
+
+        self.buttonBox = qtw.QDialogButtonBox(buttons)
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+
+        # Only the central directory or the manifest is read, not the mods
+        contents: dict[str, BackupEntry | ManifestEntry] = readContents(backupPath)
+
+        for mod, entry in sorted(contents.items(), key=lambda x: x[0].lower()):
+            qtw.QTreeWidgetItem(self.modList, [mod, BACKUP_FOLDERS[entry.type], formatSize(entry.size)])
+
+        self.modList.resizeColumnToContents(0)
+
+        for widget in (self.searchBar, self.modList, self.buttonBox):
+            layout.addWidget(widget)
+
+        self.setLayout(layout)
+
+    @Slot(str)
+    def search(self, input: str) -> None:
+        for i in range(self.modList.topLevelItemCount()):
+            item: qtw.QTreeWidgetItem = self.modList.topLevelItem(i)
+            item.setHidden(input.lower() not in item.text(0).lower())
+
+    @Slot()
+    def accept(self) -> None:
+
+        self.setResult(1)
+
+        self.mods = [x.text(0) for x in self.modList.selectedItems()]
+        return super().accept()
+
+    @Slot()
+    def reject(self) -> None:
+        self.setResult(0)
+        return super().reject()
@@ -2,8 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import PySide6.QtGui as qtg
-from PySide6.QtCore import QCoreApplication as qapp, Slot
-from PySide6.QtWidgets import QTableWidgetItem
+from PySide6.QtCore import QCoreApplication as qapp, QModelIndex, Slot
 
 from src.widgets.QMenu.QMenu import ModContextMenu
 
@@ -91,12 +90,12 @@ class ManagerMenu(ModContextMenu):
 # EVENT OVERRIDES
 
     def showEvent(self, event: qtg.QShowEvent) -> None:
-        selectedItems: list[QTableWidgetItem] = self.qParent.getSelectedNameItems()
+        selectedItems: list[QModelIndex] = self.qParent.getSelectedNameItems()
         if len(selectedItems) <= 0:
             event.accept()
             return
 
-        if self.qParent.saveManager.getModworkshopAssetID(selectedItems[0].text()):
+        if self.qParent.saveManager.getModworkshopAssetID(selectedItems[0].data()):
             self.visitModPage.setEnabled(True)
             self.checkUpdate.setEnabled(True)
         else:
@@ -8,7 +8,7 @@ from PySide6.QtCore import Signal, Qt as qt, Slot
 from src.widgets.QMenu.ignoreModListQMenu import IgnoredModsQMenu
 
 from src.save import Save
-from src.constant_vars import MOD_CONFIG
+from src.constant_vars import MOD_CONFIG, ModKeys
 
 if TYPE_CHECKING:
     from src.settings import Options
@@ -30,9 +30,7 @@ class IgnoredMods(qtw.QListWidget):
     @Slot()
     def refreshList(self) -> None:
         self.clear()
-        items: list[str] = [
-            x for x in self.saveManager.mods() if self.saveManager.getIgnored(x)
-        ]
+        items: list[str] = self.saveManager.modsWhere(ModKeys.ignored, True)
         self.addItems(items)
         self.itemsChanged.emit()
 
@@ -4,14 +4,12 @@ from typing import List
 
 import PySide6.QtGui as qtg
 import PySide6.QtWidgets as qtw
-from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, Slot, Signal
+from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, QModelIndex, Slot, Signal
 
 from src.widgets.QMenu.managerQMenu import ManagerMenu
 from src.widgets.progressWidget import ProgressWidget
-from src.widgets.QDialog.deleteWarningQDialog import Confirmation
-from src.widgets.QDialog.newModQDialog import newModLocation
 from src.widgets.QDialog.announcementQDialog import Notice
-from src.widgets.tagViewerQWidget import TagViewer
+from src.widgets.modTableModel import ModItem, ModTableModel, ModSortFilterProxy
 
 from src.threaded.moveToDisabledDir import MoveToDisabledDir
 from src.threaded.moveToEnabledDir import MoveToEnabledModDir
@@ -22,28 +20,52 @@ from src.threaded.unZipMod import UnZipMod
 from src.getPath import Pathing
 import src.errorChecking as errorChecking
 from src.save import Save, OptionsManager
-from src.constant_vars import MODSIGNORE, ModType, UI_GRAPHICS_PATH, MODWORKSHOP_LOGO_B, MODWORKSHOP_LOGO_W, LIGHT, MOD_CONFIG, OPTIONS_CONFIG, ModRole
-from src.api.api import findModworkshopAssetID, findModVersion
-from src.api.checkModUpdate import checkModUpdate
-
-class ModListWidget(qtw.QTableWidget):
+from src.metadataCache import MetadataCache
+from src.modScanner import ModScan, scanModDirs, sortModScan
+from src.modWatcher import ModWatcher
+from src.modSizes import ModSizeScanner
+from src.tracer import span
+from src.constant_vars import MODSIGNORE, ModType, UI_GRAPHICS_PATH, MODWORKSHOP_LOGO_B, MODWORKSHOP_LOGO_W, LIGHT, MOD_CONFIG, OPTIONS_CONFIG, METADATA_CACHE
+
+class ModListWidget(qtw.QTableView):
     modHidden = Signal()
 
-    def __init__(self, savePath: str = MOD_CONFIG, optionsPath: str = OPTIONS_CONFIG) -> None:
+    def __init__(self, savePath: str = MOD_CONFIG, optionsPath: str = OPTIONS_CONFIG, cachePath: str = METADATA_CACHE) -> None:
         super().__init__()
         logging.getLogger(__name__)
 
         self.saveManager = Save(savePath)
         self.optionsManager = OptionsManager(optionsPath)
+        self.metadataCache = MetadataCache(cachePath)
 
         self.p = Pathing(optionsPath)
 
+        # Patches single rows when mods are added, removed or moved on disk
+        self.watcher = ModWatcher(self)
+        self.watcher.modAdded.connect(self.onModAdded)
+        self.watcher.modRemoved.connect(self.onModRemoved)
+        self.watcher.modRenamed.connect(self.onModRenamed)
+        self.watcher.modMoved.connect(self.onModMoved)
+        self.watcher.syncStarted.connect(self.onSyncStarted)
+        self.watcher.syncFinished.connect(self.onSyncFinished)
+
+        # Sizes are found in the background and added to the counters as they come in
+        self.sizeScanner = ModSizeScanner(self)
+        self.sizeScanner.sizeFound.connect(self.onSizeFound)
+        self.sizeScanner.finished.connect(self.metadataCache.flush)
+
         self.setSelectionMode(qtw.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.setSelectionBehavior(qtw.QAbstractItemView.SelectionBehavior.SelectRows)
         self.setEditTriggers(qtw.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setAcceptDrops(True)
 
-        self.setColumnCount(4)
+        # Rows are only painted when visible, sorting and searching is done by the proxy
+        self.modModel = ModTableModel(self)
+        self.modModel.setModworkshopIcon(self.getModworkshopIcon(self.optionsManager.getTheme()))
+
+        self.proxy = ModSortFilterProxy(self)
+        self.proxy.setSourceModel(self.modModel)
+        self.setModel(self.proxy)
 
         self.setColumnWidth(0, 400)
         self.setColumnWidth(1, 130)
@@ -68,6 +90,7 @@ class ModListWidget(qtw.QTableWidget):
         self.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(qtw.QHeaderView.ResizeMode.Fixed)
 
         self.contextMenu = ManagerMenu(self)
         self.tagViewer = None
@@ -75,42 +98,35 @@ class ModListWidget(qtw.QTableWidget):
         self.applyStaticText()
 
     def applyStaticText(self) -> None:
-        self.setHorizontalHeaderLabels((
-            qapp.translate("ModListWidget", 'Name'),
-            qapp.translate("ModListWidget", 'Type'),
-            qapp.translate("ModListWidget", 'Enabled'),
-            qapp.translate("ModListWidget", 'Version'))
-        )
+        # The header and enabled text is translated when it's painted
+        self.modModel.retranslate()
 
-        # Update Enabled Item Tags
-        enabled_text: str = self.horizontalHeaderItem(2).text()
-        disabled_text: str = qapp.translate("ModListWidget", 'Disabled')
+    def rowCount(self) -> int:
+        '''Returns the number of mods in the table, including the ones hidden by a search'''
+        return self.modModel.rowCount()
 
-        for i, item in enumerate(self.getEnabledItems()):
-            if self.saveManager.getEnabled(self.getNameItem(i).text()):
-                item.setText(enabled_text)
-            else:
-                item.setText(disabled_text)
+    def columnCount(self) -> int:
+        return self.modModel.columnCount()
 
-    def getEnabledItem(self, row: int) -> qtw.QTableWidgetItem:
-        return self.item(row, 2)
+    def getEnabledItem(self, row: int) -> QModelIndex:
+        return self.proxy.index(row, ModTableModel.ENABLED)
     
-    def getEnabledItems(self) -> list[qtw.QTableWidgetItem]:
+    def getEnabledItems(self) -> list[QModelIndex]:
         return [
-            self.getEnabledItem(x) for x in range(self.rowCount())
+            self.getEnabledItem(x) for x in range(self.proxy.rowCount())
         ]
     
-    def getNameItem(self, row: int) -> qtw.QTableWidgetItem:
-        return self.item(row, 0)
+    def getNameItem(self, row: int) -> QModelIndex:
+        return self.proxy.index(row, ModTableModel.NAME)
     
-    def getTypeItem(self, row: int) -> qtw.QTableWidgetItem:
-        return self.item(row, 1)
+    def getTypeItem(self, row: int) -> QModelIndex:
+        return self.proxy.index(row, ModTableModel.TYPE)
     
-    def getVersionItem(self, row: int) -> qtw.QTableWidgetItem:
-        return self.item(row, 3)
+    def getVersionItem(self, row: int) -> QModelIndex:
+        return self.proxy.index(row, ModTableModel.VERSION)
     
-    def getSelectedNameItems(self) -> list[qtw.QTableWidgetItem]:
-        return self.selectedItems()[::self.columnCount()]
+    def getSelectedNameItems(self) -> list[QModelIndex]:
+        return self.selectionModel().selectedRows(ModTableModel.NAME)
     
     def getModTypeCount(self, modType: ModType) -> int | None:
         '''
@@ -119,7 +135,11 @@ class ModListWidget(qtw.QTableWidget):
         '''
 
         if errorChecking.isTypeMod(modType):
-            return len(self.findItems(modType.value, qt.MatchFlag.MatchExactly))
+            return self.modModel.typeCount(modType)
+
+    def getModworkshopIcon(self, theme: str) -> qtg.QIcon:
+        color = MODWORKSHOP_LOGO_B if theme == LIGHT else MODWORKSHOP_LOGO_W
+        return qtg.QIcon(os.path.join(UI_GRAPHICS_PATH, color))
     
     @Slot(int)
     @Slot(int, bool)
@@ -146,7 +166,7 @@ class ModListWidget(qtw.QTableWidget):
         
         logging.debug('Sorting items by col: %s, ascending: %s', self.sortState.get('col'), self.sortState.get('ascending'))
 
-        self.sortItems(self.sortState['col'], self.sortState['ascending'])
+        self.proxy.sort(self.sortState['col'], self.sortState['ascending'])
     
     def addMod(self, **kwargs: str | ModType | bool | list[str]) -> None:
         '''
@@ -160,48 +180,13 @@ class ModListWidget(qtw.QTableWidget):
         + version: str
         + tags: list[str]
 
-        If there is any other kwarg, then it will return
+        Any other kwarg is ignored
         '''
 
-        self.insertRow(self.rowCount())
-
-        for key, value in kwargs.items():
-
-            match key:
-
-                case 'name':
-                    item = qtw.QTableWidgetItem(value)
-                    tags: str | ModType | bool | List[str] | None = kwargs.get('tags')
-                    if tags is None:
-                        tags = []
-                    item.setData(ModRole.tags, tuple(tags))
-
-                    if self.saveManager.getModworkshopAssetID(value):
-
-                        color = MODWORKSHOP_LOGO_B if self.optionsManager.getTheme() == LIGHT else MODWORKSHOP_LOGO_W
-
-                        item.setIcon(qtg.QIcon(os.path.join(UI_GRAPHICS_PATH, color)))
-
-                    self.setItem(self.rowCount() - 1, 0, item)
+        self.modModel.addMod(self.createModItem(**kwargs))
 
-
-                case 'type':
-                    self.setItem(self.rowCount() - 1, 1, qtw.QTableWidgetItem(value.value))
-
-                case 'enabled': # The key to this value should be a boolean
-
-                    value: str = qapp.translate('ModListWidget', 'Enabled') if value else qapp.translate('ModListWidget', 'Disabled')
-                    self.setItem(self.rowCount() - 1, 2, qtw.QTableWidgetItem(value))
-                
-                case 'version':
-
-                    if value == 'None':
-                        value = '1.0.0'
-
-                    self.setItem(self.rowCount() - 1, 3, qtw.QTableWidgetItem(value))
-
-                case _:
-                    continue
+    def createModItem(self, name: str, type: ModType, enabled: bool = True, version: str = 'None', tags: list[str] | None = None, **_kwargs) -> ModItem:
+        return ModItem(name, type, bool(enabled), version, tags, bool(self.saveManager.getModworkshopAssetID(name)))
     
     def setItemDisabled(self) -> None:
         '''
@@ -211,29 +196,13 @@ class ModListWidget(qtw.QTableWidget):
         iteration
         '''
 
-        items: List[qtw.QTableWidgetItem] = self.getSelectedNameItems()
-
-        disabledModDir: str = self.optionsManager.getDispath()
+        items: List[QModelIndex] = self.getSelectedNameItems()
 
-        startFileMover = ProgressWidget(MoveToDisabledDir(*[x.text() for x in items]))
+        startFileMover = ProgressWidget(MoveToDisabledDir(*[x.data() for x in items]))
         startFileMover.exec()
 
-        for item in items:
-
-            row: int = item.row()
-
-            modName: str = item.text()
-
-            if os.path.isdir(os.path.join(disabledModDir, modName)):
-
-                self.saveManager.setEnabled(modName, False)
-
-                self.getEnabledItem(row).setText(qapp.translate("ModListWidget", 'Disabled'))
-
-            else:
-                logging.info('%s is already disabled in the save file', modName)
-        
-        self.saveManager.saveJSON()
+        # The watcher patches the rows of the mods that were moved
+        self.watcher.sync(True)
 
     def deleteItem(self) -> None:
         '''
@@ -241,6 +210,8 @@ class ModListWidget(qtw.QTableWidget):
         and the mod assosiated with that row from the user's PC
         '''
 
+        from src.widgets.QDialog.deleteWarningQDialog import Confirmation
+
         warning = Confirmation(
             title='Deletion Confirmation', 
             body='Are you sure you want to delete these mod(s) from your computer?\n(The mods will be placed in the recycle bin)'
@@ -249,83 +220,72 @@ class ModListWidget(qtw.QTableWidget):
 
         if warning.result():
 
-            items: List[qtw.QTableWidgetItem] = self.getSelectedNameItems()
+            mods: List[str] = [x.data() for x in self.getSelectedNameItems()]
 
-            startFileMover = ProgressWidget(DeleteMod(*[x.text() for x in items]))
+            startFileMover = ProgressWidget(DeleteMod(*mods))
             startFileMover.exec()
 
-            for item in items:
-
-                row: int = item.row()
-
-                self.removeRow(row)
-            
-            self.itemChanged.emit(*items)
+            for mod in mods:
+                self.modModel.removeMod(mod)
 
             self.saveManager.saveJSON()
     
     def setItemEnabled(self) -> None:
         '''Sets one or more mods to be enabled in MOD_CONFIG and in the GUI'''
 
-        items: List[qtw.QTableWidgetItem] = self.getSelectedNameItems()
+        items: List[QModelIndex] = self.getSelectedNameItems()
 
-        startFileMover = ProgressWidget(MoveToEnabledModDir(*[x.text() for x in items]))
+        startFileMover = ProgressWidget(MoveToEnabledModDir(*[x.data() for x in items]))
         startFileMover.exec()
 
-        for item in items:
-
-            row: int = item.row()
-
-            modName: str = item.text()
-            modType = ModType(self.getTypeItem(row).text())
-
-            self.p.mod(modType, modName)
-
-            if os.path.isdir(self.p.mod(modType, modName)):
-                self.saveManager.setEnabled(modName, True)
-
-                self.getEnabledItem(row).setText(qapp.translate("ModListWidget", 'Enabled'))
-        
-        self.saveManager.saveJSON()
+        # The watcher patches the rows of the mods that were moved
+        self.watcher.sync(True)
 
     # This isn't used anywhere, might be removed later
     def isMultipleSelected(self) -> bool:
-        return len(self.selectedItems()) > 1
+        return len(self.getSelectedNameItems()) > 1
     
     @Slot()
     @Slot(bool)
+    @span('refreshMods')
     def refreshMods(self, sorting: bool = True) -> None:
         '''Refreshes the mod lists in the manager'''
 
-        if self.rowCount() > 0:
-            self.setRowCount(0)
-
         # Gather mods from directories
-        mods_override, mods, maps = self.getMods()
+        scan: ModScan = self.getMods()
 
         # Save mods into .ini
-        self.saveManager.addMods((mods_override, ModType.mods_override), (mods, ModType.mods), (maps, ModType.maps))
+        self.saveManager.addMods((scan.mod_overrides, ModType.mods_override), (scan.mods, ModType.mods), (scan.maps, ModType.maps))
 
         disModFolder: str = self.optionsManager.getDispath()
 
+        modPaths: list[str] = []
+        modItems: list[ModItem] = []
+        ignored: list[str] = []
+        sizes: dict[str, tuple[str, int | None]] = {}
+
         # Add mods to the table widget
-        for mod in (x for x in mods_override + mods + maps):
+        for mod in scan.all():
             
             # Checking if the mod is ignored
             if self.saveManager.getIgnored(mod):
+                ignored.append(mod)
                 continue
 
             type: ModType | None = self.saveManager.getType(mod)
-            isEnabled: bool = not os.path.isdir(os.path.join(disModFolder, mod))
+            isEnabled: bool = mod not in scan.disabled
             modPath: List[str] | str = self.p.mod(type, mod) if isEnabled else os.path.join(disModFolder, mod)
-            version = str(findModVersion(modPath))
+            modPaths.append(modPath)
+
+            # Only reparses main.xml and mod.txt if they changed since the last refresh
+            version, foundAssetID = self.metadataCache.lookup(modPath)
             tags: List[str] = self.saveManager.getTags(mod)
 
             assetID: str = self.saveManager.getModworkshopAssetID(mod)
 
             # Empty string
             if not assetID:
-                assetID = findModworkshopAssetID(modPath)
+                assetID = foundAssetID
 
             self.saveManager.setEnabled(mod, isEnabled)
             
@@ -333,118 +293,212 @@ class ModListWidget(qtw.QTableWidget):
             
             logging.debug('Adding mod to table, %s|%s|%s|%s|%s|%s', mod, type, isEnabled, version, assetID, tags)
 
-            self.addMod(name=mod, type=type, enabled=isEnabled, version=version, tags=tags)
+            item: ModItem = self.createModItem(mod, type, isEnabled, version, tags)
+
+            # The cached size is shown until the scanner checks it
+            sizeMtime, item.size = self.metadataCache.getSize(modPath)
+            sizes[mod] = (modPath, sizeMtime)
+
+            modItems.append(item)
+
+        # One reset instead of a row insert for each mod
+        self.modModel.setMods(modItems, ignored)
+        self.sizeScanner.scan(sizes, restart=True)
         
         self.saveManager.saveJSON()
 
+        self.metadataCache.evict(modPaths)
+        self.metadataCache.flush()
+
         # Clear selections from the disabled mod check
         self.clearSelection()
 
         if sorting:
             self.sort(self.sortState['col'], False)
 
-    def getMods(self) -> list[list[str]]:
+    @span('getMods', 'io')
+    def getMods(self) -> ModScan:
         '''
-        Returns a list of two lists that have all of the mods from 
-        "\\mods", "\\Maps" and "\\assets\\mod_overrides"
+        Returns a `ModScan` that has all of the mods from 
+        "\\mods", "\\Maps", "\\assets\\mod_overrides" and the disabled mods folder
 
-        Returning Indexes:
-        + 0: mod_overrides
-        + 1: mods
-        + 2: Maps
+        Disabled mods are sorted into the type they were installed as
         '''
 
-        # Valid mods
-        mod_override: list[str] = []
-        mods: list[str] = []
-        maps: list[str] = []
+        roots: dict[str, ModType | None] = self.getModRoots()
 
-        # Mod Folder Paths
-        modsPath: str = self.p.mods()
-        mod_overridePath: str = self.p.mod_overrides()
-        maps_path: str = self.p.maps()
-        disabledModsPath: str = self.optionsManager.getDispath()
+        folders: tuple[list[str], ...] = scanModDirs(*roots.keys())
 
-        # Mod Folder Contents
-        modsFolder: List[str] = os.listdir(modsPath)
-        mod_overrideFolder: List[str] = os.listdir(mod_overridePath)
-        mapsFolder: List[str] = os.listdir(maps_path)
-        disabledModsFolder: List[str] = os.listdir(disabledModsPath)
+        # Keep the watcher in sync so this scan isn't reported again as changes
+        if set(self.watcher.roots.keys()) != {os.path.abspath(x) for x in roots.keys()}:
+            self.watcher.watch({x : MODSIGNORE if y == ModType.mods else () for x, y in roots.items()})
 
-        # Mods Folder
-        if os.path.exists(modsPath):
+        self.watcher.setSnapshots(dict(zip(roots.keys(), folders)))
 
-            for mod in modsFolder:
+        return sortModScan(folders, self.saveManager.getType)
+    
+    def getModRoots(self) -> dict[str, ModType | None]:
+        '''Returns each folder mods are found in and their type, the disabled mods folder's type is `None`'''
+
+        return {
+            self.p.mods() : ModType.mods,
+            self.p.mod_overrides() : ModType.mods_override,
+            self.p.maps() : ModType.maps,
+            self.optionsManager.getDispath() : None
+        }
+
+    @Slot()
+    def onOptionsApplied(self) -> None:
+        '''Rescans the mods if the game path or the disabled mods folder was changed'''
 
-                modPath = os.path.join(modsPath, mod)
+        if {os.path.abspath(x) for x in self.getModRoots().keys()} != set(self.watcher.roots.keys()):
+            self.refreshMods()
 
-                if mod not in MODSIGNORE and errorChecking.getFileType(modPath) == 'dir':
-                    
-                    mods.append(mod)
-        else:
-            logging.error('The mods path does not exist:\n%s\nSkipping...', modsPath)
+    def findModRow(self, mod: str) -> int | None:
+        '''Returns the row of a mod in the table, `None` if it isn't in the table or hidden by a search'''
 
-        # mod_override Folder
-        if os.path.exists(mod_overridePath):
+        row: int | None = self.modModel.findRow(mod)
 
-            for mod in mod_overrideFolder:
+        if row is None:
+            return None
 
-                modPath = os.path.join(mod_overridePath, mod)
+        index: QModelIndex = self.proxy.mapFromSource(self.modModel.index(row, ModTableModel.NAME))
 
-                if errorChecking.getFileType(modPath) == 'dir':
+        return index.row() if index.isValid() else None
 
-                    mod_override.append(mod)
-        else:
-            logging.error('The mod_overrides path does not exist:\n%s\nSkipping...', mod_overridePath)
+    def locateMod(self, mod: str) -> tuple[ModType | None, bool]:
+        '''Returns the type of a mod and if it's enabled from where the watcher last saw it'''
 
-        # maps Folder
-        if os.path.exists(maps_path):
+        roots: dict[str, ModType | None] = {os.path.abspath(x):y for x, y in self.getModRoots().items()}
+        found: list[str] = self.watcher.locate(mod)
 
-            for mod in mapsFolder:
+        # A mod in a game folder is enabled even if it's also in the disabled folder, it's linked to it
+        modTypes: list[ModType] = [roots[x] for x in found if roots.get(x) is not None]
 
-                modPath: str = os.path.join(maps_path, mod)
+        if modTypes:
+            return modTypes[0], True
 
-                if errorChecking.getFileType(modPath) == 'dir':
+        # Mods in the disabled folder keep the type they were installed as
+        if any(roots.get(x, ModType.mods) is None for x in found):
+            return self.saveManager.getType(mod), False
 
-                    maps.append(mod)
+        return None, True
+
+    @Slot()
+    def onSyncStarted(self) -> None:
+        # Each changed mod saves, only write once all of them are handled
+        self.saveManager.beginBatch()
+        self.metadataCache.beginBatch()
+
+    @Slot()
+    def onSyncFinished(self) -> None:
+        self.saveManager.endBatch()
+        self.metadataCache.endBatch()
+
+    @Slot(str, str, 'qint64', 'qint64')
+    def onSizeFound(self, mod: str, modPath: str, mtime: int, size: int) -> None:
+        self.metadataCache.setSize(modPath, mtime, size)
+        self.modModel.setSize(mod, size)
+
+    def scanSize(self, mod: str, modPath: str) -> None:
+        '''Finds the size of a single mod that was added or moved'''
+
+        sizeMtime, size = self.metadataCache.getSize(modPath)
+        self.modModel.setSize(mod, size)
+        self.sizeScanner.scan({mod : (modPath, sizeMtime)})
+
+    @Slot(str)
+    def onModAdded(self, mod: str) -> None:
+        '''Adds a row for a mod that appeared on disk'''
+
+        if self.modModel.hasMod(mod):
+            self.onModMoved(mod)
+            return
+
+        modType, isEnabled = self.locateMod(mod)
+
+        if modType is None:
+            if not isEnabled:
+                logging.error('%s needs to be installed first before becoming disabled', mod)
+            return
+
+        self.saveManager.addMods(([mod], modType))
+        self.saveManager.setEnabled(mod, isEnabled)
+
+        if not self.saveManager.getIgnored(mod):
+
+            modPath: str = self.p.mod(modType, mod) if isEnabled else os.path.join(self.optionsManager.getDispath(), mod)
+
+            version, foundAssetID = self.metadataCache.lookup(modPath)
+
+            if not self.saveManager.getModworkshopAssetID(mod):
+                self.saveManager.setModWorkshopAssetID(mod, foundAssetID)
+
+            # The proxy sorts the new row into place
+            self.addMod(name=mod, type=modType, enabled=isEnabled, version=version, tags=self.saveManager.getTags(mod))
+            self.metadataCache.flush()
+            self.scanSize(mod, modPath)
         else:
-            logging.error('The modded maps path does not exist:\n%s\nSkipping...', maps_path)
+            self.modModel.ignoreMod(mod)
 
-        # Disabled Mods Folder
-        if os.path.exists(disabledModsPath):
-            
-            for mod in disabledModsFolder:
+        self.saveManager.saveJSON()
+
+    @Slot(str)
+    def onModRemoved(self, mod: str) -> None:
+        '''Removes the row of a mod that is no longer on disk'''
 
-                if self.saveManager.hasMod(mod):
+        self.modModel.removeMod(mod)
 
-                    modType: ModType | None = self.saveManager.getType(mod)
-                    
-                    if modType == ModType.mods:
+    @Slot(str, str)
+    def onModRenamed(self, oldName: str, newName: str) -> None:
+        '''
+        Moves a mod's data to its new folder name
 
-                        mods.append(mod)
-                    
-                    elif modType == ModType.mods_override:
+        The folder could be a new version that replaced the old one, so only what the user
+        set like tags is kept. The version, asset ID and size are read again from the new folder
+        '''
 
-                        mod_override.append(mod)
-                    
-                    elif modType == ModType.maps:
+        self.saveManager.renameMod(oldName, newName)
+        self.saveManager.setModWorkshopAssetID(newName, '')
 
-                        maps.append(mod)
-                else:
-                    logging.error('%s needs to be installed first before becoming disabled', mod)
+        self.modModel.removeMod(oldName)
+        self.onModAdded(newName)
+
+    @Slot(str)
+    def onModMoved(self, mod: str) -> None:
+        '''Updates the type and enabled state of a mod that moved between folders'''
+
+        if not self.modModel.hasMod(mod):
+            self.onModAdded(mod)
+            return
+
+        modType, isEnabled = self.locateMod(mod)
+
+        if modType is None:
+            return
+
+        self.saveManager.setType(mod, modType)
+        self.saveManager.setEnabled(mod, isEnabled)
+        self.saveManager.saveJSON()
+
+        self.modModel.setType(mod, modType)
+        self.modModel.setEnabled(mod, isEnabled)
+
+        self.scanSize(mod, self.p.mod(modType, mod) if isEnabled else os.path.join(self.optionsManager.getDispath(), mod))
 
-        return mod_override, mods, maps
-    
     def visitModPage(self) -> None:
 
         if not len(self.getSelectedNameItems()) <= 0:
-            selectedItem: qtw.QTableWidgetItem = self.getSelectedNameItems()[0]
+            selectedItem: QModelIndex = self.getSelectedNameItems()[0]
 
-            assetID: str = self.saveManager.getModworkshopAssetID(selectedItem.text())
+            assetID: str = self.saveManager.getModworkshopAssetID(selectedItem.data())
 
             errorChecking.openWebPage(f'https://modworkshop.net/mod/{assetID}')
     
     def checkModUpdate(self) -> None:
+        # QtNetwork is only loaded when it's used
+        from src.api.checkModUpdate import checkModUpdate
+
         notice_title: str = qapp.translate("ModListWidget", 'Mod Update Check Results')
         @Slot(str)
         def updateDetected(newVersion: str) -> None:
@@ -456,9 +510,9 @@ class ModListWidget(qtw.QTableWidget):
         def uptoDate() -> None:
             Notice(modName + ' ' + qapp.translate("ModListWidget", 'is up to date'), notice_title).exec()
 
-        item: qtw.QTableWidgetItem = self.getSelectedNameItems()[0]
-        modName: str = self.getNameItem(self.row(item)).text()
-        modVersion: str = self.getVersionItem(self.row(item)).text()
+        item: QModelIndex = self.getSelectedNameItems()[0]
+        modName: str = item.data()
+        modVersion: str = self.getVersionItem(item.row()).data()
         assetID: str = self.saveManager.getModworkshopAssetID(modName)
 
         if not assetID:
@@ -471,10 +525,10 @@ class ModListWidget(qtw.QTableWidget):
 
     def openModDir(self) -> None:
         if not len(self.getSelectedNameItems()) <= 0:
-            selectedItem: qtw.QTableWidgetItem = self.getSelectedNameItems()[0]
+            selectedItem: QModelIndex = self.getSelectedNameItems()[0]
 
-            modName: str = self.getNameItem(self.row(selectedItem)).text()
-            modType: str = self.getTypeItem(self.row(selectedItem)).text()
+            modName: str = selectedItem.data()
+            modType: str = self.getTypeItem(selectedItem.row()).data()
 
             path: str | list[str]
             if not self.saveManager.getEnabled(modName):
@@ -486,82 +540,41 @@ class ModListWidget(qtw.QTableWidget):
                 errorChecking.startFile(path)
 
     def hideMod(self) -> None:
-        items: List[qtw.QTableWidgetItem] = self.getSelectedNameItems()
-        for item in items:
-            modName: str = item.text()
+        mods: List[str] = [x.data() for x in self.getSelectedNameItems()]
+        for modName in mods:
             self.saveManager.setIgnored(modName, True)
-            self.removeRow(item.row())
+            self.modModel.ignoreMod(modName)
         
         self.saveManager.saveJSON()
 
         self.modHidden.emit()
-        self.itemChanged.emit(items[0])
 
     def viewTags(self) -> None:
+        from src.widgets.tagViewerQWidget import TagViewer
+
         self.tagViewer = TagViewer(self)
         self.tagViewer.tagChanged.connect(lambda x, y: self.updateTags(x, y))
         self.tagViewer.show()
     
     @Slot(str, tuple)
     def updateTags(self, mod: str, tags: tuple[str]) -> None:
-        items: List[qtw.QTableWidgetItem] = self.findItems(mod, qt.MatchFlag.MatchFixedString)
-        if items:
-            item: qtw.QTableWidgetItem = items[0]
-            item.setData(ModRole.tags, sorted(tags))
+        self.modModel.setTags(mod, sorted(tags))
 
     @Slot(str)
     def search(self, input: str) -> None:
-        searchedTags = None
-
-        if input.startswith('tag:') and len(input) > 4:
-            splitStr: List[str] = input.split(' ')
-            input = ' '.join(splitStr[1:])
-            searchedTags: List[str] = splitStr[0][4:].split(',')
-
-        results: List[qtw.QTableWidgetItem] = self.findItems(
-            f'{input}*',
-            qt.MatchFlag.MatchWildcard | qt.MatchFlag.MatchExactly
-        )
-
-        for i in range(0, self.rowCount() + 1):
-
-            item: qtw.QTableWidgetItem | None = self.item(i, 0)
-            if item is not None:
-                modTags: tuple[str] | None = item.data(ModRole.tags)
-
-            if searchedTags is not None and modTags is not None:
-                for tag in searchedTags:
-                    if tag in modTags and item in results:
-                        self.setRowHidden(i, False)
-                    else:
-                        self.setRowHidden(i, True)
-            else:
-                if item in results and searchedTags is None:
-                    self.setRowHidden(i, False)
-                else:
-                    self.setRowHidden(i, True)
+        self.proxy.setSearch(input)
     
     @Slot(str)
     def swapIcons(self, mode: str) -> None:
-
-        newIcon = MODWORKSHOP_LOGO_W if mode == LIGHT else MODWORKSHOP_LOGO_B
-
-        reverseDict: dict[str, str] = {
-            MODWORKSHOP_LOGO_B : MODWORKSHOP_LOGO_W,
-            MODWORKSHOP_LOGO_W : MODWORKSHOP_LOGO_B
-        }
-
-        for i in range(0, self.rowCount() - 1):
-            item: qtw.QTableWidgetItem = self.getNameItem(i)
-
-            if not item.icon().isNull():
-                item.setIcon(qtg.QIcon(os.path.join(UI_GRAPHICS_PATH, reverseDict[newIcon])))
+        self.modModel.setModworkshopIcon(self.getModworkshopIcon(mode))
 
     def installMods(self, *urls: str) -> None:
 
         dirs: list[str] = [x for x in urls if errorChecking.getFileType(x) == 'dir']
         zips: list[str] = [x for x in urls if errorChecking.getFileType(x) == 'zip']
 
+        from src.widgets.QDialog.newModQDialog import newModLocation
+
         # Gather where the user wants each mod to go
         notice = newModLocation(*[x for x in list(dirs + zips)])
         notice.exec()
@@ -593,21 +606,21 @@ class ModListWidget(qtw.QTableWidget):
             startFileMover = ProgressWidget(UnZipMod(*zipsTuple))
             startFileMover.exec()
     
-        self.itemChanged.emit(qtw.QTableWidgetItem())
-        self.refreshMods()
+        # The watcher adds a row for each new mod
+        self.watcher.sync(True)
 
 # EVENT OVERRIDES
     def mousePressEvent(self, event: qtg.QMouseEvent) -> None:
 
         if event.button() == qt.MouseButton.RightButton:
             
-            # Will return None if there are no mods causing a traceback
-            tableWidgetItem: qtw.QTableWidgetItem | None = self.itemAt(event.pos())
+            # Will be invalid if there are no mods
+            index: QModelIndex = self.indexAt(event.pos())
 
-            if tableWidgetItem is not None:
+            if index.isValid():
 
                 if len(self.getSelectedNameItems()) <= 1:
-                    self.selectRow(tableWidgetItem.row())
+                    self.selectRow(index.row())
                 self.contextMenu.exec(qtg.QCursor.pos())
 
         return super().mousePressEvent(event)
@@ -0,0 +1,391 @@
+import logging
+from collections import Counter
+from typing import Any, Sequence, Iterable
+
+import PySide6.QtGui as qtg
+from PySide6.QtCore import (
+    Qt as qt, QCoreApplication as qapp, QAbstractTableModel, QSortFilterProxyModel,
+    QModelIndex, QPersistentModelIndex, QRegularExpression, Signal
+)
+
+from src.save import Save
+from src.searchIndex import SearchIndex
+from src.constant_vars import ModType, ModRole, ModCount
+
+class ModItem():
+    '''The data of one row in `ModTableModel`'''
+
+    __slots__ = ('name', 'type', 'enabled', 'version', 'tags', 'modworkshop', 'size')
+
+    def __init__(self, name: str, type: ModType, enabled: bool = True, version: str = 'None', tags: Sequence[str] | None = None, modworkshop: bool = False, size: int = 0) -> None:
+        self.name: str = name
+        self.type: ModType = type
+        self.enabled: bool = bool(enabled)
+        self.version: str = version
+        self.tags: tuple[str, ...] = tuple(tags) if tags is not None else ()
+        self.modworkshop: bool = modworkshop
+        self.size: int = size # Bytes, 0 until it's known
+
+class ModTableModel(QAbstractTableModel):
+    '''
+    Table model of the installed mods
+
+    Each mod is a `ModItem`, text is only created when a row is painted.
+    `counts` is updated as rows change and `countChanged` is emitted for each counter that changed
+    '''
+
+    countChanged = Signal(str, 'qint64') # ModCount or ModType, new count
+
+    NAME = 0
+    TYPE = 1
+    ENABLED = 2
+    VERSION = 3
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        logging.getLogger(__name__)
+
+        self.mods: list[ModItem] = []
+        self.rows: dict[str, int] = {} # Mod name -> row it was last seen at, see `findRow`
+
+        self.tagRevision: int = 0 # Increases each time the tags of a row change
+
+        self.searchIndex = SearchIndex()
+
+        self.ignored: set[str] = set() # Mods that are installed but not shown
+        self.counts: dict[str, int] = dict.fromkeys(list(ModCount) + list(ModType), 0)
+
+        self.modworkshopIcon: qtg.QIcon | None = None
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.mods)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 4
+
+    def headerData(self, section: int, orientation: qt.Orientation, role: int = qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != qt.Orientation.Horizontal or role != qt.ItemDataRole.DisplayRole:
+            return None
+
+        return (
+            qapp.translate("ModListWidget", 'Name'),
+            qapp.translate("ModListWidget", 'Type'),
+            qapp.translate("ModListWidget", 'Enabled'),
+            qapp.translate("ModListWidget", 'Version')
+        )[section]
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        mod: ModItem = self.mods[index.row()]
+        column: int = index.column()
+
+        if role == qt.ItemDataRole.DisplayRole:
+            match column:
+                case self.NAME:
+                    return mod.name
+                case self.TYPE:
+                    return mod.type.value
+                case self.ENABLED:
+                    return qapp.translate('ModListWidget', 'Enabled') if mod.enabled else qapp.translate('ModListWidget', 'Disabled')
+                case self.VERSION:
+                    return '1.0.0' if mod.version == 'None' else mod.version
+
+        elif column == self.NAME:
+            if role == qt.ItemDataRole.DecorationRole and mod.modworkshop:
+                return self.modworkshopIcon
+            elif role == ModRole.tags:
+                return mod.tags
+
+        return None
+
+    def setModworkshopIcon(self, icon: qtg.QIcon) -> None:
+        self.modworkshopIcon = icon
+        self.__columnChanged(self.NAME, qt.ItemDataRole.DecorationRole)
+
+    def retranslate(self) -> None:
+        '''Updates the text that is translated'''
+        self.headerDataChanged.emit(qt.Orientation.Horizontal, 0, self.columnCount() - 1)
+        self.__columnChanged(self.ENABLED, qt.ItemDataRole.DisplayRole)
+
+    def findRow(self, mod: str) -> int | None:
+        '''
+        Returns the row of a mod, `None` if it doesn't have one
+
+        Removing a row doesn't renumber the rows under it, they only ever move up
+        so the mod is found by looking up from the row it was last seen at
+        '''
+
+        row: int | None = self.rows.get(mod)
+
+        if row is None:
+            return None
+
+        row = min(row, len(self.mods) - 1)
+
+        while self.mods[row].name != mod:
+            row -= 1
+
+        self.rows[mod] = row
+        return row
+
+    def getMod(self, mod: str) -> ModItem | None:
+        row: int | None = self.findRow(mod)
+        return self.mods[row] if row is not None else None
+
+    def hasMod(self, mod: str) -> bool:
+        return mod in self.rows
+
+    def setMods(self, mods: list[ModItem], ignored: Iterable[str] = ()) -> None:
+        '''Replaces every row, `ignored` are the mods that are installed but hidden'''
+
+        self.beginResetModel()
+        self.mods = mods
+        self.rows = {x.name:i for i, x in enumerate(mods)}
+        self.ignored = set(ignored)
+
+        self.searchIndex.clear()
+
+        counts: Counter = Counter()
+
+        for mod in mods:
+            self.__indexSearch(mod)
+            self.__countMod(mod, 1, counts)
+
+        self.tagRevision += 1
+        self.endResetModel()
+
+        counts[ModCount.ignored] = len(self.ignored)
+        self.__applyCounts({x : counts[x] - y for x, y in self.counts.items()})
+
+    def addMod(self, mod: ModItem) -> None:
+        '''Adds a row, if the mod already has a row it's replaced'''
+
+        row: int | None = self.findRow(mod.name)
+
+        if row is not None:
+            self.__indexSearch(mod)
+
+            counts: Counter = Counter()
+            self.__countMod(self.mods[row], -1, counts)
+            self.__countMod(mod, 1, counts)
+
+            if self.mods[row].tags != mod.tags:
+                self.tagRevision += 1
+
+            self.mods[row] = mod
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+            self.__applyCounts(counts)
+            return
+
+        row = len(self.mods)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.mods.append(mod)
+        self.rows[mod.name] = row
+        self.__indexSearch(mod)
+
+        if mod.tags:
+            self.tagRevision += 1
+
+        self.endInsertRows()
+
+        self.__applyCounts(self.__countMod(mod, 1, Counter()))
+
+    def removeMod(self, mod: str) -> None:
+        '''Removes a mod's row, or stops counting it as ignored'''
+
+        if mod in self.ignored:
+            self.ignored.discard(mod)
+            self.__applyCounts({ModCount.ignored : -1})
+
+        row: int | None = self.findRow(mod)
+
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item: ModItem = self.mods.pop(row)
+        self.searchIndex.remove(mod)
+        self.rows.pop(mod)
+
+        if item.tags:
+            self.tagRevision += 1
+
+        self.endRemoveRows()
+
+        self.__applyCounts(self.__countMod(item, -1, Counter()))
+
+    def ignoreMod(self, mod: str) -> None:
+        '''Removes a mod's row and counts it as ignored'''
+
+        if mod in self.ignored:
+            return
+
+        self.removeMod(mod)
+
+        self.ignored.add(mod)
+        self.__applyCounts({ModCount.ignored : 1})
+
+    def setEnabled(self, mod: str, enabled: bool) -> None:
+        self.__setValue(mod, 'enabled', bool(enabled), self.ENABLED)
+
+    def setType(self, mod: str, type: ModType) -> None:
+        self.__setValue(mod, 'type', type, self.TYPE)
+
+    def setSize(self, mod: str, size: int) -> None:
+        self.__setValue(mod, 'size', size)
+
+    def setTags(self, mod: str, tags: Sequence[str]) -> None:
+        item: ModItem | None = self.getMod(mod)
+
+        # The proxy filters the row again when it changes, the tags it searched for are looked up again
+        if item is not None:
+            self.tagRevision += 1
+
+        self.__setValue(mod, 'tags', tuple(tags), self.NAME)
+
+        if item is not None:
+            self.__indexSearch(item)
+
+    def typeCount(self, modType: ModType) -> int:
+        return self.counts[modType]
+
+    def __countMod(self, mod: ModItem, sign: int, counts: Counter) -> Counter:
+        '''Adds (`sign` = 1) or subtracts (`sign` = -1) a mod from `counts`'''
+
+        counts[ModCount.total] += sign
+        counts[mod.type] += sign
+        counts[ModCount.enabled if mod.enabled else ModCount.disabled] += sign
+        counts[ModCount.size] += sign * mod.size
+
+        return counts
+
+    def __applyCounts(self, changes: dict[str, int]) -> None:
+        for key, change in changes.items():
+            if change:
+                self.counts[key] += change
+                self.countChanged.emit(key, self.counts[key])
+
+    def __indexSearch(self, mod: ModItem) -> None:
+        version: tuple[str, ...] = (mod.version, ) if mod.version != 'None' else ()
+        self.searchIndex.add(mod.name, mod.tags + version)
+
+    def __setValue(self, mod: str, attr: str, value: Any, column: int | None = None) -> None:
+        row: int | None = self.findRow(mod)
+
+        if row is None or getattr(self.mods[row], attr) == value:
+            return
+
+        item: ModItem = self.mods[row]
+        counts: Counter = self.__countMod(item, -1, Counter())
+
+        setattr(item, attr, value)
+
+        if column is not None:
+            self.__cellChanged(row, column)
+
+        self.__applyCounts(self.__countMod(item, 1, counts))
+
+    def __cellChanged(self, row: int, column: int) -> None:
+        index: QModelIndex = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    def __columnChanged(self, column: int, role: int) -> None:
+        if self.mods:
+            self.dataChanged.emit(self.index(0, column), self.index(len(self.mods) - 1, column), [role])
+
+class ModSortFilterProxy(QSortFilterProxyModel):
+    '''Sorts and filters `ModTableModel` rows for the search bar'''
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+
+        self.setFilterKeyColumn(ModTableModel.NAME)
+        self.setDynamicSortFilter(True)
+
+        self.searchedTags: tuple[str, ...] = ()
+
+        # The mods that have every searched tag, looked up in `Save` again when the model's tags change
+        self.taggedMods: set[str] = set()
+        self.taggedRevision: int = -1
+
+        # Ranked search, `None` when there is no query or the query uses wildcards
+        self.query: str | None = None
+        self.scores: dict[str, float] = {}
+        self.scoresRevision: int = -1
+
+    def setSearch(self, input: str) -> None:
+        '''
+        Filters and ranks the mods by name, tags and version,
+        a query with `*` or `?` is matched as a wildcard pattern instead.
+        `tag:` followed by comma seperated tags filters by tags too
+        '''
+
+        searchedTags: tuple[str, ...] = ()
+
+        if input.startswith('tag:') and len(input) > 4:
+            splitStr: list[str] = input.split(' ')
+            input = ' '.join(splitStr[1:])
+            searchedTags = tuple(x for x in splitStr[0][4:].split(',') if x)
+
+        self.searchedTags = searchedTags
+        self.taggedRevision = -1
+
+        if '*' in input or '?' in input:
+            self.query = None
+
+            self.setFilterRegularExpression(
+                QRegularExpression(
+                    QRegularExpression.wildcardToRegularExpression(f'{input}*'),
+                    QRegularExpression.PatternOption.CaseInsensitiveOption
+                )
+            )
+        else:
+            self.query = input.strip() or None
+            self.scoresRevision = -1
+            self.setFilterRegularExpression(QRegularExpression())
+
+        # Sorts by rank too, the regex and tags might not have changed
+        self.invalidate()
+
+    def getScores(self) -> dict[str, float]:
+        model: ModTableModel = self.sourceModel()
+
+        if self.scoresRevision != model.searchIndex.revision:
+            self.scores = model.searchIndex.search(self.query)
+            self.scoresRevision = model.searchIndex.revision
+
+        return self.scores
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex | QPersistentModelIndex) -> bool:
+        model: ModTableModel = self.sourceModel()
+
+        if self.searchedTags:
+            if self.taggedRevision != model.tagRevision:
+                self.taggedMods = Save.modsWithTags(*self.searchedTags)
+                self.taggedRevision = model.tagRevision
+
+            if model.mods[source_row].name not in self.taggedMods:
+                return False
+
+        if self.query is not None:
+            return model.mods[source_row].name in self.getScores()
+
+        return super().filterAcceptsRow(source_row, source_parent)
+
+    def lessThan(self, source_left: QModelIndex | QPersistentModelIndex, source_right: QModelIndex | QPersistentModelIndex) -> bool:
+        # Better matches stay on top whichever way the column is sorted
+        if self.query is not None:
+            model: ModTableModel = self.sourceModel()
+            scores: dict[str, float] = self.getScores()
+
+            leftScore: float = scores.get(model.mods[source_left.row()].name, 0.0)
+            rightScore: float = scores.get(model.mods[source_right.row()].name, 0.0)
+
+            if leftScore != rightScore:
+                ascending: bool = self.sortOrder() == qt.SortOrder.AscendingOrder
+                return leftScore > rightScore if ascending else leftScore < rightScore
+
+        return super().lessThan(source_left, source_right)
@@ -6,13 +6,16 @@ import logging
 import PySide6.QtGui as qtg
 import PySide6.QtWidgets as qtw
 from PySide6.QtCore import (
-    QThread, QCoreApplication as qapp, Slot, QMutex, QMutexLocker, QSignalBlocker
+    QThread, QCoreApplication as qapp, Slot, QMutex, QMutexLocker, QSignalBlocker, QTimer
 )
 
 from src.widgets.QDialog.QDialog import Dialog
+from src.modSizes import formatSize
+from src.constant_vars import PROGRESS_FPS
 
 if TYPE_CHECKING:
     from src.threaded.workerQObject import Worker
+    from src.threaded.progressChannel import ProgressState
 
 class ProgressWidget(Dialog):
     '''
@@ -49,6 +52,13 @@ class ProgressWidget(Dialog):
         
         self.setLayout(layout)
 
+        # The worker's progress is read at a fixed rate so it never waits on painting
+        self.revision: int = 0
+
+        self.pollTimer = QTimer(self)
+        self.pollTimer.setInterval(1000 // PROGRESS_FPS)
+        self.pollTimer.timeout.connect(self.pollProgress)
+
         self.__initMode()
 
     def __initMode(self) -> None:
@@ -59,22 +69,21 @@ class ProgressWidget(Dialog):
         self.mode.moveToThread(self.qthread)
         
         # Connect signals
-        self.qthread.started.connect(self.mode.start)
-        self.mode.setTotalProgress.connect(self.setMaxProgress)
-        self.mode.setCurrentProgress.connect(self.updateProgressBar)
-        self.mode.addTotalProgress.connect(self.addMaxProgress)
+        self.qthread.started.connect(self.mode.run)
         self.mode.doneCanceling.connect(self.reject)
         self.mode.error.connect(self.errorRaised)
         self.mode.succeeded.connect(self.succeeded)
     
     def exec(self) -> int:
 
+        self.pollTimer.start()
         self.qthread.start()
         return super().exec()
 
     @Slot(str)
     def errorRaised(self, message: str) -> None:
         logging.error(message)
+        self.pollProgress()
         with QSignalBlocker(self.infoLabel):
             self.infoLabel.setText(
                 f'{message}\n'+
@@ -93,6 +102,7 @@ class ProgressWidget(Dialog):
         self.accept()
     
     def cleanup(self) -> None:
+        self.pollTimer.stop()
         self.qthread.quit()
         self.qthread.wait()
         self.mode.deleteLater()
@@ -130,25 +140,26 @@ class ProgressWidget(Dialog):
         with QSignalBlocker(button):
             button.setDisabled(True)
 
-    @Slot(int)
-    def addMaxProgress(self, x: int) -> None:
-        with QSignalBlocker(self.progressBar):
-            max: int = self.progressBar.maximum()
-            self.progressBar.setMaximum(max + x)
+    @Slot()
+    def pollProgress(self) -> None:
+        '''Shows the worker's latest progress if it changed since the last poll'''
+
+        state: ProgressState = self.mode.progress.snapshot()
+
+        if state.revision == self.revision:
+            return
+
+        self.revision = state.revision
 
-    @Slot(int)
-    def setMaxProgress(self, x: int) -> None:
         with QSignalBlocker(self.progressBar):
-            self.progressBar.setMaximum(x)
+            self.progressBar.setMaximum(max(state.total, state.value))
+            self.progressBar.setValue(state.value)
 
-    @Slot(int, str)
-    def updateProgressBar(self, x: int, y: str) -> None:
-        '''
-        Adds progress to the current progress
-        bar value and changes the text of the label
-        '''
-        #with QSignalBlocker(self.infoLabel):
-        self.infoLabel.setText(y)
-        #with QSignalBlocker(self.progressBar):
-        newValue: int = x + self.progressBar.value()
-        self.progressBar.setValue(newValue)
+        message: str = state.message
+
+        if state.bytesTotal:
+            message += f'\n{formatSize(state.bytesDone)} / {formatSize(state.bytesTotal)}'
+
+        if message:
+            with QSignalBlocker(self.infoLabel):
+                self.infoLabel.setText(message)
@@ -5,7 +5,7 @@ import PySide6.QtWidgets as qtw
 import PySide6.QtGui as qtg
 from PySide6.QtCore import Signal, QCoreApplication as qapp
 
-from src.constant_vars import ModRole, PROGRAM_NAME, ICON
+from src.constant_vars import PROGRAM_NAME, ICON
 from src.widgets.QMenu.tagViewerQMenu import TagViewerMenu
 from src.widgets.QDialog.tagHandlerQDialog import TagHandler
 from src.widgets.tagDisplayQTable import TagDisplay
@@ -94,18 +94,11 @@ class TagViewer(qtw.QWidget):
         if self.tagQTable.rowCount() > 0:
             self.tagQTable.setRowCount(0)
 
-        for i in range(self.managerTable.rowCount()):
-            modNameItem = self.managerTable.item(i, 0)
-            modTagsData: tuple[str] = modNameItem.data(ModRole.tags)
-
-            # TODO: Figure out what the point of this codeblock is, IDE says code is unreachable
-            if modTagsData is None:
-                modTagsData = ()
-            
+        for i, mod in enumerate(self.managerTable.modModel.mods):
             self.tagQTable.insertRow(i)
 
-            modName = qtw.QTableWidgetItem(modNameItem.text())
-            modTags = qtw.QTableWidgetItem(', '.join(modTagsData))
+            modName = qtw.QTableWidgetItem(mod.name)
+            modTags = qtw.QTableWidgetItem(', '.join(mod.tags))
 
             self.tagQTable.setItem(i, 0, modName)
             self.tagQTable.setItem(i, 1, modTags)
@@ -0,0 +1,47 @@
+import os
+import json
+import tempfile
+
+from src.JSONParser import JSONParser
+
+def test_saveJSON() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: str = os.path.join(tmp_dir, 'test.json')
+
+        parser = JSONParser(path)
+        assert parser.file == {}
+
+        parser.file['mod'] = {'enabled' : True}
+        parser.saveJSON()
+
+        with open(path, 'r') as f:
+            assert json.loads(f.read()) == {'mod' : {'enabled' : True}}
+
+        # Nothing changed so the file isn't replaced
+        stamp = parser.fileStamp()
+        parser.saveJSON()
+        assert parser.fileStamp() == stamp
+
+        # No temporary files are left behind
+        assert os.listdir(tmp_dir) == ['test.json']
+
+def test_batch() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: str = os.path.join(tmp_dir, 'test.json')
+
+        parser = JSONParser(path)
+
+        with parser.batch():
+            for i in range(10):
+                parser.file[str(i)] = i
+                parser.saveJSON()
+
+            assert parser.pendingSave
+
+            with open(path, 'r') as f:
+                assert json.loads(f.read()) == {}
+
+        assert not parser.pendingSave
+
+        with open(path, 'r') as f:
+            assert len(json.loads(f.read())) == 10
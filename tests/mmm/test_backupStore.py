@@ -0,0 +1,44 @@
+import os
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.backupStore import BackupStore
+from src.constant_vars import BACKUP_CHUNK_SIZE
+
+@pytest.fixture(scope='function')
+def create_store() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open(os.path.join(tmp_dir, 'big.bin'), 'wb') as f:
+            f.write(os.urandom(BACKUP_CHUNK_SIZE) * 2 + b'end')
+
+        yield tmp_dir, BackupStore(os.path.join(tmp_dir, 'store'))
+
+def test_storeFile(create_store: tuple[str, BackupStore]) -> None:
+    tmp_dir, store = create_store
+    path: str = os.path.join(tmp_dir, 'big.bin')
+
+    chunks: list[str] = store.storeFile(path)
+
+    # The two identical chunks are stored once
+    assert len(chunks) == 3
+    assert chunks[0] == chunks[1]
+    assert sum(len(x) for _, _, x in os.walk(store.chunksPath)) == 2
+
+    with open(path, 'rb') as f:
+        assert b''.join(store.readFile(chunks)) == f.read()
+
+def test_prune(create_store: tuple[str, BackupStore]) -> None:
+    tmp_dir, store = create_store
+
+    chunks: list[str] = store.storeFile(os.path.join(tmp_dir, 'big.bin'))
+    old: str = store.saveManifest({'mod' : {'type' : 'mods', 'enabled' : True, 'folders' : [''], 'files' : {'big.bin' : [0, 0, chunks]}}})
+    new: str = store.saveManifest({'mod' : {'type' : 'mods', 'enabled' : True, 'folders' : [''], 'files' : {}}})
+
+    assert store.manifests() == [old, new]
+
+    # The chunks were only used by the old backup
+    assert store.prune(1) == (1, 2)
+    assert store.manifests() == [new]
+    assert store.latestManifest()['mods']['mod']['files'] == {}
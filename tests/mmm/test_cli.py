@@ -0,0 +1,108 @@
+import io
+import os
+import json
+import tempfile
+from configparser import ConfigParser
+
+import pytest
+
+from src.cli import main
+from src.JSONParser import JSONParser
+from src.sqliteStore import SQLiteStore
+from src.journal import Journal
+from src.constant_vars import DATABASE, JOURNAL, STORAGE_SQLITE, OptionKeys, ModKeys, ModType, LinkMode
+
+def run(*argv: str) -> tuple[int, dict]:
+    out = io.StringIO()
+    code: int = main(list(argv), out)
+    return code, json.loads(out.getvalue())
+
+def test_cli(qapp, create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, createTemp_Profiles_ini: str) -> None:
+    paths: tuple[str, ...] = ('--options', createTemp_Config_ini, '--save', createTemp_Mod_ini, '--profiles', createTemp_Profiles_ini)
+
+    code, result = run(*paths, 'list', '--type', 'mods')
+    assert code == 0 and result['ok']
+    assert result['mods'] == [{'name' : 'make game easy mod', 'type' : 'mods', 'enabled' : True, 'ignored' : False, 'tags' : [], 'profiles' : []}]
+
+    code, result = run(*paths, 'disable', 'make game easy mod', 'best mod ever')
+    assert code == 0
+    assert result['disabled'] == ['make game easy mod', 'best mod ever']
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'disabledMods', 'make game easy mod'))
+
+    code, result = run(*paths, 'list', '--disabled')
+    assert [x['name'] for x in result['mods']] == ['best mod ever', 'make game easy mod']
+
+    code, result = run(*paths, 'enable', 'best mod ever')
+    assert result['enabled'] == ['best mod ever']
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'best mod ever'))
+
+    # None of the profile's mods are installed
+    code, result = run(*paths, 'apply-profile', 'Awesome mods')
+    assert code == 0
+    assert 'best mod ever' in result['disabled']
+    assert result['notInstalled'] == ['among us guards', 'cool_beans', 'make game easy']
+
+    code, result = run(*paths, 'enable', 'not a mod')
+    assert code == 1 and not result['ok']
+    assert 'not a mod' in result['error']
+
+    code, result = run(*paths, 'delete', 'make game easy mod')
+    assert code == 0
+    assert result['deleted'] == ['make game easy mod']
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'disabledMods', 'make game easy mod'))
+
+    with open(createTemp_Mod_ini) as f:
+        assert 'make game easy mod' not in json.load(f)
+
+    code, result = run(*paths, 'restore', '--backup', os.path.join(create_mod_dirs, 'not a backup.zip'))
+    assert code == 1
+    assert 'not a backup.zip' in result['error']
+
+def test_sqlite(qapp, monkeypatch: pytest.MonkeyPatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        monkeypatch.chdir(tmp_dir)
+
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+
+        os.makedirs(os.path.join(tmp_dir, 'mods', 'a mod'))
+        os.makedirs(os.path.join(tmp_dir, 'disabledMods'))
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+        config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.move.value)
+        config.set(OptionKeys.section.value, OptionKeys.storage.value, STORAGE_SQLITE)
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({'a mod' : {ModKeys.type.value : ModType.mods.value, ModKeys.enabled.value : True}}, f)
+
+        code, result = run('--options', optionsPath, '--save', savePath, 'disable', 'a mod')
+        assert code == 0
+
+        # Written to the database the GUI uses
+        store = SQLiteStore(os.path.join(tmp_dir, DATABASE))
+        assert json.loads(store.load(SQLiteStore.MODS, savePath, {})['a mod'])[ModKeys.enabled.value] is False
+        store.close()
+
+        assert JSONParser.store is None
+
+def test_running(qapp, create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(create_mod_dirs)
+
+    # The GUI is in the middle of an operation
+    with Journal(JOURNAL).transaction('MoveToDisabledDir'):
+        code, result = run('--options', createTemp_Config_ini, '--save', createTemp_Mod_ini, 'list')
+
+        assert code == 1
+        assert 'Another operation is running' in result['error']
+
+        # The live operation isn't rolled back
+        assert Journal(JOURNAL).pending()
+
+    code, result = run('--options', createTemp_Config_ini, '--save', createTemp_Mod_ini, 'list')
+    assert code == 0
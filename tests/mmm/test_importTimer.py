@@ -0,0 +1,43 @@
+import os
+import sys
+import logging
+import tempfile
+
+import pytest
+
+import src.importTimer as importTimer
+from src.constant_vars import IMPORT_TIME_ENV
+
+def test_disabled() -> None:
+    assert importTimer.install({}) is None
+
+def test_importTimer(caplog: pytest.LogCaptureFixture) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.mkdir(os.path.join(tmp_dir, 'timedpackage'))
+
+        with open(os.path.join(tmp_dir, 'timedpackage', '__init__.py'), 'w') as f:
+            f.write('from timedpackage import child\n')
+
+        with open(os.path.join(tmp_dir, 'timedpackage', 'child.py'), 'w') as f:
+            f.write('VALUE = 1\n')
+
+        sys.path.insert(0, tmp_dir)
+        timer = importTimer.install({IMPORT_TIME_ENV : '1'})
+
+        try:
+            import timedpackage
+            assert timedpackage.child.VALUE == 1
+        finally:
+            timer.uninstall()
+            sys.path.remove(tmp_dir)
+            sys.modules.pop('timedpackage', None)
+            sys.modules.pop('timedpackage.child', None)
+
+    assert timer not in sys.meta_path
+    assert timer.cumulative['timedpackage'] >= timer.cumulative['timedpackage.child']
+    assert timer.selfTimes['timedpackage'] <= timer.cumulative['timedpackage']
+
+    with caplog.at_level(logging.INFO):
+        timer.report()
+
+    assert 'timedpackage.child' in caplog.text
@@ -0,0 +1,123 @@
+import os
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.journal import Journal, JournalStep, JournalReport, JournalLocked
+from src.modLinks import isLink, linkMod
+from src.constant_vars import JournalAction, LinkMode, MOVE_PARTIAL_SUFFIX, MOVE_REPLACED_SUFFIX
+
+@pytest.fixture(scope='function')
+def create_dirs() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for path in ('mods', 'disabled'):
+            os.mkdir(os.path.join(tmp_dir, path))
+
+        for mod in ('mod 1', 'mod 2'):
+            os.makedirs(os.path.join(tmp_dir, 'mods', mod, 'lua'))
+
+            with open(os.path.join(tmp_dir, 'mods', mod, 'lua', 'main.lua'), 'w') as f:
+                f.write('log("hi")')
+
+        yield tmp_dir
+
+def interrupt(journal: Journal, *steps: JournalStep) -> None:
+    '''Writes a journal like a worker that never finished'''
+
+    journal.file = open(journal.path, 'w', encoding='utf-8')
+    journal.write({'worker' : 'TestWorker'})
+    journal.plan(*steps)
+    journal.file.close()
+    journal.file = None
+
+def test_transaction(create_dirs: str) -> None:
+    journal = Journal(os.path.join(create_dirs, 'operations.journal'))
+
+    # Nothing is written outside of a transaction
+    journal.plan(JournalStep(JournalAction.move, 'a', 'b'))
+    assert not journal.pending()
+
+    with journal.transaction('TestWorker'):
+        journal.plan(JournalStep(JournalAction.move, 'a', 'b'))
+        assert journal.read() == ('TestWorker', [JournalStep(JournalAction.move, 'a', 'b')])
+
+    assert not journal.pending()
+
+def test_locked(create_dirs: str) -> None:
+    path: str = os.path.join(create_dirs, 'operations.journal')
+
+    # Another process running an operation has the lock
+    with Journal(path).transaction('TestWorker'):
+        with pytest.raises(JournalLocked):
+            with Journal(path).locked():
+                pass
+
+        assert Journal(path).pending()
+
+    with Journal(path).locked():
+        assert not Journal(path).pending()
+
+def test_recoverMoves(create_dirs: str) -> None:
+    journal = Journal(os.path.join(create_dirs, 'operations.journal'))
+    mods: str = os.path.join(create_dirs, 'mods')
+    disabled: str = os.path.join(create_dirs, 'disabled')
+
+    interrupt(
+        journal,
+        JournalStep(JournalAction.move, os.path.join(mods, 'mod 1'), os.path.join(disabled, 'mod 1')),
+        JournalStep(JournalAction.move, os.path.join(mods, 'mod 2'), os.path.join(disabled, 'mod 2'))
+    )
+
+    # The first mod was moved and the second was halfway through a copy
+    os.rename(os.path.join(mods, 'mod 1'), os.path.join(disabled, 'mod 1'))
+    os.mkdir(os.path.join(disabled, 'mod 2' + MOVE_PARTIAL_SUFFIX))
+
+    assert journal.pending()
+    assert journal.recover() == JournalReport('TestWorker', 1, 0)
+
+    assert sorted(os.listdir(mods)) == ['mod 1', 'mod 2']
+    assert os.listdir(disabled) == []
+    assert not journal.pending()
+
+def test_recoverRestore(create_dirs: str) -> None:
+    journal = Journal(os.path.join(create_dirs, 'operations.journal'))
+    mods: str = os.path.join(create_dirs, 'mods')
+
+    interrupt(
+        journal,
+        *[JournalStep(JournalAction.restore, os.path.join(mods, x + MOVE_PARTIAL_SUFFIX), os.path.join(mods, x), os.path.join(mods, x + MOVE_REPLACED_SUFFIX)) for x in ('mod 1', 'mod 2')]
+    )
+
+    # The first restored copy was in place and the second was moved aside before it could be
+    os.rename(os.path.join(mods, 'mod 1'), os.path.join(mods, 'mod 1' + MOVE_REPLACED_SUFFIX))
+    os.mkdir(os.path.join(mods, 'mod 1'))
+    os.rename(os.path.join(mods, 'mod 2'), os.path.join(mods, 'mod 2' + MOVE_REPLACED_SUFFIX))
+    os.mkdir(os.path.join(mods, 'mod 2' + MOVE_PARTIAL_SUFFIX))
+
+    assert journal.recover().rolledBack == 2
+
+    assert sorted(os.listdir(mods)) == ['mod 1', 'mod 2']
+
+    # The restored copy is kept and the installed copy is put back
+    assert os.listdir(os.path.join(mods, 'mod 1')) == []
+    assert os.listdir(os.path.join(mods, 'mod 2')) == ['lua']
+
+def test_recoverLinks(create_dirs: str) -> None:
+    journal = Journal(os.path.join(create_dirs, 'operations.journal'))
+    target: str = os.path.join(create_dirs, 'mods', 'mod 1')
+    linked: str = os.path.join(create_dirs, 'disabled', 'mod 1')
+    unlinked: str = os.path.join(create_dirs, 'disabled', 'mod 2')
+
+    interrupt(
+        journal,
+        JournalStep(JournalAction.unlink, target, link=unlinked, mode=LinkMode.symlink),
+        JournalStep(JournalAction.link, target, link=linked, mode=LinkMode.symlink)
+    )
+
+    linkMod(target, linked, LinkMode.symlink)
+
+    assert journal.recover().rolledBack == 2
+
+    assert not os.path.lexists(linked)
+    assert isLink(unlinked)
@@ -4,6 +4,7 @@ import PySide6.QtWidgets as qtw
 from PySide6.QtCore import QSize
 
 from src.main_window import MainWindow
+from src.profiles import modProfile
 from src.constant_vars import PROGRAM_NAME, VERSION
 
 def test_main_window(qtbot: QtBot, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
@@ -15,6 +16,10 @@ def test_main_window(qtbot: QtBot, createTemp_Config_ini: str, createTemp_Mod_in
     assert len(widget.findChildren(qtw.QTabWidget)) == 1             # Has a tab widget
     assert widget.tab.count() == 5                                   # Amount of tabs
 
+    assert widget.profile is None                                    # Tabs are built when opened
+    widget.tab.setCurrentIndex(1)
+    assert isinstance(widget.tab.widget(1).findChild(modProfile), modProfile)
+
     widget.resize(1000, 900)
     widget.close()
     assert widget.optionsManager.getWindowSize() == QSize(1000, 900) # Saving window size
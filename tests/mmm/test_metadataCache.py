@@ -0,0 +1,68 @@
+import os
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.metadataCache import MetadataCache
+
+XML = '<table><AssetUpdates id="{id}" version="{version}" provider="modworkshop"/></table>'
+
+@pytest.fixture(scope='function')
+def create_cache() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        modPath: str = os.path.join(tmp_dir, 'cool mod')
+        os.mkdir(modPath)
+
+        with open(os.path.join(modPath, 'main.xml'), 'w') as f:
+            f.write(XML.format(id='1234', version='1.2.3'))
+
+        yield MetadataCache(os.path.join(tmp_dir, 'cache.json')), modPath
+
+def test_lookup(create_cache: tuple[MetadataCache, str]) -> None:
+    cache, modPath = create_cache
+
+    assert cache.lookup(modPath) == ('1.2.3', '1234')
+    assert cache.modified
+
+    cache.flush()
+
+    assert not cache.modified
+    assert MetadataCache(cache.path).file[modPath]['version'] == '1.2.3'
+
+def test_lookupHit(create_cache: tuple[MetadataCache, str]) -> None:
+    cache, modPath = create_cache
+
+    cache.lookup(modPath)
+    cache.flush()
+
+    # A hit must not reparse or dirty the cache
+    cache.file[modPath]['version'] = 'cached'
+
+    assert cache.lookup(modPath) == ('cached', '1234')
+    assert not cache.modified
+
+def test_lookupChanged(create_cache: tuple[MetadataCache, str]) -> None:
+    cache, modPath = create_cache
+
+    cache.lookup(modPath)
+
+    with open(os.path.join(modPath, 'main.xml'), 'w') as f:
+        f.write(XML.format(id='4321', version='2.0.0-updated'))
+
+    assert cache.lookup(modPath) == ('2.0.0-updated', '4321')
+
+def test_evict(create_cache: tuple[MetadataCache, str]) -> None:
+    cache, modPath = create_cache
+
+    cache.lookup(modPath)
+    cache.file['gone mod'] = {'signature' : [None, None], 'version' : 'None', 'assetid' : '', 'seen' : 0}
+
+    cache.evict([modPath])
+
+    assert modPath in cache.file
+    assert 'gone mod' not in cache.file
+
+    cache.invalidate(modPath)
+
+    assert modPath not in cache.file
@@ -0,0 +1,103 @@
+import os
+import json
+import tempfile
+from configparser import ConfigParser
+from typing import Generator
+
+import pytest
+
+from PySide6.QtCore import QMutex
+
+from src.modLinks import isLink, isLinked, linkMod, unlinkMod
+from src.modScanner import ModScan, scanModDirs, sortModScan
+from src.threaded.moveToEnabledDir import MoveToEnabledModDir
+from src.threaded.moveToDisabledDir import MoveToDisabledDir
+from src.constant_vars import OptionKeys, ModKeys, ModType, LinkMode
+
+@pytest.fixture(scope='function')
+def create_library() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for path in ('mods', 'library'):
+            os.mkdir(os.path.join(tmp_dir, path))
+
+        os.makedirs(os.path.join(tmp_dir, 'library', 'linked mod', 'lua'))
+
+        with open(os.path.join(tmp_dir, 'library', 'linked mod', 'lua', 'main.lua'), 'w') as f:
+            f.write('log("hi")')
+
+        yield tmp_dir
+
+@pytest.mark.parametrize('mode', [LinkMode.symlink, LinkMode.hardlink])
+def test_linkMod(create_library: str, mode: LinkMode) -> None:
+    target: str = os.path.join(create_library, 'library', 'linked mod')
+    link: str = os.path.join(create_library, 'mods', 'linked mod')
+
+    assert linkMod(target, link, mode) == mode
+    assert isLink(link) == (mode == LinkMode.symlink)
+    assert isLinked(link, target)
+    assert os.path.isfile(os.path.join(link, 'lua', 'main.lua'))
+
+    unlinkMod(link)
+
+    assert not os.path.lexists(link)
+    assert os.path.isfile(os.path.join(target, 'lua', 'main.lua'))
+
+def test_changedCopy(create_library: str) -> None:
+    target: str = os.path.join(create_library, 'library', 'linked mod')
+    link: str = os.path.join(create_library, 'mods', 'linked mod')
+
+    linkMod(target, link, LinkMode.hardlink)
+
+    # A file added to the game copy would be lost if it was unlinked
+    with open(os.path.join(link, 'lua', 'added.lua'), 'w') as f:
+        f.write('log("new")')
+
+    assert not isLinked(link, target)
+
+def test_sortModScan(create_library: str) -> None:
+    linkMod(os.path.join(create_library, 'library', 'linked mod'), os.path.join(create_library, 'mods', 'linked mod'), LinkMode.symlink)
+
+    folders = scanModDirs(
+        os.path.join(create_library, 'mods'),
+        os.path.join(create_library, 'overrides'),
+        os.path.join(create_library, 'Maps'),
+        os.path.join(create_library, 'library')
+    )
+    scan: ModScan = sortModScan(folders, lambda x: ModType.mods)
+
+    # Listed once and enabled
+    assert scan.mods == ['linked mod']
+    assert not scan.disabled
+
+def test_toggle(create_library: str) -> None:
+    optionsPath: str = os.path.join(create_library, 'config.ini')
+    savePath: str = os.path.join(create_library, 'mods.json')
+
+    config = ConfigParser()
+    config.add_section(OptionKeys.section.value)
+    config.set(OptionKeys.section.value, OptionKeys.game_path.value, create_library)
+    config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(create_library, 'library'))
+    config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.symlink.value)
+
+    with open(optionsPath, 'w') as f:
+        config.write(f)
+
+    with open(savePath, 'w') as f:
+        json.dump({'linked mod' : {ModKeys.type.value : ModType.mods.value, ModKeys.enabled.value : False}}, f)
+
+    link: str = os.path.join(create_library, 'mods', 'linked mod')
+    target: str = os.path.join(create_library, 'library', 'linked mod')
+
+    worker = MoveToEnabledModDir('linked mod', optionsPath=optionsPath, savePath=savePath)
+    worker.mutex = QMutex()
+    worker.start()
+
+    assert isLink(link)
+    assert os.path.isdir(target)
+
+    worker = MoveToDisabledDir('linked mod', optionsPath=optionsPath, savePath=savePath)
+    worker.mutex = QMutex()
+    worker.start()
+
+    assert not os.path.lexists(link)
+    assert os.path.isfile(os.path.join(target, 'lua', 'main.lua'))
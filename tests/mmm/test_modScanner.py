@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+from src.modScanner import ModScan, scanDir, scanModDirs
+
+def test_scanDir() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.mkdir(os.path.join(tmp_dir, 'cool mod'))
+        os.mkdir(os.path.join(tmp_dir, 'logs'))
+
+        with open(os.path.join(tmp_dir, 'not a mod.txt'), 'w') as _f:
+            pass
+
+        assert sorted(scanDir(tmp_dir)) == ['cool mod', 'logs']
+        assert scanDir(tmp_dir, ('logs', )) == ['cool mod']
+        assert scanDir(os.path.join(tmp_dir, 'does not exist')) == []
+
+def test_scanModDirs(create_mod_dirs: str) -> None:
+    mods, mod_overrides, maps, disabled = scanModDirs(
+        os.path.join(create_mod_dirs, 'mods'),
+        os.path.join(create_mod_dirs, 'assets', 'mod_overrides'),
+        os.path.join(create_mod_dirs, 'maps'),
+        os.path.join(create_mod_dirs, 'disabledMods')
+    )
+
+    assert mods == ['make game easy mod']
+    assert mod_overrides == ['best mod ever']
+    assert maps == ['super fun mod']
+    assert disabled == []
+
+def test_modScan() -> None:
+    scan = ModScan(['a'], ['b'], ['c'], {'c'})
+
+    assert scan.all() == ['a', 'b', 'c']
+    assert 'c' in scan.disabled
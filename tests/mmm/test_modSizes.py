@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+from pytestqt.qtbot import QtBot
+
+from src.modSizes import ModSizeScanner, dirSize, folderMtime, formatSize
+
+def test_dirSize() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'assets', 'textures'))
+
+        for path, size in (('main.xml', 10), (os.path.join('assets', 'textures', 'a.texture'), 100)):
+            with open(os.path.join(tmp_dir, path), 'wb') as f:
+                f.write(b'0' * size)
+
+        assert dirSize(tmp_dir) == 110
+        assert dirSize(os.path.join(tmp_dir, 'missing')) == 0
+
+def test_formatSize() -> None:
+    assert formatSize(512) == '512 B'
+    assert formatSize(1536) == '1.5 KB'
+    assert formatSize(3 * 1024 ** 3) == '3.0 GB'
+
+def test_scanner(qtbot: QtBot) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mod in ('cached mod', 'new mod'):
+            os.mkdir(os.path.join(tmp_dir, mod))
+
+            with open(os.path.join(tmp_dir, mod, 'mod.txt'), 'wb') as f:
+                f.write(b'0' * 20)
+
+        cachedPath: str = os.path.join(tmp_dir, 'cached mod')
+        newPath: str = os.path.join(tmp_dir, 'new mod')
+
+        scanner = ModSizeScanner()
+        found: list[tuple] = []
+        scanner.sizeFound.connect(lambda *args: found.append(args))
+
+        with qtbot.waitSignal(scanner.finished):
+            scanner.scan({'cached mod' : (cachedPath, folderMtime(cachedPath)), 'new mod' : (newPath, None)}, restart=True)
+
+        # Only the mod whose folder changed since it was cached is walked
+        assert found == [('new mod', newPath, folderMtime(newPath), 20)]
@@ -0,0 +1,121 @@
+import os
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.modWatcher import ModWatcher
+from src.constant_vars import MOVE_PARTIAL_SUFFIX
+
+@pytest.fixture(scope='function')
+def create_watcher() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mods: str = os.path.join(tmp_dir, 'mods')
+        disabled: str = os.path.join(tmp_dir, 'disabled')
+
+        os.makedirs(os.path.join(mods, 'cool mod'))
+        os.mkdir(disabled)
+
+        watcher = ModWatcher()
+        watcher.watch({mods : ('logs', ), disabled : ()})
+        watcher.sync(True)
+
+        events: list[tuple] = []
+        watcher.modAdded.connect(lambda x: events.append(('added', x)))
+        watcher.modRemoved.connect(lambda x: events.append(('removed', x)))
+        watcher.modRenamed.connect(lambda x, y: events.append(('renamed', x, y)))
+        watcher.modMoved.connect(lambda x: events.append(('moved', x)))
+
+        yield watcher, events, mods, disabled
+
+        watcher.deleteLater()
+
+def test_added(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    os.mkdir(os.path.join(mods, 'new mod'))
+    os.mkdir(os.path.join(mods, 'logs'))
+    watcher.sync(True)
+
+    assert events == [('added', 'new mod')]
+    assert watcher.locate('new mod') == [os.path.abspath(mods)]
+
+def test_partial(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    # A copy to another drive that isn't finished yet
+    os.mkdir(os.path.join(mods, 'new mod' + MOVE_PARTIAL_SUFFIX))
+    watcher.sync(True)
+
+    assert events == []
+
+    os.rename(os.path.join(mods, 'new mod' + MOVE_PARTIAL_SUFFIX), os.path.join(mods, 'new mod'))
+    watcher.sync(True)
+
+    assert events == [('added', 'new mod')]
+
+def test_removed(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    os.rmdir(os.path.join(mods, 'cool mod'))
+    watcher.sync(True)
+
+    assert events == [('removed', 'cool mod')]
+
+def test_renamed(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    os.rename(os.path.join(mods, 'cool mod'), os.path.join(mods, 'cooler mod'))
+    watcher.sync(True)
+
+    assert events == [('renamed', 'cool mod', 'cooler mod')]
+
+def test_replaced(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    # Uninstalling a mod and installing another one before the watcher syncs
+    os.mkdir(os.path.join(mods, 'other mod'))
+    os.rmdir(os.path.join(mods, 'cool mod'))
+    watcher.sync(True)
+
+    assert events == [('removed', 'cool mod'), ('added', 'other mod')]
+
+def test_moved(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, disabled = create_watcher
+
+    os.rename(os.path.join(mods, 'cool mod'), os.path.join(disabled, 'cool mod'))
+    watcher.sync(True)
+
+    assert events == [('moved', 'cool mod')]
+    assert watcher.locate('cool mod') == [os.path.abspath(disabled)]
+
+def test_setSnapshots(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, _disabled = create_watcher
+
+    os.mkdir(os.path.join(mods, 'new mod'))
+    watcher.setSnapshots({mods : ['cool mod', 'new mod']})
+    watcher.sync(True)
+
+    assert events == []
+
+def test_setSnapshotsPending(create_watcher: tuple[ModWatcher, list, str, str]) -> None:
+    watcher, events, mods, disabled = create_watcher
+
+    os.mkdir(os.path.join(mods, 'new mod'))
+    watcher.onDirectoryChanged(mods)
+    watcher.onDirectoryChanged(disabled)
+
+    # The other root still waits for its sync
+    watcher.setSnapshots({mods : ['cool mod', 'new mod']})
+
+    assert watcher.pendingRoots == {os.path.abspath(disabled)}
+    assert watcher.timer.isActive()
+
+    watcher.setSnapshots({disabled : os.listdir(disabled)})
+
+    assert not watcher.pendingRoots
+    assert not watcher.timer.isActive()
+
+    watcher.sync()
+
+    assert events == []
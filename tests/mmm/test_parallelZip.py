@@ -0,0 +1,82 @@
+import os
+import zipfile
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.parallelZip import ParallelCompressor, ZipAssembler, compressFile
+from src.constant_vars import BackupCodec
+
+@pytest.fixture(scope='function')
+def create_files() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'mod', 'lua'))
+
+        files: dict[str, bytes] = {
+            'mod/lua/main.lua' : b'log("hi")\n' * 1000,
+            'mod/random.bin' : os.urandom(50_000),
+            'mod/empty.txt' : b''
+        }
+
+        for arcname, data in files.items():
+            with open(os.path.join(tmp_dir, arcname), 'wb') as f:
+                f.write(data)
+
+        yield tmp_dir, files
+
+def assemble(tmp_dir: str, files: dict[str, bytes], codec: BackupCodec, processes: int) -> str:
+    zipPath: str = os.path.join(tmp_dir, 'backup.zip')
+    paths: list[str] = [os.path.join(tmp_dir, x) for x in files]
+
+    with open(zipPath, 'wb') as f, ParallelCompressor(codec, 6, processes, tmp_dir) as compressor:
+        archive = ZipAssembler(f, codec, 6)
+        archive.addFolder(os.path.join(tmp_dir, 'mod'), 'mod')
+
+        for path, arcname, compressed in zip(paths, files, compressor.imap(paths)):
+            archive.addFile(path, arcname, compressed)
+
+        archive.close()
+
+    return zipPath
+
+@pytest.mark.parametrize('codec', list(BackupCodec))
+def test_assemble(create_files: tuple[str, dict[str, bytes]], codec: BackupCodec) -> None:
+    tmp_dir, files = create_files
+
+    with zipfile.ZipFile(assemble(tmp_dir, files, codec, 0)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ['mod/', *files]
+
+        for arcname, data in files.items():
+            assert archive.read(arcname) == data
+
+@pytest.mark.parametrize('codec', [BackupCodec.deflate, BackupCodec.lzma])
+def test_pool(create_files: tuple[str, dict[str, bytes]], codec: BackupCodec, monkeypatch: pytest.MonkeyPatch) -> None:
+    tmp_dir, files = create_files
+
+    # The empty file is left for the assembler
+    monkeypatch.setattr('src.parallelZip.BACKUP_POOL_MIN', 1000)
+
+    with ParallelCompressor(codec, 6, 2, tmp_dir) as compressor:
+        compressed = list(compressor.imap(os.path.join(tmp_dir, x) for x in files))
+
+    assert [x is None for x in compressed] == [False, False, True]
+
+    with zipfile.ZipFile(assemble(tmp_dir, files, codec, 2)) as archive:
+        assert archive.testzip() is None
+
+        for arcname, data in files.items():
+            assert archive.read(arcname) == data
+
+def test_spill(create_files: tuple[str, dict[str, bytes]], monkeypatch: pytest.MonkeyPatch) -> None:
+    tmp_dir, files = create_files
+    spillPath: str = os.path.join(tmp_dir, 'spill')
+
+    monkeypatch.setattr('src.parallelZip.BACKUP_MEMBER_MAX', 1000)
+
+    compressed = compressFile(os.path.join(tmp_dir, 'mod/random.bin'), BackupCodec.deflate, 6, spillPath)
+
+    # Big files are left on disk for the assembler
+    assert compressed.data is None
+    assert os.path.getsize(spillPath) == compressed.compressSize
@@ -1,4 +1,6 @@
 import os
+import json
+import tempfile
 
 import pytest
 
@@ -55,6 +57,34 @@ def test_saveMethods(createTemp_Mod_ini: str) -> None:
 
     assert len(save.mods()) == 0
 
+def test_loadOnce() -> None:
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: str = os.path.join(tmp_dir, 'mods.json')
+
+        with open(path, 'w') as f:
+            f.write(json.dumps({'mod1' : {ModKeys.enabled.value : True}}))
+
+        save = Save(path)
+        save.setEnabled('mod1', False)
+
+        # Not changed on disk, the unsaved change is kept
+        save = Save(path)
+        assert not save.getEnabled('mod1')
+        assert save.dirty == {'mod1'}
+
+        with open(path, 'w') as f:
+            f.write(json.dumps({'mod1' : {ModKeys.enabled.value : True}, 'mod2' : {}}))
+
+        # Changed on disk, reloaded while keeping the unsaved change
+        save = Save(path)
+        assert save.hasMod('mod2')
+        assert not save.getEnabled('mod1')
+
+        save.saveJSON()
+        assert save.dirty == set()
+        assert not save.jsonParser.isStale()
+
 def test_testOptions(createTemp_Config_ini: str, create_mod_dirs: str) -> None:
 
     options = OptionsManager(createTemp_Config_ini)
@@ -64,6 +94,48 @@ def test_testOptions(createTemp_Config_ini: str, create_mod_dirs: str) -> None:
     assert options.hasOption(OptionKeys.dispath.value)
     assert options.getDispath() == os.path.join(create_mod_dirs, 'disabledMods')
 
+def test_tagIndex(createTemp_Mod_ini: str) -> None:
+
+    save = Save(createTemp_Mod_ini)
+
+    save.setTags(['cool', 'fun'], 'super fun mod', 'best mod ever')
+    save.setTags(['easy'], 'make game easy mod')
+
+    assert save.getAllTags() == ['cool', 'easy', 'fun']
+    assert save.modsWithTags('cool') == {'super fun mod', 'best mod ever'}
+    assert save.modsWithTags('cool', 'easy') == set()
+
+    save.removeTags(['fun'], 'super fun mod')
+    assert save.modsWithTags('fun') == {'best mod ever'}
+
+    save.renameMod('best mod ever', 'better mod')
+    assert save.modsWithTags('fun') == {'better mod'}
+
+    save.removeMods('better mod')
+    assert save.getAllTags() == ['cool', 'easy']
+
+    save.clearTags()
+    assert save.getAllTags() == []
+
+def test_optionsSnapshot(createTemp_Config_ini: str) -> None:
+
+    options = OptionsManager(createTemp_Config_ini)
+    options.setLang('unsaved')
+
+    # Not changed on disk, the settings in memory are used
+    options = OptionsManager(createTemp_Config_ini)
+    assert options.getLang() == 'unsaved'
+
+    options.writeData()
+    assert not options.isStale()
+
+    with open(createTemp_Config_ini, 'a') as f:
+        f.write('\n')
+
+    assert options.isStale()
+    OptionsManager(createTemp_Config_ini)
+    assert not options.isStale()
+
 def test_OptionsMethods(createTemp_Config_ini: str) -> None:
 
     options = OptionsManager(createTemp_Config_ini)
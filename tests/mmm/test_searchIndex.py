@@ -0,0 +1,42 @@
+from src.searchIndex import SearchIndex, trigrams
+
+def create_index() -> SearchIndex:
+    index = SearchIndex()
+
+    index.add('Super Fun Mod', ('cool', '2.0.0'))
+    index.add('fun_stream_overlay', ('hud', ))
+    index.add('Better Bots', ())
+
+    return index
+
+def test_trigrams() -> None:
+    assert trigrams('ab') == {'  a', ' ab', 'ab '}
+    assert trigrams('a_b') == trigrams('a b')
+
+def test_search() -> None:
+    index = create_index()
+
+    scores: dict[str, float] = index.search('fun')
+
+    assert set(scores.keys()) == {'Super Fun Mod', 'fun_stream_overlay'}
+    assert scores['fun_stream_overlay'] > scores['Super Fun Mod']
+
+    # Tags and versions
+    assert set(index.search('hud').keys()) == {'fun_stream_overlay'}
+    assert set(index.search('2.0').keys()) == {'Super Fun Mod'}
+
+    # Typo
+    assert 'Better Bots' in index.search('better botz')
+
+def test_refine() -> None:
+    index = create_index()
+
+    assert len(index.search('b')) == 1
+    assert index.lastQuery == 'b'
+
+    assert set(index.search('be').keys()) == {'Better Bots'}
+
+    index.remove('Better Bots')
+    assert index.lastQuery is None
+    assert index.search('be') == {}
+    assert len(index) == 2
@@ -0,0 +1,104 @@
+import os
+import json
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.JSONParser import JSONParser
+from src.sqliteStore import SQLiteStore
+from src.profileManager import ProfileManager
+from src.save import Save
+from src.constant_vars import ModKeys, ModType
+
+@pytest.fixture(scope='function')
+def create_store(createTemp_Mod_ini: str) -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SQLiteStore(os.path.join(tmp_dir, 'test.db'))
+        JSONParser.store = store
+
+        yield store, tmp_dir
+
+        JSONParser.store = None
+        store.close()
+
+def test_migrate(create_store: tuple[SQLiteStore, str], createTemp_Mod_ini: str) -> None:
+    store, _tmp_dir = create_store
+
+    parser = JSONParser(createTemp_Mod_ini, table=SQLiteStore.MODS)
+
+    with open(createTemp_Mod_ini, 'r') as f:
+        assert parser.file == json.loads(f.read())
+
+    assert store.isMigrated(SQLiteStore.MODS)
+    assert sorted(store.modsWhere(ModKeys.type, ModType.mods_override.value)) == ['best mod ever']
+    assert len(store.modsWhere(ModKeys.enabled, True)) == 3
+
+def test_save(create_store: tuple[SQLiteStore, str], createTemp_Mod_ini: str) -> None:
+    store, _tmp_dir = create_store
+
+    parser = JSONParser(createTemp_Mod_ini, table=SQLiteStore.MODS)
+
+    parser.file['super fun mod'][ModKeys.tags.value] = ['cool', 'fun']
+    parser.file.pop('best mod ever')
+    parser.saveJSON()
+
+    assert store.allTags() == ['cool', 'fun']
+    assert store.modsWithTag('cool') == ['super fun mod']
+
+    # Loads from the database, not the unchanged JSON file
+    parser = JSONParser(createTemp_Mod_ini, table=SQLiteStore.MODS)
+
+    assert 'best mod ever' not in parser.file
+    assert parser.file['super fun mod'][ModKeys.tags.value] == ['cool', 'fun']
+
+def test_profiles(create_store: tuple[SQLiteStore, str], createTemp_Profiles_ini: str) -> None:
+    store, _tmp_dir = create_store
+
+    profileManager = ProfileManager(createTemp_Profiles_ini)
+    profileManager.addProfile('new profile')
+    profileManager.addMod('new profile', 'make game easy')
+
+    assert sorted(store.profilesWithMod('make game easy')) == ['Awesome mods', 'new profile']
+
+def test_saveQueries(create_store: tuple[SQLiteStore, str], createTemp_Mod_ini: str) -> None:
+    store, _tmp_dir = create_store
+
+    saveManager = Save(createTemp_Mod_ini)
+    assert saveManager.usesStore()
+
+    saveManager.setTags(['cool'], 'super fun mod', 'best mod ever')
+    saveManager.setIgnored('best mod ever', True)
+    saveManager.saveJSON()
+
+    assert sorted(store.modsWithTag('cool')) == ['best mod ever', 'super fun mod']
+
+    # Changes that aren't saved yet are looked up in memory
+    saveManager.removeTags(['cool'], 'best mod ever')
+    saveManager.setTags(['fun'], 'best mod ever')
+
+    assert saveManager.modsWithTags('cool') == {'super fun mod'}
+    assert saveManager.getAllTags() == ['cool', 'fun']
+    assert saveManager.modsWhere(ModKeys.ignored, True) == ['best mod ever']
+    assert sorted(saveManager.modsWhere(ModKeys.type, ModType.maps.value)) == ['super fun mod']
+
+    saveManager.saveJSON()
+
+    assert store.modsWithTag('fun') == ['best mod ever']
+    assert saveManager.modsWithTags('fun') == {'best mod ever'}
+
+def test_fallback(create_store: tuple[SQLiteStore, str]) -> None:
+    store, tmp_dir = create_store
+
+    path: str = os.path.join(tmp_dir, 'test.json')
+
+    parser = JSONParser(path, table=SQLiteStore.MODS)
+    parser.file['mod'] = {}
+
+    store.close()
+    parser.saveJSON()
+
+    assert JSONParser.store is None
+
+    with open(path, 'r') as f:
+        assert json.loads(f.read()) == {'mod' : {}}
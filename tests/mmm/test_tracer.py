@@ -0,0 +1,59 @@
+import os
+import json
+import tempfile
+from typing import Generator
+
+import pytest
+
+from src.tracer import Tracer, span
+
+@pytest.fixture(scope='function')
+def create_tracer() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: str = os.path.join(tmp_dir, 'trace.json')
+        Tracer.start(path)
+
+        yield path
+
+        Tracer.stop()
+        Tracer.clear()
+        Tracer.path = None
+
+@span('traced', 'test')
+def traced(x: int) -> int:
+    return traced(x - 1) + 1 if x else 0
+
+def test_disabled() -> None:
+    assert not Tracer.enabled
+
+    with span('ignored'):
+        pass
+
+    assert Tracer.events == []
+
+def test_span(create_tracer: str) -> None:
+    assert traced(2) == 2
+
+    with pytest.raises(ValueError):
+        with span('failed', value=1):
+            raise ValueError
+
+    names: list[str] = [x['name'] for x in Tracer.events]
+    assert names == ['traced', 'traced', 'traced', 'failed']
+    assert Tracer.events[-1]['args'] == {'value' : 1, 'error' : 'ValueError'}
+
+    # The outer call encloses the inner calls
+    assert Tracer.events[2]['dur'] >= Tracer.events[0]['dur']
+
+def test_save(create_tracer: str) -> None:
+    asyncSpan: span = span('network', 'network').begin()
+    asyncSpan.end(error='NoError')
+
+    assert Tracer.save() == create_tracer
+
+    with open(create_tracer) as f:
+        data: dict = json.load(f)
+
+    events: list[dict] = data['traceEvents']
+    assert any(x['ph'] == 'M' and x['name'] == 'thread_name' for x in events)
+    assert [x['name'] for x in events if x['ph'] == 'X'] == ['network']
@@ -33,4 +33,4 @@ def test_manager(qtbot: QtBot, createTemp_Mod_ini: str, createTemp_Config_ini: s
 
     widget.deselectAllShortCut.activated.emit()
 
-    assert len(widget.modsTable.selectedItems()) == 0
+    assert len(widget.modsTable.getSelectedNameItems()) == 0
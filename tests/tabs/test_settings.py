@@ -46,6 +46,14 @@ def test_langChanged(create_Settings: Options) -> None:
 
     assert create_Settings.optionChanged[OptionKeys.lang] is True
 
+def test_storageChanged(create_Settings: Options) -> None:
+    storage: qtw.QComboBox = create_Settings.optionsGeneral.storage
+
+    # Switches between JSON files and the database
+    storage.setCurrentIndex(1 - storage.currentIndex())
+
+    assert create_Settings.optionChanged[OptionKeys.storage] is True
+
 def test_cancelChanges(create_Settings: Options) -> None:
     assert create_Settings.applyButton.isEnabled()
 
@@ -0,0 +1,75 @@
+import os
+import json
+import tempfile
+from configparser import ConfigParser
+from typing import Generator
+
+import pytest
+
+from PySide6.QtCore import QMutex
+
+from pytestqt.qtbot import QtBot
+
+from src.threaded.applyProfile import ApplyProfile, ProfilePlan, planProfile
+from src.modScanner import ModScan
+from src.constant_vars import OptionKeys, ModKeys, ModType, LinkMode
+
+@pytest.fixture(scope='function')
+def create_worker() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+
+        os.makedirs(os.path.join(tmp_dir, 'mods', 'enabled mod'))
+        os.makedirs(os.path.join(tmp_dir, 'disabledMods', 'disabled mod'))
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+        config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.move.value)
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({x : {ModKeys.type.value : ModType.mods.value} for x in ('enabled mod', 'disabled mod')}, f)
+
+        worker = ApplyProfile(['disabled mod'], ['enabled mod'], optionsPath=optionsPath, savePath=savePath)
+        worker.mutex = QMutex()
+
+        yield tmp_dir, worker
+
+        worker.deleteLater()
+
+def test_thread(qtbot: QtBot, create_worker: tuple[str, ApplyProfile]) -> None:
+    tmp_dir, worker = create_worker
+
+    with qtbot.wait_signal(worker.succeeded):
+        worker.start()
+
+    assert os.listdir(os.path.join(tmp_dir, 'mods')) == ['disabled mod']
+    assert os.listdir(os.path.join(tmp_dir, 'disabledMods')) == ['enabled mod']
+    assert worker.progress.snapshot().value == 2
+
+def test_cancel(qtbot: QtBot, create_worker: tuple[str, ApplyProfile]) -> None:
+    tmp_dir, worker = create_worker
+
+    worker.start()
+
+    # Both sides of the profile are undone
+    worker.cancel = True
+    with qtbot.wait_signal(worker.doneCanceling):
+        worker.cancelCheck()
+
+    assert os.listdir(os.path.join(tmp_dir, 'mods')) == ['enabled mod']
+    assert os.listdir(os.path.join(tmp_dir, 'disabledMods')) == ['disabled mod']
+
+def test_planProfile() -> None:
+    scan = ModScan(['override mod'], ['enabled mod', 'disabled mod', 'kept mod'], [], {'disabled mod'})
+
+    plan: ProfilePlan = planProfile(['disabled mod', 'kept mod', 'missing mod'], scan)
+
+    assert plan.toEnable == ['disabled mod']
+    assert plan.toDisable == ['enabled mod', 'override mod']
+    assert plan.notInstalled == ['missing mod']
@@ -1,39 +1,69 @@
 import os
-import shutil
+import json
+import zipfile
+import tempfile
+from configparser import ConfigParser
+from typing import Generator
 
 import pytest
 
 from PySide6.QtCore import QMutex
 
 from src.threaded.backupMods import BackupMods
-from src.getPath import Pathing
-from src.save import OptionsManager, Save
-from src.constant_vars import BACKUP_MODS
-
-#TODO: os.mkdir() isn't working
-@pytest.mark.skip
-def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
-    dispath: str = os.path.join(create_mod_dirs, 'disabledMods')
-    parser = OptionsManager(createTemp_Config_ini)
-    parser.setGamepath(create_mod_dirs)
-    parser.setDispath(dispath)
-    parser.writeData()
-    mutex = QMutex()
-    worker = BackupMods()
-    worker.saveManager = Save(createTemp_Mod_ini)
-    worker.optionsManager = parser
-    bundledFilePath: str = os.path.join(create_mod_dirs, BACKUP_MODS)
-    worker.bundledFilePath = bundledFilePath
-    worker.mutex = mutex
-    worker.p = Pathing(createTemp_Config_ini)
+from src.constant_vars import BACKUP_MODS, MOVE_PARTIAL_SUFFIX, OptionKeys, ModKeys, ModType
+
+@pytest.fixture(scope='function')
+def create_worker() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+
+        os.makedirs(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua'))
+        os.makedirs(os.path.join(tmp_dir, 'disabledMods', 'disabled mod', 'empty'))
+
+        with open(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua', 'main.lua'), 'w') as f:
+            f.write('log("hi")')
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({
+                'enabled mod' : {ModKeys.type.value : ModType.mods.value, ModKeys.enabled.value : True},
+                'disabled mod' : {ModKeys.type.value : ModType.maps.value, ModKeys.enabled.value : False}
+            }, f)
+
+        worker = BackupMods(optionsPath=optionsPath, savePath=savePath)
+        worker.bundledFilePath = os.path.join(tmp_dir, BACKUP_MODS)
+        worker.mutex = QMutex()
+
+        yield tmp_dir, worker
+
+        worker.deleteLater()
+
+def test_zip(create_worker: tuple[str, BackupMods]) -> None:
+    tmp_dir, worker = create_worker
 
     worker.start()
 
-    assert os.path.isfile(f'{bundledFilePath}.zip')
+    with zipfile.ZipFile(f'{worker.bundledFilePath}.zip') as archive:
+        assert archive.read('mods/enabled mod/lua/main.lua') == b'log("hi")'
+        assert 'Maps/disabled mod/empty/' in archive.namelist()
 
-    shutil.unpack_archive(f'{bundledFilePath}.zip', create_mod_dirs)
+    # Nothing is copied next to the zip
+    assert sorted(os.listdir(tmp_dir)) == sorted(['config.ini', 'mods.json', 'mods', 'disabledMods', f'{BACKUP_MODS}.zip'])
+    assert worker.progress.snapshot().bytesDone == len('log("hi")')
+
+def test_cancel(create_worker: tuple[str, BackupMods]) -> None:
+    tmp_dir, worker = create_worker
+
+    worker.cancel = True
+    worker.start()
 
-    assert os.listdir(bundledFilePath) == ['mods', 'assets', 'Maps']
-    assert os.listdir(os.path.join(bundledFilePath, 'mods')) == ['make game easy mod']
-    assert os.listdir(os.path.join(bundledFilePath, 'assets', 'mod_overrides')) == ['best mod ever']
-    assert os.listdir(os.path.join(bundledFilePath, 'Maps')) == ['super fun mod']
+    assert not os.path.exists(f'{worker.bundledFilePath}.zip')
+    assert not os.path.exists(f'{worker.bundledFilePath}.zip' + MOVE_PARTIAL_SUFFIX)
@@ -0,0 +1,96 @@
+import os
+import json
+import tempfile
+from configparser import ConfigParser
+from typing import Generator
+
+import pytest
+
+from PySide6.QtCore import QMutex
+
+from src.threaded.incrementalBackup import IncrementalBackup
+from src.threaded.restoreMods import RestoreMods, saveRestored
+from src.backupStore import BackupStore
+from src.constant_vars import BACKUP_STORE, OptionKeys, ModKeys, ModType
+
+@pytest.fixture(scope='function')
+def create_game() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+
+        for mod in ('mod 1', 'mod 2'):
+            os.makedirs(os.path.join(tmp_dir, 'mods', mod, 'lua'))
+
+            with open(os.path.join(tmp_dir, 'mods', mod, 'lua', 'main.lua'), 'w') as f:
+                f.write(f'log("{mod}")')
+
+        os.mkdir(os.path.join(tmp_dir, 'disabledMods'))
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({x : {ModKeys.type.value : ModType.mods.value, ModKeys.enabled.value : True} for x in ('mod 1', 'mod 2')}, f)
+
+        yield tmp_dir
+
+def backup(tmp_dir: str) -> IncrementalBackup:
+    worker = IncrementalBackup(optionsPath=os.path.join(tmp_dir, 'config.ini'), savePath=os.path.join(tmp_dir, 'mods.json'))
+    worker.storePath = os.path.join(tmp_dir, BACKUP_STORE)
+    worker.mutex = QMutex()
+
+    worker.start()
+
+    return worker
+
+def test_incremental(create_game: str) -> None:
+    first: IncrementalBackup = backup(create_game)
+
+    assert first.progress.snapshot().bytesDone == len('log("mod 1")') * 2
+
+    with open(os.path.join(create_game, 'mods', 'mod 2', 'lua', 'main.lua'), 'a') as f:
+        f.write('\nlog("changed")')
+
+    # Only the changed file is read again
+    second: IncrementalBackup = backup(create_game)
+
+    assert second.progress.snapshot().bytesDone == len('log("mod 2")\nlog("changed")')
+
+    store = BackupStore(second.storePath)
+    mods: dict = store.latestManifest()['mods']
+
+    assert len(store.manifests()) == 2
+    assert mods['mod 1']['folders'] == ['', 'lua']
+    assert b''.join(store.readFile(mods['mod 2']['files']['lua/main.lua'][2])) == b'log("mod 2")\nlog("changed")'
+
+def test_restore(create_game: str) -> None:
+    worker: IncrementalBackup = backup(create_game)
+
+    store = BackupStore(worker.storePath)
+    manifestPath: str = os.path.join(store.manifestsPath, store.manifests()[-1])
+
+    mainPath: str = os.path.join(create_game, 'mods', 'mod 2', 'lua', 'main.lua')
+    modified: int = os.stat(mainPath).st_mtime_ns
+
+    with open(mainPath, 'w') as f:
+        f.write('broken')
+
+    restore = RestoreMods(manifestPath, 'mod 2', optionsPath=os.path.join(create_game, 'config.ini'), savePath=os.path.join(create_game, 'mods.json'))
+    restore.mutex = QMutex()
+    restore.start()
+
+    saveRestored(restore.mods_restored, os.path.join(create_game, 'mods.json'))
+
+    # Written from the chunks in the store
+    with open(mainPath) as f:
+        assert f.read() == 'log("mod 2")'
+
+    assert os.stat(mainPath).st_mtime_ns == modified
+    assert restore.mods_restored == [('mod 2', ModType.mods, True)]
+    assert sorted(os.listdir(os.path.join(create_game, 'mods'))) == ['mod 1', 'mod 2']
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+from typing import Generator
+
+import pytest
+
+from PySide6.QtCore import QMutex
+
+from src.threaded.moveEngine import MoveEngine, MovePlan, MoveCanceled, planMove
+from src.threaded.progressChannel import ProgressChannel
+from src.threaded.workerQObject import Worker
+from src.constant_vars import MOVE_PARTIAL_SUFFIX
+
+def createMod(path: str) -> int:
+    os.makedirs(os.path.join(path, 'assets'))
+
+    with open(os.path.join(path, 'mod.txt'), 'w') as f:
+        f.write('{"version" : "1.0"}')
+
+    with open(os.path.join(path, 'assets', 'big.bin'), 'wb') as f:
+        f.write(os.urandom(300000))
+
+    return 300000 + len('{"version" : "1.0"}')
+
+@pytest.fixture(scope='function')
+def create_dirs() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.mkdir(os.path.join(tmp_dir, 'dest'))
+
+        yield tmp_dir, createMod(os.path.join(tmp_dir, 'mod'))
+
+def test_rename(create_dirs: tuple[str, int]) -> None:
+    tmp_dir, _ = create_dirs
+    src: str = os.path.join(tmp_dir, 'mod')
+    dest: str = os.path.join(tmp_dir, 'dest', 'mod')
+
+    plan: MovePlan = planMove(src, dest)
+    assert plan.sameDevice
+    assert plan.size == 0
+
+    MoveEngine().move(plan)
+
+    assert not os.path.exists(src)
+    assert os.path.isfile(os.path.join(dest, 'assets', 'big.bin'))
+
+def test_copy(create_dirs: tuple[str, int]) -> None:
+    tmp_dir, size = create_dirs
+    src: str = os.path.join(tmp_dir, 'mod')
+    dest: str = os.path.join(tmp_dir, 'dest', 'mod')
+
+    with open(os.path.join(src, 'assets', 'big.bin'), 'rb') as f:
+        data: bytes = f.read()
+
+    # Copied like the destination is on another drive
+    progress = ProgressChannel()
+    MoveEngine(progress, chunkSize=65536).move(MovePlan(src, dest, False, size))
+
+    assert not os.path.exists(src)
+    assert not os.path.exists(dest + MOVE_PARTIAL_SUFFIX)
+    assert progress.snapshot().bytesDone == size
+
+    with open(os.path.join(dest, 'assets', 'big.bin'), 'rb') as f:
+        assert f.read() == data
+
+def test_cancel(create_dirs: tuple[str, int]) -> None:
+    tmp_dir, size = create_dirs
+    src: str = os.path.join(tmp_dir, 'mod')
+    dest: str = os.path.join(tmp_dir, 'dest', 'mod')
+
+    with pytest.raises(MoveCanceled):
+        MoveEngine(isCanceled=lambda: True).move(MovePlan(src, dest, False, size))
+
+    # The original is untouched and the partial copy is removed
+    assert os.path.isfile(os.path.join(src, 'assets', 'big.bin'))
+    assert os.listdir(os.path.join(tmp_dir, 'dest')) == []
+
+def test_sourceLocked(create_dirs: tuple[str, int], createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    tmp_dir, size = create_dirs
+    src: str = os.path.join(tmp_dir, 'mod')
+    dest: str = os.path.join(tmp_dir, 'dest', 'mod')
+
+    rmtree = shutil.rmtree
+
+    # Like a file that is open in another program on Windows
+    def lockedRmtree(path: str, *args, **kwargs) -> None:
+        if path == src:
+            os.remove(os.path.join(src, 'mod.txt'))
+            raise PermissionError(13, 'Permission denied', os.path.join(src, 'assets', 'big.bin'))
+
+        rmtree(path, *args, **kwargs)
+
+    monkeypatch.setattr('src.threaded.moveEngine.shutil.rmtree', lockedRmtree)
+
+    worker = Worker(optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.mutex = QMutex()
+
+    # The copy is kept once it's complete
+    assert worker.move(src, dest, MovePlan(src, dest, False, size))
+
+    assert os.path.isfile(os.path.join(dest, 'mod.txt'))
+    assert os.path.getsize(os.path.join(dest, 'assets', 'big.bin')) == 300000
+    assert not os.path.exists(dest + MOVE_PARTIAL_SUFFIX)
+
+    worker.deleteLater()
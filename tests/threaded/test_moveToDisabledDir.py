@@ -1,5 +1,8 @@
 import os
+import json
+import tempfile
 import pytest
+from configparser import ConfigParser
 from typing import Generator
 
 from PySide6.QtCore import QMutex
@@ -9,6 +12,7 @@ from pytestqt.qtbot import QtBot
 from src.threaded.moveToDisabledDir import MoveToDisabledDir
 from src.getPath import Pathing
 from src.save import OptionsManager
+from src.constant_vars import OptionKeys, ModKeys, ModType, LinkMode
 
 @pytest.fixture(scope='module')
 def create_worker(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> Generator:
@@ -41,3 +45,52 @@ def test_cancel(qtbot: QtBot, create_worker: MoveToDisabledDir) -> None:
 
     assert not os.path.exists(os.path.join(OptionsManager.getDispath(), 'make game easy mod'))
     assert os.path.exists(os.path.join(OptionsManager.getGamepath(), 'mods', 'make game easy mod'))
+
+def test_cancelBatch(qtbot: QtBot) -> None:
+    mods: list[str] = ['a mod', 'b mod', 'c mod']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+
+        for mod in mods:
+            os.makedirs(os.path.join(tmp_dir, 'mods', mod))
+
+        os.makedirs(os.path.join(tmp_dir, 'disabledMods'))
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+        config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.move.value)
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({x : {ModKeys.type.value : ModType.mods.value} for x in mods}, f)
+
+        worker = MoveToDisabledDir(*mods, optionsPath=optionsPath, savePath=savePath)
+        worker.mutex = QMutex()
+
+        move = worker.move
+
+        # Canceled after the first mod is moved
+        def cancelingMove(*args) -> bool:
+            moved: bool = move(*args)
+            worker.cancel = True
+            return moved
+
+        worker.move = cancelingMove
+
+        succeeded: list[bool] = []
+        worker.succeeded.connect(lambda: succeeded.append(True))
+
+        with qtbot.wait_signal(worker.doneCanceling):
+            worker.start()
+
+        assert not succeeded
+        assert sorted(os.listdir(os.path.join(tmp_dir, 'mods'))) == mods
+        assert os.listdir(os.path.join(tmp_dir, 'disabledMods')) == []
+
+        worker.deleteLater()
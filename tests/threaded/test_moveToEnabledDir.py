@@ -1,6 +1,9 @@
 import os
+import json
 import shutil
+import tempfile
 import pytest
+from configparser import ConfigParser
 from typing import Generator
 
 from PySide6.QtCore import QMutex
@@ -10,6 +13,8 @@ from pytestqt.qtbot import QtBot
 from src.threaded.moveToEnabledDir import MoveToEnabledModDir
 from src.getPath import Pathing
 from src.save import OptionsManager
+from src.modLinks import linkMod
+from src.constant_vars import OptionKeys, ModKeys, ModType, LinkMode
 
 @pytest.fixture(scope='module')
 def create_worker(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> Generator:
@@ -49,3 +54,43 @@ def test_cancel(qtbot: QtBot, create_worker: MoveToEnabledModDir) -> None:
     assert 'make game easy mod' not in os.listdir(os.path.join(OptionsManager.getGamepath(), 'mods'))
     assert 'make game easy mod' in os.listdir(OptionsManager.getDispath())
 
+
+def test_linkedMoveMode(qtbot: QtBot) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+        modPath: str = os.path.join(tmp_dir, 'disabledMods', 'linked mod')
+        linkPath: str = os.path.join(tmp_dir, 'mods', 'linked mod')
+
+        os.makedirs(modPath)
+        os.makedirs(os.path.join(tmp_dir, 'mods'))
+
+        with open(os.path.join(modPath, 'mod.txt'), 'w') as f:
+            f.write('mod')
+
+        # Enabled with the symlink mode before the option was changed to move
+        linkMod(modPath, linkPath, LinkMode.symlink)
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+        config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.move.value)
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({'linked mod' : {ModKeys.type.value : ModType.mods.value}}, f)
+
+        worker = MoveToEnabledModDir('linked mod', optionsPath=optionsPath, savePath=savePath)
+        worker.mutex = QMutex()
+
+        with qtbot.wait_signal(worker.succeeded):
+            worker.start()
+
+        # The link is left as it was
+        assert os.path.isfile(os.path.join(modPath, 'mod.txt'))
+        assert os.path.isfile(os.path.join(linkPath, 'mod.txt'))
+
+        worker.deleteLater()
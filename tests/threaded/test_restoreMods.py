@@ -0,0 +1,121 @@
+import os
+import json
+import zipfile
+import tempfile
+from configparser import ConfigParser
+from typing import Generator
+
+import pytest
+
+from PySide6.QtCore import QMutex
+
+from src.threaded.restoreMods import RestoreMods, readBackup, saveRestored
+from src.save import Save
+from src.constant_vars import MOVE_PARTIAL_SUFFIX, OptionKeys, ModKeys, ModType, LinkMode
+
+@pytest.fixture(scope='function')
+def create_backup() -> Generator:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        optionsPath: str = os.path.join(tmp_dir, 'config.ini')
+        savePath: str = os.path.join(tmp_dir, 'mods.json')
+        zipPath: str = os.path.join(tmp_dir, 'backup.zip')
+
+        os.makedirs(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua'))
+        os.makedirs(os.path.join(tmp_dir, 'disabledMods', 'disabled mod'))
+        os.makedirs(os.path.join(tmp_dir, 'Maps'))
+
+        with open(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua', 'main.lua'), 'w') as f:
+            f.write('broken')
+
+        config = ConfigParser()
+        config.add_section(OptionKeys.section.value)
+        config.set(OptionKeys.section.value, OptionKeys.game_path.value, tmp_dir)
+        config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.join(tmp_dir, 'disabledMods'))
+        config.set(OptionKeys.section.value, OptionKeys.link_mode.value, LinkMode.move.value)
+
+        with open(optionsPath, 'w') as f:
+            config.write(f)
+
+        with open(savePath, 'w') as f:
+            json.dump({
+                'enabled mod' : {ModKeys.type.value : ModType.mods.value, ModKeys.enabled.value : True},
+                'disabled mod' : {ModKeys.type.value : ModType.maps.value, ModKeys.enabled.value : False}
+            }, f)
+
+        with zipfile.ZipFile(zipPath, 'w') as archive:
+            archive.writestr('mods/enabled mod/', '')
+            archive.writestr('mods/enabled mod/lua/main.lua', 'log("hi")')
+            archive.writestr('Maps/disabled mod/level.xml', '<level/>')
+            archive.writestr('Maps/new map/map.xml', '<map/>')
+            archive.writestr('assets/mod_overrides/skin/skin.texture', 'texture')
+            archive.writestr('mods/evil/../../../escaped.txt', 'evil')
+
+        yield tmp_dir, zipPath, optionsPath, savePath
+
+def test_readBackup(create_backup: tuple[str, str, str, str]) -> None:
+    _, zipPath, _, _ = create_backup
+
+    with zipfile.ZipFile(zipPath) as archive:
+        contents = readBackup(archive)
+
+    assert {x : y.type for x, y in contents.items()} == {
+        'enabled mod' : ModType.mods,
+        'disabled mod' : ModType.maps,
+        'new map' : ModType.maps,
+        'skin' : ModType.mods_override,
+        'evil' : ModType.mods
+    }
+    assert contents['enabled mod'].size == len('log("hi")')
+
+def test_restore(create_backup: tuple[str, str, str, str]) -> None:
+    tmp_dir, zipPath, optionsPath, savePath = create_backup
+
+    worker = RestoreMods(zipPath, 'enabled mod', 'disabled mod', 'new map', 'evil', optionsPath=optionsPath, savePath=savePath)
+    worker.mutex = QMutex()
+    worker.start()
+
+    with open(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua', 'main.lua')) as f:
+        assert f.read() == 'log("hi")'
+
+    # Disabled mods stay disabled
+    assert os.listdir(os.path.join(tmp_dir, 'disabledMods', 'disabled mod')) == ['level.xml']
+    assert os.listdir(os.path.join(tmp_dir, 'Maps')) == ['new map']
+
+    # Mods that weren't chosen aren't extracted
+    assert not os.path.exists(os.path.join(tmp_dir, 'assets'))
+
+    # Members outside of the mod folder are skipped
+    assert not os.path.exists(os.path.join(tmp_dir, 'escaped.txt'))
+    assert os.listdir(os.path.join(tmp_dir, 'mods', 'evil')) == []
+
+    # The worker doesn't write the save
+    with open(savePath) as f:
+        assert 'new map' not in json.load(f)
+
+    saveRestored(worker.mods_restored, savePath)
+
+    saveManager = Save(savePath)
+    assert saveManager.getType('new map') == ModType.maps
+    assert saveManager.getEnabled('new map')
+    assert not saveManager.getEnabled('disabled mod')
+
+    with open(savePath) as f:
+        assert 'new map' in json.load(f)
+
+    worker.deleteLater()
+
+def test_cancel(create_backup: tuple[str, str, str, str]) -> None:
+    tmp_dir, zipPath, optionsPath, savePath = create_backup
+
+    worker = RestoreMods(zipPath, 'enabled mod', optionsPath=optionsPath, savePath=savePath)
+    worker.mutex = QMutex()
+    worker.cancel = True
+    worker.start()
+
+    # The installed copy is kept
+    with open(os.path.join(tmp_dir, 'mods', 'enabled mod', 'lua', 'main.lua')) as f:
+        assert f.read() == 'broken'
+
+    assert not os.path.exists(os.path.join(tmp_dir, 'mods', 'enabled mod' + MOVE_PARTIAL_SUFFIX))
+
+    worker.deleteLater()
@@ -0,0 +1,43 @@
+import os
+import zipfile
+import tempfile
+
+from pytestqt.qtbot import QtBot
+
+from src.widgets.QDialog.restoreModsQDialog import SelectRestore
+from src.backupStore import BackupStore
+
+def test_dialog(qtbot: QtBot) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zipPath: str = os.path.join(tmp_dir, 'backup.zip')
+
+        with zipfile.ZipFile(zipPath, 'w') as archive:
+            archive.writestr('mods/b mod/mod.txt', 'mod')
+            archive.writestr('assets/mod_overrides/a mod/skin.texture', 'texture')
+
+        widget = SelectRestore(zipPath)
+        qtbot.addWidget(widget)
+
+    assert widget.modList.topLevelItemCount() == 2
+    assert widget.modList.topLevelItem(0).text(1) == 'assets/mod_overrides'
+
+    widget.searchBar.setText('b ')
+    assert widget.modList.topLevelItem(0).isHidden()
+
+    widget.modList.topLevelItem(1).setSelected(True)
+    widget.buttonBox.accepted.emit()
+
+    assert widget.mods == ['b mod']
+    assert widget.result() == 1
+
+def test_manifest(qtbot: QtBot) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = BackupStore(os.path.join(tmp_dir, 'store'))
+        name: str = store.saveManifest({'a map' : {'type' : 'maps', 'enabled' : True, 'folders' : [''], 'files' : {'map.xml' : [1024, 0, []]}}})
+
+        widget = SelectRestore(os.path.join(store.manifestsPath, name))
+        qtbot.addWidget(widget)
+
+    assert widget.modList.topLevelItemCount() == 1
+    assert widget.modList.topLevelItem(0).text(0) == 'a map'
+    assert widget.modList.topLevelItem(0).text(1) == 'Maps'
@@ -1,15 +1,17 @@
 import tempfile
 import os
+import json
+import shutil
 from typing import Generator
 
-from PySide6.QtWidgets import QTableWidgetItem
 import pytest
 from pytestqt.qtbot import QtBot
 
-from PySide6.QtCore import Qt as qt
+from PySide6.QtCore import Qt as qt, QModelIndex
 
 from src.widgets.managerQTableWidget import ModListWidget
-from src.constant_vars import ModType, ModRole
+from src.widgets.modTableModel import ModTableModel, ModItem
+from src.constant_vars import ModType, ModRole, ModCount
 
 MODS = (('mod1', ModType.mods, True, '2.3.0', ['cool']),
         ('mod2', ModType.mods_override, True, 'None', ['calm', 'cool']),
@@ -30,10 +32,10 @@ def create_QTable(createTemp_Config_ini: str, createTemp_Mod_ini: str) -> Genera
 def test_addMods(create_QTable: ModListWidget) -> None:
 
     assert create_QTable.rowCount() == 3
-    assert create_QTable.getEnabledItem(2).text() == 'Disabled'
-    assert create_QTable.getNameItem(0).text() == 'mod1'
-    assert create_QTable.getTypeItem(0).text() == 'mods'
-    assert create_QTable.getVersionItem(1).text() == '1.0.0'
+    assert create_QTable.getEnabledItem(2).data() == 'Disabled'
+    assert create_QTable.getNameItem(0).data() == 'mod1'
+    assert create_QTable.getTypeItem(0).data() == 'mods'
+    assert create_QTable.getVersionItem(1).data() == '1.0.0'
     assert create_QTable.getNameItem(0).data(ModRole.tags) == ('cool',)
     assert create_QTable.getNameItem(2).data(ModRole.tags) == ()
 
@@ -52,17 +54,96 @@ def test_sort(create_QTable: ModListWidget) -> None:
 def test_getSelectedNameItems(create_QTable: ModListWidget) -> None:
 
     create_QTable.selectAll()
-    allNameItems: list[QTableWidgetItem] = create_QTable.getSelectedNameItems()
+    allNameItems: list[QModelIndex] = create_QTable.getSelectedNameItems()
     assert len(allNameItems) == 3
 
     names: tuple[str, str, str] = (MODS[0][0], MODS[1][0], MODS[2][0])
 
     for item in allNameItems:
-        assert item.text() in names
+        assert item.data() in names
+
+    create_QTable.clearSelection()
 
 def test_getModTypeCount(create_QTable: ModListWidget) -> None:
     assert create_QTable.getModTypeCount(ModType.mods) == 1
 
+def test_counts() -> None:
+
+    model = ModTableModel()
+    changes: list[tuple[str, int]] = []
+    model.countChanged.connect(lambda x, y: changes.append((x, y)))
+
+    model.setMods([ModItem('mod1', ModType.mods, size=10), ModItem('mod2', ModType.maps, False, size=5)], ['mod3'])
+    assert model.counts[ModCount.total] == 2
+    assert model.counts[ModCount.disabled] == 1
+    assert model.counts[ModCount.ignored] == 1
+    assert model.counts[ModCount.size] == 15
+
+    changes.clear()
+    model.setEnabled('mod2', True)
+    assert sorted(changes) == [(ModCount.disabled, 0), (ModCount.enabled, 2)]
+
+    model.setType('mod1', ModType.maps)
+    assert model.typeCount(ModType.maps) == 2
+    assert model.typeCount(ModType.mods) == 0
+
+    model.ignoreMod('mod1')
+    model.removeMod('mod3')
+    assert model.counts[ModCount.total] == 1
+    assert model.counts[ModCount.ignored] == 1
+    assert model.counts[ModCount.size] == 5
+
+def test_removeMod() -> None:
+
+    model = ModTableModel()
+    model.setMods([ModItem(f'mod{x}', ModType.mods) for x in range(6)])
+
+    model.removeMod('mod1')
+    model.removeMod('mod4')
+    model.addMod(ModItem('mod6', ModType.maps))
+    model.removeMod('mod0')
+
+    assert [x.name for x in model.mods] == ['mod2', 'mod3', 'mod5', 'mod6']
+    assert [model.findRow(x.name) for x in model.mods] == [0, 1, 2, 3]
+    assert model.findRow('mod4') is None
+
+    model.setType('mod5', ModType.maps)
+    assert model.getMod('mod5').type == ModType.maps
+    assert model.typeCount(ModType.maps) == 2
+
+def test_search(create_QTable: ModListWidget) -> None:
+
+    # Tags are searched in the save
+    for name, type, _enabled, _version, tags in MODS:
+        create_QTable.saveManager.addMods(([name], type))
+
+        if tags:
+            create_QTable.saveManager.setTags(tags, name)
+
+    create_QTable.search('mod*')
+    assert create_QTable.proxy.rowCount() == 3
+
+    create_QTable.search('mod1')
+    assert create_QTable.proxy.rowCount() == 1
+    assert create_QTable.getNameItem(0).data() == 'mod1'
+
+    create_QTable.search('tag:cool')
+    assert create_QTable.proxy.rowCount() == 2
+
+    create_QTable.search('tag:calm,cool mod')
+    assert create_QTable.proxy.rowCount() == 1
+    assert create_QTable.findModRow('mod1') is None
+
+    create_QTable.search('tag:cool')
+    create_QTable.saveManager.setTags(['cool'], 'mod3')
+    create_QTable.updateTags('mod3', ('cool', ))
+    assert create_QTable.proxy.rowCount() == 3
+
+    create_QTable.search('')
+    assert create_QTable.proxy.rowCount() == create_QTable.rowCount()
+
+    create_QTable.saveManager.removeMods(*[x[0] for x in MODS])
+
 def test_Icon(create_QTable: ModListWidget, create_mod_dirs: str) -> None:
 
     with tempfile.TemporaryDirectory(dir=os.path.join(create_mod_dirs, 'mods')) as tmp_mod:
@@ -73,9 +154,9 @@ def test_Icon(create_QTable: ModListWidget, create_mod_dirs: str) -> None:
         create_QTable.saveManager.setModWorkshopAssetID(tmp_mod_name[0], '1234')
 
         create_QTable.refreshMods()
-        tmp_mod_item: QTableWidgetItem = create_QTable.findItems(tmp_mod_name[0], qt.MatchFlag.MatchExactly)[0]
+        tmp_mod_item: QModelIndex = create_QTable.getNameItem(create_QTable.findModRow(tmp_mod_name[0]))
 
-        assert tmp_mod_item.icon().isNull() is False
+        assert tmp_mod_item.data(qt.ItemDataRole.DecorationRole) is not None
 
 #TODO: Test installMods()
 @pytest.mark.skip
@@ -89,3 +170,56 @@ def test_widget(qtbot: QtBot, create_QTable: ModListWidget) -> None:
     assert create_QTable.columnCount() == 4
     assert create_QTable.verticalHeader().isHidden() is True
     
+
+def test_watcher(create_QTable: ModListWidget, create_mod_dirs: str) -> None:
+
+    create_QTable.refreshMods()
+    rowCount: int = create_QTable.rowCount()
+
+    modPath: str = os.path.join(create_mod_dirs, 'mods', 'watched mod')
+    os.mkdir(modPath)
+    create_QTable.watcher.sync(True)
+
+    assert create_QTable.rowCount() == rowCount + 1
+    assert create_QTable.findModRow('watched mod') is not None
+    assert create_QTable.saveManager.getType('watched mod') == ModType.mods
+
+    os.rename(modPath, os.path.join(create_mod_dirs, 'disabledMods', 'watched mod'))
+    create_QTable.watcher.sync(True)
+
+    row: int = create_QTable.findModRow('watched mod')
+    assert create_QTable.getEnabledItem(row).data() == 'Disabled'
+    assert not create_QTable.saveManager.getEnabled('watched mod')
+
+    os.rmdir(os.path.join(create_mod_dirs, 'disabledMods', 'watched mod'))
+    create_QTable.watcher.sync(True)
+
+    assert create_QTable.findModRow('watched mod') is None
+    assert create_QTable.rowCount() == rowCount
+
+def test_watcherRenamed(create_QTable: ModListWidget, create_mod_dirs: str) -> None:
+
+    create_QTable.refreshMods()
+
+    modPath: str = os.path.join(create_mod_dirs, 'mods', 'old version')
+    os.mkdir(modPath)
+    create_QTable.watcher.sync(True)
+    create_QTable.saveManager.setTags(['kept'], 'old version')
+
+    # The folder is renamed when a newer version is installed over it
+    os.rename(modPath, os.path.join(create_mod_dirs, 'mods', 'new version'))
+
+    with open(os.path.join(create_mod_dirs, 'mods', 'new version', 'mod.txt'), 'w') as f:
+        json.dump({'name' : 'new version', 'version' : '2.0.0'}, f, indent=4)
+
+    create_QTable.watcher.sync(True)
+
+    row: int = create_QTable.findModRow('new version')
+    assert create_QTable.findModRow('old version') is None
+    assert create_QTable.getVersionItem(row).data() == '2.0.0'
+    assert create_QTable.saveManager.getTags('new version') == ['kept']
+
+    shutil.rmtree(os.path.join(create_mod_dirs, 'mods', 'new version'))
+    create_QTable.watcher.sync(True)
+
+    assert create_QTable.findModRow('new version') is None
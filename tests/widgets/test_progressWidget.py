@@ -37,8 +37,24 @@ def test_cancel(create_progressWidget: ProgressWidget) -> None:
 
     assert create_progressWidget.result() == 0
 
-def test_updateProgressBar(create_progressWidget: ProgressWidget) -> None:
+def test_pollProgress(create_progressWidget: ProgressWidget) -> None:
 
-    create_progressWidget.updateProgressBar(51, 'testing ^_^')
-    assert create_progressWidget.progressBar.value() == 50
-    assert create_progressWidget.infoLabel.text() == 'testing ^_^'
\ No newline at end of file
+    progress = create_progressWidget.mode.progress
+
+    progress.setTotal(4)
+    for i in range(3):
+        progress.advance(1, f'step {i}')
+
+    # Only the latest step is shown
+    create_progressWidget.pollProgress()
+    assert create_progressWidget.progressBar.maximum() == 4
+    assert create_progressWidget.progressBar.value() == 3
+    assert create_progressWidget.infoLabel.text() == 'step 2'
+
+    progress.addTotal(2)
+    progress.advance(2)
+
+    create_progressWidget.pollProgress()
+    assert create_progressWidget.progressBar.maximum() == 6
+    assert create_progressWidget.progressBar.value() == 5
+    assert create_progressWidget.infoLabel.text() == 'step 2'